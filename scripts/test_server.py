@@ -2,44 +2,54 @@
 """Simple test client for the poker server."""
 
 import asyncio
-import json
 import httpx
+import orjson
 import websockets
 
 
+# Shared pooled client - reuses keep-alive connections across all HTTP probes
+# instead of paying a fresh TCP handshake per request.
+CLIENT = httpx.AsyncClient(
+    base_url="http://localhost:8000",
+    limits=httpx.Limits(
+        max_keepalive_connections=20,
+        max_connections=100,
+        keepalive_expiry=30.0,
+    ),
+    timeout=30.0,
+)
+
+
 async def test_health():
     """Test health endpoint."""
-    async with httpx.AsyncClient() as client:
-        response = await client.get("http://localhost:8000/api/health")
-        print(f"Health check: {response.json()}")
-        return response.status_code == 200
+    response = await CLIENT.get("/api/health")
+    print(f"Health check: {response.json()}")
+    return response.status_code == 200
 
 
 async def test_models():
     """Test models endpoint."""
-    async with httpx.AsyncClient() as client:
-        response = await client.get("http://localhost:8000/api/models")
-        print(f"Available models: {response.json()}")
+    response = await CLIENT.get("/api/models")
+    print(f"Available models: {response.json()}")
 
 
 async def test_create_session():
     """Test session creation."""
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            "http://localhost:8000/api/sessions",
-            json={
-                "opponents": [
-                    {"name": "AI-1", "model": "qwen3:4b"},
-                ],
-                "starting_stack": 1000,
-                "small_blind": 10,
-                "big_blind": 20,
-                "num_hands": 1,
-                "turn_timeout_seconds": 30,
-            },
-        )
-        print(f"Session created: {response.json()}")
-        return response.json()
+    response = await CLIENT.post(
+        "/api/sessions",
+        json={
+            "opponents": [
+                {"name": "AI-1", "model": "qwen3:4b"},
+            ],
+            "starting_stack": 1000,
+            "small_blind": 10,
+            "big_blind": 20,
+            "num_hands": 1,
+            "turn_timeout_seconds": 30,
+        },
+    )
+    print(f"Session created: {response.json()}")
+    return response.json()
 
 
 async def test_websocket(session_id: str):
@@ -56,7 +66,7 @@ async def test_websocket(session_id: str):
         while event_count < max_events:
             try:
                 message = await asyncio.wait_for(ws.recv(), timeout=60.0)
-                data = json.loads(message)
+                data = orjson.loads(message)
                 event_type = data.get("type", "unknown")
 
                 print(f"\n[{event_type}]")
@@ -73,10 +83,10 @@ async def test_websocket(session_id: str):
                 elif event_type == "your_turn":
                     print(f"  Available actions: {data.get('available_actions')}")
                     # Auto-call for testing
-                    await ws.send(json.dumps({
+                    await ws.send(orjson.dumps({
                         "type": "player_action",
                         "action_type": "call",
-                    }))
+                    }).decode())
                     print("  -> Sent: call")
 
                 elif event_type == "thinking_start":
@@ -127,31 +137,34 @@ async def main():
     print("Poker Server Test Client")
     print("=" * 60)
 
-    # Test health
-    print("\n1. Testing health endpoint...")
-    if not await test_health():
-        print("Server not running. Start with: python -m server.main")
-        return
-
-    # Test models
-    print("\n2. Testing models endpoint...")
-    await test_models()
-
-    # Create session
-    print("\n3. Creating session...")
-    session = await test_create_session()
-    session_id = session.get("session_id")
-
-    if not session_id:
-        print("Failed to create session")
-        return
-
-    # Test WebSocket
-    print("\n4. Testing WebSocket game flow...")
-    await test_websocket(session_id)
-
-    print("\n" + "=" * 60)
-    print("Tests complete!")
+    try:
+        # Test health
+        print("\n1. Testing health endpoint...")
+        if not await test_health():
+            print("Server not running. Start with: python -m server.main")
+            return
+
+        # Test models
+        print("\n2. Testing models endpoint...")
+        await test_models()
+
+        # Create session
+        print("\n3. Creating session...")
+        session = await test_create_session()
+        session_id = session.get("session_id")
+
+        if not session_id:
+            print("Failed to create session")
+            return
+
+        # Test WebSocket
+        print("\n4. Testing WebSocket game flow...")
+        await test_websocket(session_id)
+
+        print("\n" + "=" * 60)
+        print("Tests complete!")
+    finally:
+        await CLIENT.aclose()
 
 
 if __name__ == "__main__":
@@ -1,7 +1,9 @@
 """REST API routes."""
 
 import asyncio
-from fastapi import APIRouter, HTTPException
+import time
+
+from fastapi import APIRouter, Depends, HTTPException, Request
 
 from ..config import settings
 from ..models.api import (
@@ -19,24 +21,28 @@ from ..streaming import OllamaStreamingClient
 
 router = APIRouter()
 
-# Global session manager (will be initialized in main.py)
-session_manager: GameSessionManager = None
-ollama_client: OllamaStreamingClient = None
+# Health probes arrive in bursts (load balancers, uptime checks); cache the
+# Ollama round-trip briefly so each probe doesn't pay a network hop.
+OLLAMA_CHECK_TTL = 2.0
+_last_ollama_check: tuple[float, bool] = (0.0, False)
+
+
+def get_session_manager(request: Request) -> GameSessionManager:
+    """Resolve the session manager initialized at startup."""
+    return request.app.state.session_manager
 
 
-def init_dependencies(sm: GameSessionManager, oc: OllamaStreamingClient):
-    """Initialize route dependencies."""
-    global session_manager, ollama_client
-    session_manager = sm
-    ollama_client = oc
+def get_ollama_client(request: Request) -> OllamaStreamingClient:
+    """Resolve the Ollama client initialized at startup."""
+    return request.app.state.ollama_client
 
 
 @router.post("/sessions", response_model=SessionResponse)
-async def create_session(request: SessionConfigRequest):
+async def create_session(
+    request: SessionConfigRequest,
+    session_manager: GameSessionManager = Depends(get_session_manager),
+):
     """Create a new game session."""
-    if session_manager is None:
-        raise HTTPException(status_code=500, detail="Server not initialized")
-
     if len(request.opponents) < 1 or len(request.opponents) > 5:
         raise HTTPException(status_code=400, detail="Must have 1-5 opponents")
 
@@ -51,13 +57,10 @@ async def create_session(request: SessionConfigRequest):
     session = await session_manager.create_session(request.opponents, config)
 
     # Build player info
-    players = [
-        PlayerInfo(id=0, name="You", player_type="human"),
+    players = [PlayerInfo(id=0, name="You", player_type="human")] + [
+        PlayerInfo(id=i + 1, name=opp.name, player_type="llm", model=opp.model)
+        for i, opp in enumerate(request.opponents)
     ]
-    for i, opp in enumerate(request.opponents):
-        players.append(
-            PlayerInfo(id=i + 1, name=opp.name, player_type="llm", model=opp.model)
-        )
 
     return SessionResponse(
         session_id=session.session_id,
@@ -67,11 +70,11 @@ async def create_session(request: SessionConfigRequest):
 
 
 @router.get("/sessions/{session_id}", response_model=SessionStatusResponse)
-async def get_session(session_id: str):
+async def get_session(
+    session_id: str,
+    session_manager: GameSessionManager = Depends(get_session_manager),
+):
     """Get current session status."""
-    if session_manager is None:
-        raise HTTPException(status_code=500, detail="Server not initialized")
-
     session = await session_manager.get_session(session_id)
     if session is None:
         raise HTTPException(status_code=404, detail="Session not found")
@@ -85,11 +88,11 @@ async def get_session(session_id: str):
 
 
 @router.delete("/sessions/{session_id}")
-async def delete_session(session_id: str):
+async def delete_session(
+    session_id: str,
+    session_manager: GameSessionManager = Depends(get_session_manager),
+):
     """End and cleanup a session."""
-    if session_manager is None:
-        raise HTTPException(status_code=500, detail="Server not initialized")
-
     session = await session_manager.get_session(session_id)
     if session is None:
         raise HTTPException(status_code=404, detail="Session not found")
@@ -99,11 +102,10 @@ async def delete_session(session_id: str):
 
 
 @router.get("/models", response_model=ModelsResponse)
-async def list_models():
+async def list_models(
+    ollama_client: OllamaStreamingClient = Depends(get_ollama_client),
+):
     """List available Ollama models."""
-    if ollama_client is None:
-        raise HTTPException(status_code=500, detail="Server not initialized")
-
     models = await ollama_client.list_models()
     return ModelsResponse(
         models=[
@@ -117,16 +119,21 @@ async def list_models():
 
 
 @router.get("/health", response_model=HealthResponse)
-async def health_check():
+async def health_check(
+    session_manager: GameSessionManager = Depends(get_session_manager),
+    ollama_client: OllamaStreamingClient = Depends(get_ollama_client),
+):
     """Health check endpoint."""
-    ollama_connected = False
-    if ollama_client:
-        ollama_connected = await ollama_client.check_connection()
+    global _last_ollama_check
 
-    active_sessions = session_manager.active_session_count if session_manager else 0
+    now = time.monotonic()
+    checked_at, ollama_connected = _last_ollama_check
+    if now - checked_at >= OLLAMA_CHECK_TTL:
+        ollama_connected = await ollama_client.check_connection()
+        _last_ollama_check = (now, ollama_connected)
 
     return HealthResponse(
         status="healthy",
         ollama_connected=ollama_connected,
-        active_sessions=active_sessions,
+        active_sessions=session_manager.active_session_count,
     )
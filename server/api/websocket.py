@@ -1,13 +1,22 @@
 """WebSocket endpoint handler."""
 
 import asyncio
-import json
+
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
 
 from ..game import GameSessionManager
 from ..models.events import ErrorEvent
 
 
+# Constant frames are encoded once at import instead of per occurrence.
+# Text frames so browser clients can JSON.parse them directly.
+PONG = orjson.dumps({"type": "pong"}).decode()
+INVALID_JSON = orjson.dumps(
+    ErrorEvent(code="invalid_json", message="Invalid JSON message").model_dump()
+).decode()
+
+
 async def websocket_endpoint(
     websocket: WebSocket,
     session_id: str,
@@ -32,10 +41,8 @@ async def websocket_endpoint(
     try:
         while True:
             # Receive message from client
-            data = await websocket.receive_text()
-
             try:
-                message = json.loads(data)
+                message = orjson.loads(await websocket.receive_text())
                 msg_type = message.get("type")
 
                 if msg_type == "player_action":
@@ -47,7 +54,7 @@ async def websocket_endpoint(
                 elif msg_type == "start_hand":
                     # Request to start next hand (if waiting)
                     if session.status == "waiting":
-                        asyncio.create_task(session.start_session())
+                        session.ensure_started()
 
                 elif msg_type == "end_session":
                     # Request to end session
@@ -56,13 +63,10 @@ async def websocket_endpoint(
 
                 elif msg_type == "ping":
                     # Keep-alive - send pong
-                    await websocket.send_text(json.dumps({"type": "pong"}))
+                    await websocket.send_text(PONG)
 
-            except json.JSONDecodeError:
-                await session.ws_manager.send_event(
-                    websocket,
-                    ErrorEvent(code="invalid_json", message="Invalid JSON message"),
-                )
+            except orjson.JSONDecodeError:
+                await session.ws_manager.send_raw(websocket, INVALID_JSON)
 
     except WebSocketDisconnect:
         pass
@@ -14,6 +14,18 @@ class Settings(BaseSettings):
     # Ollama
     ollama_endpoint: str = "http://localhost:11434"
     ollama_timeout: float = 120.0
+    # Generation caps: prompts are ~100 tokens and only the <action> tag
+    # matters, so bound the context window and stop decoding as soon as
+    # the closing tag is emitted
+    ollama_num_ctx: int = 2048
+    ollama_stop: list[str] = ["</action>"]
+    # Concurrent requests allowed to the backend; Ollama batches these
+    # itself when OLLAMA_NUM_PARALLEL permits
+    ollama_max_concurrency: int = 4
+
+    # Token streaming: the batcher adapts its batch size to hold roughly
+    # one WebSocket frame per target_frame_ms at the observed token rate
+    token_target_frame_ms: float = 20.0
 
     # Game defaults
     default_starting_stack: int = 10000
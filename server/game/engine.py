@@ -3,6 +3,7 @@
 import random
 from typing import Optional
 
+import numpy as np
 from pokerkit import NoLimitTexasHoldem, Automation
 
 from ..models.game import (
@@ -20,25 +21,69 @@ from ..models.game import (
 class PokerEngine:
     """Wrapper around PokerKit for game state management."""
 
+    __slots__ = (
+        "config",
+        "num_players",
+        "stacks",
+        "button",
+        "hand_number",
+        "_state",
+        "_hole_cards",
+        "_hole_card_models",
+        "_board",
+        "_board_models",
+        "_card_repr",
+        "_has_min_raise_attr",
+        "_has_total_pot",
+        "_positions",
+    )
+
     def __init__(self, config: GameConfig, num_players: int):
         self.config = config
         self.num_players = num_players
-        self.stacks = [config.starting_stack] * num_players
+        self.stacks = np.full(num_players, config.starting_stack, dtype=np.int64)
         self.button = 0
         self.hand_number = 0
 
         # Current hand state
         self._state = None
         self._hole_cards: list[tuple[str, str]] = []
+        self._hole_card_models: list[tuple[Card, Card]] = []
         self._board: list[str] = []
+        self._board_models: list[Card] = []
+
+        # Memoized short-format strings for pokerkit Card objects. The card
+        # universe is tiny and immutable, so repr() only ever runs once per card.
+        self._card_repr: dict = {}
+
+        # Whether the pokerkit state exposes min-raise/pot info; resolved once
+        # on the first hand instead of a getattr/hasattr walk per call
+        self._has_min_raise_attr: Optional[bool] = None
+        self._has_total_pot: Optional[bool] = None
+
+        # Position names are fixed for the table size; build the table once
+        # instead of per get_position_name call.
+        self._positions = {
+            2: ["SB", "BB"],
+            3: ["BTN", "SB", "BB"],
+            4: ["BTN", "CO", "SB", "BB"],
+        }.get(num_players, ["BTN", "CO", "HJ", "LJ", "SB", "BB"][:num_players])
+
+    def _card_str(self, card) -> str:
+        """Short card string like 'As', memoized per pokerkit Card."""
+        s = self._card_repr.get(card)
+        if s is None:
+            s = self._card_repr[card] = repr(card)
+        return s
 
     def start_hand(self) -> bool:
         """Start a new hand. Returns False if hand cannot be started."""
         self.hand_number += 1
         self.button = (self.button + 1) % self.num_players
 
-        # Check if we can start
-        active_players = sum(1 for s in self.stacks if s > 0)
+        # Check if we can start (asarray keeps plain-list assignment working)
+        stacks = np.asarray(self.stacks)
+        active_players = int((stacks > 0).sum())
         if active_players < 2:
             return False
 
@@ -60,22 +105,32 @@ class PokerEngine:
                 raw_antes={-1: 0},
                 raw_blinds_or_straddles=(self.config.small_blind, self.config.big_blind),
                 min_bet=self.config.big_blind,
-                raw_starting_stacks=self.stacks.copy(),
+                raw_starting_stacks=stacks.tolist(),
                 player_count=self.num_players,
             )
         except Exception:
             return False
 
+        if self._has_min_raise_attr is None:
+            self._has_min_raise_attr = hasattr(
+                self._state, "min_completion_betting_or_raising_to_amount"
+            )
+            self._has_total_pot = hasattr(self._state, "total_pot_amount")
+
         # Get hole cards - use repr() for short format like "As", not str() which gives "ACE OF SPADES (As)"
         self._hole_cards = []
+        self._hole_card_models = []
         for i in range(self.num_players):
             cards = self._state.hole_cards[i]
             if cards and len(cards) >= 2:
-                self._hole_cards.append((repr(cards[0]), repr(cards[1])))
+                c1, c2 = self._card_str(cards[0]), self._card_str(cards[1])
+                self._hole_cards.append((c1, c2))
+                self._hole_card_models.append((Card.from_string(c1), Card.from_string(c2)))
             else:
                 raise RuntimeError(f"Failed to deal hole cards for player {i}")
 
         self._board = []
+        self._board_models = []
 
         return True
 
@@ -89,9 +144,10 @@ class PokerEngine:
             return None
 
         # Update board from state (cards are dealt automatically by PokerKit)
-        state_board = [repr(c) for c in self._state.board_cards]
+        state_board = [self._card_str(c) for c in self._state.board_cards]
         prev_count = len(self._board)
         self._board = state_board
+        self._board_models.extend(Card.from_string(s) for s in state_board[prev_count:])
 
         current_street = self.get_street()
 
@@ -109,20 +165,37 @@ class PokerEngine:
         if self._state is None:
             return False
 
+        # Validate against available actions up front so the common LLM
+        # misparses (off-bound raise amounts) branch to check/call directly
+        # instead of round-tripping through a pokerkit exception.
+        available = self.get_available_actions()
+
         try:
             if action.action_type == ActionType.FOLD:
                 self._state.fold()
             elif action.action_type in (ActionType.CHECK, ActionType.CALL):
                 self._state.check_or_call()
             elif action.action_type == ActionType.RAISE:
-                self._state.complete_bet_or_raise_to(action.amount)
+                amount = action.amount
+                if (
+                    available is not None
+                    and available.can_raise
+                    and amount is not None
+                    and available.min_raise <= amount <= available.max_raise
+                ):
+                    self._state.complete_bet_or_raise_to(amount)
+                else:
+                    self._state.check_or_call()
             elif action.action_type == ActionType.ALL_IN:
                 actor = self._state.actor_index
                 stack = self._state.stacks[actor] + self._state.bets[actor]
-                self._state.complete_bet_or_raise_to(stack)
+                if available is not None and available.can_raise:
+                    self._state.complete_bet_or_raise_to(stack)
+                else:
+                    self._state.check_or_call()
             return True
         except Exception:
-            # Fallback chain
+            # Belt-and-braces: pokerkit rejected what looked legal
             try:
                 self._state.check_or_call()
                 return True
@@ -149,42 +222,46 @@ class PokerEngine:
             return Street.RIVER
         return Street.PREFLOP
 
+    def snapshot(self) -> tuple[bool, Optional[int], bool]:
+        """One-pass read of (hand active, actor index, needs board cards)."""
+        st = self._state
+        if st is None:
+            return False, None, False
+        active = bool(st.status)
+        actor = st.actor_index
+        return active, actor, active and actor is None
+
     def get_actor(self) -> Optional[int]:
         """Get current actor index, or None if no action needed."""
-        if self._state is None:
-            return None
-        return self._state.actor_index
+        return self.snapshot()[1]
 
     def is_hand_complete(self) -> bool:
         """Check if hand is complete."""
-        if self._state is None:
-            return True
-        return not self._state.status
+        return not self.snapshot()[0]
 
     def needs_cards(self) -> bool:
         """Check if we need to deal more community cards."""
-        if self._state is None or not self._state.status:
-            return False
-
         # If no actor but hand is still active, we need cards
-        if self._state.actor_index is None and self._state.status:
-            return True
-        return False
+        return self.snapshot()[2]
 
     def get_available_actions(self) -> Optional[AvailableActions]:
         """Get available actions for current actor."""
         if self._state is None or self._state.actor_index is None:
             return None
 
-        actor = self._state.actor_index
-        current_bet = max(self._state.bets) if self._state.bets else 0
-        player_bet = self._state.bets[actor] if self._state.bets else 0
+        st = self._state
+        actor = st.actor_index
+        bets = st.bets
+        current_bet = max(bets) if bets else 0
+        player_bet = bets[actor] if bets else 0
         to_call = current_bet - player_bet
-        stack = self._state.stacks[actor]
+        stack = st.stacks[actor]
 
         can_check = to_call == 0
-        min_raise_attr = getattr(
-            self._state, "min_completion_betting_or_raising_to_amount", None
+        min_raise_attr = (
+            st.min_completion_betting_or_raising_to_amount
+            if self._has_min_raise_attr
+            else None
         )
         min_raise = (
             min_raise_attr
@@ -209,15 +286,16 @@ class PokerEngine:
             return self._hole_cards[player_idx]
         return ("??", "??")
 
-    def get_board(self) -> list[str]:
-        """Get community cards."""
-        return self._board.copy()
+    def get_board(self) -> tuple[str, ...]:
+        """Get community cards as a read-only view."""
+        return tuple(self._board)
 
     def get_pot(self) -> int:
         """Get current pot size."""
-        if self._state is None:
+        st = self._state
+        if st is None or not self._has_total_pot:
             return 0
-        return self._state.total_pot_amount if hasattr(self._state, "total_pot_amount") else 0
+        return st.total_pot_amount
 
     def get_player_bet(self, player_idx: int) -> int:
         """Get a player's current bet."""
@@ -230,7 +308,7 @@ class PokerEngine:
     def get_player_stack(self, player_idx: int) -> int:
         """Get a player's current stack."""
         if self._state is None:
-            return self.stacks[player_idx] if 0 <= player_idx < len(self.stacks) else 0
+            return int(self.stacks[player_idx]) if 0 <= player_idx < len(self.stacks) else 0
         if 0 <= player_idx < len(self._state.stacks):
             return self._state.stacks[player_idx]
         return 0
@@ -241,8 +319,7 @@ class PokerEngine:
             return {"winners": [], "amounts": [], "revealed_cards": {}}
 
         # Update stacks
-        for i in range(self.num_players):
-            self.stacks[i] = self._state.stacks[i]
+        self.stacks[:] = self._state.stacks[: self.num_players]
 
         # For now, simple winner detection
         # In a real implementation, we'd track the actual winners from PokerKit
@@ -256,22 +333,8 @@ class PokerEngine:
 
     def get_position_name(self, player_idx: int) -> str:
         """Get position name for a player."""
-        positions_2 = ["SB", "BB"]
-        positions_3 = ["BTN", "SB", "BB"]
-        positions_4 = ["BTN", "CO", "SB", "BB"]
-        positions_6 = ["BTN", "CO", "HJ", "LJ", "SB", "BB"]
-
-        if self.num_players == 2:
-            positions = positions_2
-        elif self.num_players == 3:
-            positions = positions_3
-        elif self.num_players <= 4:
-            positions = positions_4
-        else:
-            positions = positions_6[: self.num_players]
-
         rel_pos = (player_idx - self.button) % self.num_players
-        return positions[rel_pos] if rel_pos < len(positions) else f"P{player_idx}"
+        return self._positions[rel_pos] if rel_pos < len(self._positions) else f"P{player_idx}"
 
     def build_game_state(
         self,
@@ -279,23 +342,30 @@ class PokerEngine:
         players: list[PlayerState],
     ) -> GameState:
         """Build complete game state for client."""
+        # Snapshot engine state once instead of re-checking it per player
+        st = self._state
+        stacks = st.stacks if st is not None else [int(s) for s in self.stacks]
+        bets = st.bets if (st is not None and st.bets) else [0] * self.num_players
+        hole_cards = self._hole_card_models
+
         # Update player states with current info
         for i, player in enumerate(players):
-            player.stack = self.get_player_stack(i)
-            player.current_bet = self.get_player_bet(i)
-            if player.player_type == "human" and i < len(self._hole_cards):
-                c1, c2 = self._hole_cards[i]
-                player.hole_cards = [Card.from_string(c1), Card.from_string(c2)]
-            player.is_active = self.stacks[i] > 0
+            player.stack = stacks[i]
+            player.current_bet = bets[i]
+            if player.player_type == "human" and i < len(hole_cards):
+                player.hole_cards = list(hole_cards[i])
+            player.is_active = bool(self.stacks[i] > 0)
+
+        actor = self.get_actor()
 
         return GameState(
             session_id=session_id,
             hand_number=self.hand_number,
             street=self.get_street(),
             pot=self.get_pot(),
-            community_cards=[Card.from_string(c) for c in self._board],
+            community_cards=list(self._board_models),
             button_position=self.button,
-            current_actor=self.get_actor(),
+            current_actor=actor,
             players=players,
-            available_actions=self.get_available_actions() if self.get_actor() == 0 else None,
+            available_actions=self.get_available_actions() if actor == 0 else None,
         )
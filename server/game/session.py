@@ -1,11 +1,15 @@
 """Game session management."""
 
 import asyncio
+import logging
 import re
 import time
 import uuid
 from typing import Optional
 
+import orjson
+
+
 from ..config import settings
 from ..models.game import (
     Card,
@@ -22,10 +26,8 @@ from ..models.events import (
     GameStateUpdateEvent,
     YourTurnEvent,
     ThinkingStartEvent,
-    ThinkingTokenEvent,
     ThinkingCompleteEvent,
     TimerStartEvent,
-    TimerTickEvent,
     TimerExpiredEvent,
     HandCompleteEvent,
     SessionCompleteEvent,
@@ -33,17 +35,26 @@ from ..models.events import (
 )
 from ..models.api import OpponentConfig
 from ..websocket_manager import WebSocketManager
-from ..streaming import OllamaStreamingClient, TokenBatcher
+from ..streaming import InferenceWorker, OllamaStreamingClient, TokenBatcher
 from .engine import PokerEngine
-from .timer import TurnTimer
+
+
+logger = logging.getLogger(__name__)
 
 
 # Action parsing regex (from original codebase)
 RE_ACTION_TAG = re.compile(r"<action>\s*(.+?)\s*</action>", re.IGNORECASE | re.DOTALL)
-RE_FOLD = re.compile(r"\b(f|fold)\b", re.IGNORECASE)
-RE_CC = re.compile(r"\b(cc|call|check)\b", re.IGNORECASE)
-RE_CBR = re.compile(r"\b(?:cbr|bet|raise)\s*(\d+)", re.IGNORECASE)
-RE_ALL_IN = re.compile(r"\b(?:all.?in|allin|shove)\b", re.IGNORECASE)
+# All keywords merged into one alternation so the (possibly long) response is
+# scanned once instead of four times; priority between kinds is resolved after
+# the scan (all-in > fold > check/call > raise), matching the old sequential
+# searches.
+RE_KEYWORDS = re.compile(
+    r"(?P<allin>\b(?:all.?in|allin|shove)\b)"
+    r"|(?P<fold>\b(?:f|fold)\b)"
+    r"|(?P<cc>\b(?:cc|call|check)\b)"
+    r"|\b(?:cbr|bet|raise)\s*(?P<amount>\d+)",
+    re.IGNORECASE,
+)
 
 
 def parse_action(response: str, can_check: bool, stack: int) -> ParsedAction:
@@ -51,16 +62,26 @@ def parse_action(response: str, can_check: bool, stack: int) -> ParsedAction:
     match = RE_ACTION_TAG.search(response)
     text = match.group(1).strip() if match else response
 
-    if RE_ALL_IN.search(text):
-        return ParsedAction(action_type=ActionType.ALL_IN, amount=stack)
-    if RE_FOLD.search(text):
+    fold_seen = False
+    cc_seen = False
+    raise_amount = None
+    for m in RE_KEYWORDS.finditer(text):
+        kind = m.lastgroup
+        if kind == "allin":
+            return ParsedAction(action_type=ActionType.ALL_IN, amount=stack)
+        if kind == "fold":
+            fold_seen = True
+        elif kind == "cc":
+            cc_seen = True
+        elif kind == "amount" and raise_amount is None:
+            raise_amount = int(m.group("amount"))
+
+    if fold_seen:
         return ParsedAction(action_type=ActionType.FOLD)
-    if RE_CC.search(text):
+    if cc_seen:
         return ParsedAction(action_type=ActionType.CHECK if can_check else ActionType.CALL)
-
-    match = RE_CBR.search(text)
-    if match:
-        return ParsedAction(action_type=ActionType.RAISE, amount=int(match.group(1)))
+    if raise_amount is not None:
+        return ParsedAction(action_type=ActionType.RAISE, amount=raise_amount)
 
     # Default
     return ParsedAction(action_type=ActionType.CHECK if can_check else ActionType.FOLD)
@@ -74,6 +95,8 @@ class GameSession:
         session_id: str,
         opponents: list[OpponentConfig],
         config: GameConfig,
+        ollama_client: Optional[OllamaStreamingClient] = None,
+        inference_worker: Optional[InferenceWorker] = None,
     ):
         self.session_id = session_id
         self.config = config
@@ -83,16 +106,49 @@ class GameSession:
         self.players: list[PlayerState] = []
         self._setup_players(opponents)
 
-        # Components
+        # Components - sessions share the manager's Ollama client so
+        # concurrent sessions reuse one connection pool and their requests
+        # can overlap at the Ollama backend
         self.ws_manager = WebSocketManager()
-        self.ollama_client = OllamaStreamingClient()
+        self.ollama_client = ollama_client if ollama_client is not None else OllamaStreamingClient()
+        # Cross-session coalescing; standalone sessions get their own worker
+        self.inference_worker = (
+            inference_worker
+            if inference_worker is not None
+            else InferenceWorker(self.ollama_client)
+        )
         self.engine = PokerEngine(config, len(self.players))
-        self.turn_timer = TurnTimer(config.turn_timeout_seconds)
 
-        # State
-        self._pending_action: Optional[ParsedAction] = None
-        self._action_event = asyncio.Event()
+        # State - a one-slot queue arbitrates the human action against the
+        # turn deadline without the event/clear dance (and without a fold
+        # racing in over an action that landed on the timeout boundary)
+        self._action_queue: asyncio.Queue[ParsedAction] = asyncio.Queue(1)
         self._last_actions: list[Optional[str]] = [None] * len(self.players)
+        self._last_update_key: Optional[tuple] = None
+        self._session_task: Optional[asyncio.Task] = None
+
+        # Constant prompt pieces: the header never changes for a session,
+        # and position/hole cards are fixed for a hand. Keeping the prefix
+        # stable across streets also helps backend prompt/KV caching.
+        self._prompt_header = f"Playing {len(self.players)}-handed No-Limit Hold'em."
+        self._prompt_static: dict[int, tuple[int, str, str]] = {}
+
+        # The connection ack never changes for a session; serialize it once
+        self._connection_ack_frame = WebSocketManager.encode_event(
+            ConnectionAckEvent(session_id=session_id, player_id=0)
+        )
+
+    def ensure_started(self) -> None:
+        """Start the session loop once, keeping a reference to the task.
+
+        Holding the task reference prevents asyncio from garbage-collecting
+        a running session and makes repeated start_hand messages no-ops.
+        """
+        if self._session_task is None or self._session_task.done():
+            self._session_task = asyncio.create_task(self.start_session())
+            self._session_task.add_done_callback(
+                lambda t: None if t.cancelled() else t.exception()
+            )
 
     def _setup_players(self, opponents: list[OpponentConfig]) -> None:
         """Initialize player list."""
@@ -127,34 +183,34 @@ class GameSession:
         await self.ws_manager.connect(websocket)
 
         # Send connection ack
-        await self.ws_manager.send_event(
-            websocket,
-            ConnectionAckEvent(session_id=self.session_id, player_id=0),
-        )
+        await self.ws_manager.send_raw(websocket, self._connection_ack_frame)
 
         # Always send initial game state (even before first hand starts)
         state = self._build_initial_state()
-        await self.ws_manager.send_event(websocket, GameStateEvent(state=state))
+        await self.ws_manager.send_event(
+            websocket, GameStateEvent.model_construct(state=state)
+        )
 
     def _build_initial_state(self) -> GameState:
         """Build initial game state before hand starts."""
-        players_state = []
-        for player in self.players:
-            players_state.append(
-                PlayerState(
-                    id=player.id,
-                    name=player.name,
-                    player_type=player.player_type,
-                    model=player.model,
-                    stack=player.stack,
-                    current_bet=0,
-                    is_active=True,
-                    hole_cards=[],
-                    last_action=None,
-                )
+        # Everything here is copied from already-validated server state,
+        # so model_construct skips a second validation pass per player
+        players_state = [
+            PlayerState.model_construct(
+                id=player.id,
+                name=player.name,
+                player_type=player.player_type,
+                model=player.model,
+                stack=player.stack,
+                current_bet=0,
+                is_active=True,
+                hole_cards=[],
+                last_action=None,
             )
+            for player in self.players
+        ]
 
-        return GameState(
+        return GameState.model_construct(
             session_id=self.session_id,
             hand_number=0,
             street=Street.PREFLOP,
@@ -174,38 +230,50 @@ class GameSession:
         """Start the game session."""
         self.status = "in_progress"
         try:
-            await self.play_hand()
+            # Flat loop over hands; the recursive tail-call variant grew
+            # the coroutine stack by a frame per hand
+            while await self.play_hand():
+                if self.engine.hand_number >= self.config.num_hands:
+                    break
+                # Wait a moment before the next hand
+                await asyncio.sleep(2)
+            await self.end_session()
         except Exception as e:
-            import traceback
-            print(f"ERROR in game session: {e}")
-            traceback.print_exc()
+            logger.exception("Error in game session %s", self.session_id)
             await self.broadcast(
                 ErrorEvent(code="game_error", message=str(e))
             )
 
-    async def play_hand(self) -> None:
-        """Play a single hand."""
+    async def play_hand(self) -> bool:
+        """Play a single hand. Returns False when no hand could start."""
         if not self.engine.start_hand():
-            await self.end_session()
-            return
+            return False
 
         # Reset last actions
         self._last_actions = [None] * len(self.players)
 
         # Broadcast initial state
         state = self.engine.build_game_state(self.session_id, self.players)
-        await self.broadcast(GameStateEvent(state=state))
+        await self.broadcast(GameStateEvent.model_construct(state=state))
 
         # Main game loop
-        while not self.engine.is_hand_complete():
+        while True:
+            # One engine read per tick instead of three separate probes
+            hand_active, actor, needs_cards = self.engine.snapshot()
+            if not hand_active:
+                break
+
             # Check if we need to deal cards
-            if self.engine.needs_cards():
+            if needs_cards:
                 new_street = self.engine.deal_street()
                 if new_street:
                     await self._broadcast_state_update()
+                continue
 
-            actor = self.engine.get_actor()
             if actor is None:
+                # No actor and no cards to deal is a transient engine state;
+                # yield to the event loop instead of spinning on it
+                await asyncio.sleep(0)
                 continue
 
             # Get action from player
@@ -227,7 +295,7 @@ class GameSession:
         # Hand complete
         result = self.engine.finalize_hand()
         await self.broadcast(
-            HandCompleteEvent(
+            HandCompleteEvent.model_construct(
                 winners=result["winners"],
                 amounts=result["amounts"],
                 revealed_cards={
@@ -237,13 +305,7 @@ class GameSession:
             )
         )
 
-        # Check if session should continue
-        if self.engine.hand_number >= self.config.num_hands:
-            await self.end_session()
-        else:
-            # Wait a moment, then start next hand
-            await asyncio.sleep(2)
-            await self.play_hand()
+        return True
 
     async def _get_human_action(self) -> Optional[ParsedAction]:
         """Get action from human player with timer."""
@@ -252,38 +314,40 @@ class GameSession:
             return None
 
         # Notify it's human's turn
-        await self.broadcast(YourTurnEvent(available_actions=available))
+        await self.broadcast(YourTurnEvent.model_construct(available_actions=available))
 
-        # Start timer
+        # Start timer; clients count down locally from the event's
+        # timestamp, so no per-second tick broadcasts are sent
         await self.broadcast(
-            TimerStartEvent(
+            TimerStartEvent.model_construct(
                 player_id=0,
                 total_seconds=self.config.turn_timeout_seconds,
             )
         )
 
-        async def on_timeout():
-            """Handle timeout - auto fold."""
-            self._pending_action = ParsedAction(action_type=ActionType.FOLD)
-            self._action_event.set()
-            await self.broadcast(TimerExpiredEvent(player_id=0, action_taken="fold"))
+        # Discard any action left over from a previous turn
+        while not self._action_queue.empty():
+            self._action_queue.get_nowait()
 
-        async def on_tick(remaining: int):
-            """Send timer tick."""
-            await self.broadcast(TimerTickEvent(player_id=0, remaining_seconds=remaining))
-
-        await self.turn_timer.start(on_timeout=on_timeout, on_tick=on_tick)
-
-        # Wait for action
-        self._action_event.clear()
-        await self._action_event.wait()
+        # Race the action queue against the deadline; an action that arrives
+        # on the timeout boundary wins over the auto-fold
+        action_task = asyncio.create_task(self._action_queue.get())
+        timeout_task = asyncio.create_task(
+            asyncio.sleep(self.config.turn_timeout_seconds)
+        )
+        done, pending = await asyncio.wait(
+            {action_task, timeout_task},
+            return_when=asyncio.FIRST_COMPLETED,
+        )
+        for task in pending:
+            task.cancel()
 
-        # Cancel timer
-        await self.turn_timer.cancel()
+        if action_task in done:
+            return action_task.result()
 
-        action = self._pending_action
-        self._pending_action = None
-        return action
+        # Timed out - auto fold
+        await self.broadcast(TimerExpiredEvent(player_id=0, action_taken="fold"))
+        return ParsedAction(action_type=ActionType.FOLD)
 
     async def receive_human_action(self, action_type: str, amount: Optional[int] = None) -> None:
         """Receive action from human player via WebSocket."""
@@ -300,8 +364,11 @@ class GameSession:
         if action_enum is None:
             return
 
-        self._pending_action = ParsedAction(action_type=action_enum, amount=amount)
-        self._action_event.set()
+        try:
+            self._action_queue.put_nowait(ParsedAction(action_type=action_enum, amount=amount))
+        except asyncio.QueueFull:
+            # An action for this turn is already pending; ignore duplicates
+            pass
 
     async def _get_llm_action(self, player_idx: int) -> Optional[ParsedAction]:
         """Get action from LLM player with streaming."""
@@ -311,7 +378,7 @@ class GameSession:
 
         # Notify thinking started
         await self.broadcast(
-            ThinkingStartEvent(player_id=player_idx, player_name=player.name)
+            ThinkingStartEvent.model_construct(player_id=player_idx, player_name=player.name)
         )
 
         start_time = time.time()
@@ -320,14 +387,34 @@ class GameSession:
         # Build prompt
         prompt = self._build_llm_prompt(player_idx)
 
-        # Create token batcher
+        # Create token batcher - serialize each coalesced delta once and
+        # fan the cached payload out to every connection
         async def broadcast_token(token: str):
-            await self.broadcast(ThinkingTokenEvent(player_id=player_idx, token=token))
-
-        batcher = TokenBatcher(broadcast_token, batch_size=5, max_delay_ms=50)
+            # Hottest frame on the wire (one per token batch): build the
+            # payload dict directly instead of going through Pydantic at
+            # all; shape matches ThinkingTokenEvent
+            frame = orjson.dumps(
+                {
+                    "type": "thinking_token",
+                    "player_id": player_idx,
+                    "token": token,
+                    "timestamp": time.time(),
+                }
+            ).decode()
+            await self.ws_manager.broadcast_raw(frame)
+
+        # Coalesce tokens into larger chunks - each frame pays a WebSocket
+        # send plus a JSON encode, so start at 32 chars / 20 ms and let the
+        # batcher grow the batch when the model streams faster than that
+        batcher = TokenBatcher(
+            broadcast_token,
+            batch_size=32,
+            max_delay_ms=20,
+            target_frame_ms=settings.token_target_frame_ms,
+        )
 
         try:
-            full_response = await self.ollama_client.generate_streaming(
+            full_response = await self.inference_worker.submit(
                 model=player.model,
                 prompt=prompt,
                 on_token=batcher.add_token,
@@ -335,6 +422,12 @@ class GameSession:
             )
             await batcher.flush()  # Flush remaining tokens
 
+            # The ollama_stop sequence halts decoding at the closing action
+            # tag but also swallows it; restore the tag so the primary
+            # regex in parse_action still matches
+            if "<action>" in full_response and "</action>" not in full_response:
+                full_response += "</action>"
+
         except Exception as e:
             await self.broadcast(
                 ErrorEvent(code="ollama_error", message=f"LLM error: {str(e)}")
@@ -351,7 +444,7 @@ class GameSession:
 
         # Notify thinking complete
         await self.broadcast(
-            ThinkingCompleteEvent(
+            ThinkingCompleteEvent.model_construct(
                 player_id=player_idx,
                 action=action,
                 full_text=full_response,
@@ -363,23 +456,34 @@ class GameSession:
 
     def _build_llm_prompt(self, player_idx: int) -> str:
         """Build prompt for LLM player."""
-        hole_cards = self.engine.get_hole_cards(player_idx)
-        board = self.engine.get_board()
-        pot = self.engine.get_pot()
-        available = self.engine.get_available_actions()
-        stack = self.engine.get_player_stack(player_idx)
-        position = self.engine.get_position_name(player_idx)
+        engine = self.engine
+
+        # Position and hole cards are constant for the hand; rebuild those
+        # lines only when a new hand starts
+        cached = self._prompt_static.get(player_idx)
+        if cached is None or cached[0] != engine.hand_number:
+            c1, c2 = engine.get_hole_cards(player_idx)
+            cached = (
+                engine.hand_number,
+                f"Position: {engine.get_position_name(player_idx)}",
+                f"Hole cards: {c1} {c2}",
+            )
+            self._prompt_static[player_idx] = cached
+        _, position_line, hole_line = cached
+
+        board = engine.get_board()
+        pot = engine.get_pot()
+        available = engine.get_available_actions()
+        stack = engine.get_player_stack(player_idx)
 
         to_call = available.call_amount if available else 0
-        can_check = available.can_check if available else False
 
-        c1, c2 = hole_cards
         lines = [
-            f"Playing {len(self.players)}-handed No-Limit Hold'em.",
-            f"Position: {position}",
+            self._prompt_header,
+            position_line,
             f"Stack: {stack} chips",
             "",
-            f"Hole cards: {c1} {c2}",
+            hole_line,
         ]
 
         if board:
@@ -401,8 +505,23 @@ class GameSession:
         """Broadcast incremental state update."""
         state = self.engine.build_game_state(self.session_id, self.players)
 
+        # Consecutive actions often leave the visible state unchanged
+        # (e.g. a check around); skip the broadcast when nothing moved
+        key = (
+            state.hand_number,
+            state.street,
+            state.pot,
+            state.current_actor,
+            tuple(p.stack for p in state.players),
+            tuple(p.current_bet for p in state.players),
+            tuple(self._last_actions),
+        )
+        if key == self._last_update_key:
+            return
+        self._last_update_key = key
+
         await self.broadcast(
-            GameStateUpdateEvent(
+            GameStateUpdateEvent.model_construct(
                 hand_number=state.hand_number,
                 street=state.street.value,
                 pot=state.pot,
@@ -428,16 +547,21 @@ class GameSession:
 
     async def cleanup(self) -> None:
         """Cleanup session resources."""
-        await self.turn_timer.cancel()
+        if self._session_task is not None and not self._session_task.done():
+            self._session_task.cancel()
         await self.ws_manager.close_all()
 
 
 class GameSessionManager:
     """Manages all active game sessions."""
 
-    def __init__(self):
+    def __init__(self, ollama_client: Optional[OllamaStreamingClient] = None):
         self._sessions: dict[str, GameSession] = {}
         self._lock = asyncio.Lock()
+        # One client and one inference worker shared by every session this
+        # manager creates, so prompts from different sessions coalesce
+        self.ollama_client = ollama_client if ollama_client is not None else OllamaStreamingClient()
+        self.inference_worker = InferenceWorker(self.ollama_client)
 
     async def create_session(
         self,
@@ -445,11 +569,15 @@ class GameSessionManager:
         config: GameConfig,
     ) -> GameSession:
         """Create a new game session."""
-        async with self._lock:
-            session_id = str(uuid.uuid4())[:8]
-            session = GameSession(session_id, opponents, config)
-            self._sessions[session_id] = session
-            return session
+        # Build the session outside the lock - engine and component setup
+        # has no shared state, so concurrent connects need not serialize.
+        # The dict insert itself is atomic under the GIL.
+        session_id = str(uuid.uuid4())[:8]
+        session = GameSession(
+            session_id, opponents, config, self.ollama_client, self.inference_worker
+        )
+        self._sessions[session_id] = session
+        return session
 
     async def get_session(self, session_id: str) -> Optional[GameSession]:
         """Get a session by ID."""
@@ -473,3 +601,4 @@ class GameSessionManager:
             for session in self._sessions.values():
                 await session.cleanup()
             self._sessions.clear()
+        await self.inference_worker.stop()
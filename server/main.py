@@ -1,6 +1,7 @@
 """FastAPI application entry point."""
 
 import asyncio
+import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
@@ -8,29 +9,23 @@ from fastapi.staticfiles import StaticFiles
 from pathlib import Path
 
 from .config import settings
-from .api.routes import router as api_router, init_dependencies
+from .api.routes import router as api_router
 from .api.websocket import websocket_endpoint
 from .game import GameSessionManager
 from .streaming import OllamaStreamingClient
 
 
-# Global instances
-session_manager: GameSessionManager = None
-ollama_client: OllamaStreamingClient = None
-
-
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
-    global session_manager, ollama_client
-
-    # Startup
-    session_manager = GameSessionManager()
-    ollama_client = OllamaStreamingClient()
-    init_dependencies(session_manager, ollama_client)
+    # Startup - routes resolve these via app.state, so they are guaranteed
+    # to exist before the first request is served
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(message)s")
+    app.state.ollama_client = OllamaStreamingClient()
+    app.state.session_manager = GameSessionManager(app.state.ollama_client)
 
     # Check Ollama connection
-    if await ollama_client.check_connection():
+    if await app.state.ollama_client.check_connection():
         print(f"Connected to Ollama at {settings.ollama_endpoint}")
     else:
         print(f"WARNING: Cannot connect to Ollama at {settings.ollama_endpoint}")
@@ -38,7 +33,8 @@ async def lifespan(app: FastAPI):
     yield
 
     # Shutdown
-    await session_manager.cleanup_all()
+    await app.state.session_manager.cleanup_all()
+    await app.state.ollama_client.aclose()
 
 
 # Create FastAPI app
@@ -66,7 +62,7 @@ app.include_router(api_router, prefix="/api")
 @app.websocket("/ws/{session_id}")
 async def ws_endpoint(websocket: WebSocket, session_id: str):
     """WebSocket endpoint for game sessions."""
-    await websocket_endpoint(websocket, session_id, session_manager)
+    await websocket_endpoint(websocket, session_id, websocket.app.state.session_manager)
 
 
 # Serve static files for frontend (if web/ directory exists)
@@ -79,11 +75,21 @@ def main():
     """Run the server."""
     import uvicorn
 
+    # The session loop is coroutine-heavy (token batches, broadcasts,
+    # turn deadlines); uvloop's libuv event loop makes all of that cheaper
+    try:
+        import uvloop  # noqa: F401
+
+        loop = "uvloop"
+    except ImportError:
+        loop = "auto"
+
     uvicorn.run(
         "server.main:app",
         host=settings.host,
         port=settings.port,
         reload=settings.debug,
+        loop=loop,
     )
 
 
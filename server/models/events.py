@@ -2,17 +2,28 @@
 
 import time
 from typing import Literal, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from .game import GameState, AvailableActions, ParsedAction, Card
 
 
+class ServerEvent(BaseModel):
+    """Base for server-built events.
+
+    These are constructed thousands of times per session from trusted
+    engine state; frozen instances are cheap to share and the hot paths
+    build them with model_construct to skip validation.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+
 # =============================================================================
 # Server to Client Events
 # =============================================================================
 
 
-class ConnectionAckEvent(BaseModel):
+class ConnectionAckEvent(ServerEvent):
     """Connection acknowledged."""
 
     type: Literal["connection_ack"] = "connection_ack"
@@ -20,14 +31,14 @@ class ConnectionAckEvent(BaseModel):
     player_id: int
 
 
-class GameStateEvent(BaseModel):
+class GameStateEvent(ServerEvent):
     """Full game state snapshot."""
 
     type: Literal["game_state"] = "game_state"
     state: GameState
 
 
-class GameStateUpdateEvent(BaseModel):
+class GameStateUpdateEvent(ServerEvent):
     """Incremental game state update."""
 
     type: Literal["game_state_update"] = "game_state_update"
@@ -42,14 +53,14 @@ class GameStateUpdateEvent(BaseModel):
     available_actions: Optional[AvailableActions] = None
 
 
-class YourTurnEvent(BaseModel):
+class YourTurnEvent(ServerEvent):
     """Prompt human player for action."""
 
     type: Literal["your_turn"] = "your_turn"
     available_actions: AvailableActions
 
 
-class ThinkingStartEvent(BaseModel):
+class ThinkingStartEvent(ServerEvent):
     """LLM started thinking."""
 
     type: Literal["thinking_start"] = "thinking_start"
@@ -57,7 +68,7 @@ class ThinkingStartEvent(BaseModel):
     player_name: str
 
 
-class ThinkingTokenEvent(BaseModel):
+class ThinkingTokenEvent(ServerEvent):
     """Single token from LLM thinking stream."""
 
     type: Literal["thinking_token"] = "thinking_token"
@@ -66,7 +77,7 @@ class ThinkingTokenEvent(BaseModel):
     timestamp: float = Field(default_factory=time.time)
 
 
-class ThinkingCompleteEvent(BaseModel):
+class ThinkingCompleteEvent(ServerEvent):
     """LLM finished thinking."""
 
     type: Literal["thinking_complete"] = "thinking_complete"
@@ -76,7 +87,7 @@ class ThinkingCompleteEvent(BaseModel):
     duration_ms: int
 
 
-class TimerStartEvent(BaseModel):
+class TimerStartEvent(ServerEvent):
     """Turn timer started."""
 
     type: Literal["timer_start"] = "timer_start"
@@ -85,7 +96,7 @@ class TimerStartEvent(BaseModel):
     timestamp: float = Field(default_factory=time.time)
 
 
-class TimerTickEvent(BaseModel):
+class TimerTickEvent(ServerEvent):
     """Timer update."""
 
     type: Literal["timer_tick"] = "timer_tick"
@@ -93,7 +104,7 @@ class TimerTickEvent(BaseModel):
     remaining_seconds: int
 
 
-class TimerExpiredEvent(BaseModel):
+class TimerExpiredEvent(ServerEvent):
     """Timer expired, auto-action taken."""
 
     type: Literal["timer_expired"] = "timer_expired"
@@ -101,7 +112,7 @@ class TimerExpiredEvent(BaseModel):
     action_taken: str
 
 
-class HandCompleteEvent(BaseModel):
+class HandCompleteEvent(ServerEvent):
     """Hand finished."""
 
     type: Literal["hand_complete"] = "hand_complete"
@@ -110,7 +121,7 @@ class HandCompleteEvent(BaseModel):
     revealed_cards: dict[int, list[Card]]  # player_id -> cards
 
 
-class SessionCompleteEvent(BaseModel):
+class SessionCompleteEvent(ServerEvent):
     """Session ended."""
 
     type: Literal["session_complete"] = "session_complete"
@@ -118,7 +129,7 @@ class SessionCompleteEvent(BaseModel):
     hands_played: int
 
 
-class ErrorEvent(BaseModel):
+class ErrorEvent(ServerEvent):
     """Error notification."""
 
     type: Literal["error"] = "error"
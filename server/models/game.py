@@ -1,8 +1,11 @@
 """Game state models."""
 
+from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from typing import NamedTuple, Optional
+
 from pydantic import BaseModel
+from pydantic_core import core_schema
 
 
 class Street(str, Enum):
@@ -25,8 +28,13 @@ class ActionType(str, Enum):
     ALL_IN = "all_in"
 
 
-class Card(BaseModel):
-    """Playing card."""
+class Card(NamedTuple):
+    """Playing card.
+
+    A plain tuple rather than a BaseModel: cards are created per player
+    per street, and the wire format (``{"rank": ..., "suit": ...}``) is
+    preserved by the custom pydantic schema below.
+    """
 
     rank: str  # 2-9, T, J, Q, K, A
     suit: str  # c, d, h, s
@@ -37,13 +45,50 @@ class Card(BaseModel):
     @classmethod
     def from_string(cls, s: str) -> "Card":
         """Parse card from string like 'As' or 'Th'."""
+        # All 52 cards are interned below; normal input is a dict hit
+        card = _CARD_CACHE.get(s)
+        if card is not None:
+            return card
         s = s.strip()
         if len(s) >= 2:
             return cls(rank=s[0].upper(), suit=s[1].lower())
         raise ValueError(f"Invalid card string: {s}")
 
+    @classmethod
+    def _validate(cls, value) -> "Card":
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, dict):
+            return cls(**value)
+        if isinstance(value, (tuple, list)):
+            return cls(*value)
+        if isinstance(value, str):
+            return cls.from_string(value)
+        raise ValueError(f"Invalid card: {value!r}")
 
-class ParsedAction(BaseModel):
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source_type, handler):
+        # Keep Card usable as a field type in the pydantic models below,
+        # serializing as {"rank": ..., "suit": ...} like the old BaseModel
+        return core_schema.no_info_plain_validator_function(
+            cls._validate,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda c: {"rank": c.rank, "suit": c.suit}
+            ),
+        )
+
+
+# Intern the 52 cards once; from_string returns shared instances and
+# deck/board construction stops allocating per card
+_CARD_CACHE: dict[str, Card] = {
+    f"{rank}{suit}": Card(rank=rank, suit=suit)
+    for rank in "23456789TJQKA"
+    for suit in "cdhs"
+}
+
+
+@dataclass(slots=True)
+class ParsedAction:
     """Parsed poker action."""
 
     action_type: ActionType
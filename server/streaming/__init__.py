@@ -1,6 +1,7 @@
 """Streaming components for Ollama."""
 
+from .inference_worker import InferenceWorker
 from .ollama_client import OllamaStreamingClient
 from .token_batcher import TokenBatcher
 
-__all__ = ["OllamaStreamingClient", "TokenBatcher"]
+__all__ = ["InferenceWorker", "OllamaStreamingClient", "TokenBatcher"]
@@ -0,0 +1,100 @@
+"""Shared inference worker that coalesces LLM requests across sessions."""
+
+import asyncio
+from typing import Awaitable, Callable, Optional
+
+from .ollama_client import OllamaStreamingClient
+
+
+class InferenceWorker:
+    """Coalesce pending generation requests into concurrent backend batches.
+
+    Sessions submit prompts through a queue; a background drain task gathers
+    up to ``max_batch`` requests within ``max_delay_ms`` and issues them
+    concurrently, so Ollama's own scheduler can batch same-model requests
+    instead of seeing them strictly one at a time.
+    """
+
+    def __init__(
+        self,
+        client: OllamaStreamingClient,
+        max_batch: int = 4,
+        max_delay_ms: float = 20.0,
+    ):
+        self.client = client
+        self.max_batch = max_batch
+        self.max_delay_ms = max_delay_ms
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._drain_task: Optional[asyncio.Task] = None
+
+    async def submit(
+        self,
+        model: str,
+        prompt: str,
+        on_token: Callable[[str], Awaitable[None]],
+        temperature: float = 0.6,
+        max_tokens: int = 2048,
+        system_prompt: Optional[str] = None,
+    ) -> str:
+        """Enqueue a streaming generation request and wait for its result."""
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.create_task(self._drain())
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        await self._queue.put(
+            (future, model, prompt, on_token, temperature, max_tokens, system_prompt)
+        )
+        return await future
+
+    async def stop(self) -> None:
+        """Stop the drain task."""
+        if self._drain_task is not None:
+            self._drain_task.cancel()
+            try:
+                await self._drain_task
+            except asyncio.CancelledError:
+                pass
+            self._drain_task = None
+
+    async def _drain(self) -> None:
+        """Collect submissions into batches and run them concurrently."""
+        while True:
+            batch = [await self._queue.get()]
+
+            # Wait briefly for more requests to coalesce into this batch
+            deadline = asyncio.get_running_loop().time() + self.max_delay_ms / 1000.0
+            while len(batch) < self.max_batch:
+                remaining = deadline - asyncio.get_running_loop().time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            # Approximate shortest-job-first: dispatch shorter prompts
+            # ahead of long ones so quick decisions are not head-of-line
+            # blocked on the backend's concurrency slots; ties keep
+            # same-model requests adjacent for the backend scheduler.
+            # Starvation is bounded by the small batch window.
+            batch.sort(key=lambda item: (len(item[2]), item[1]))
+            await asyncio.gather(*(self._run(item) for item in batch))
+
+    async def _run(self, item) -> None:
+        """Execute one request and resolve its future."""
+        future, model, prompt, on_token, temperature, max_tokens, system_prompt = item
+        try:
+            result = await self.client.generate_streaming(
+                model=model,
+                prompt=prompt,
+                on_token=on_token,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                system_prompt=system_prompt,
+            )
+        except Exception as e:
+            if not future.cancelled():
+                future.set_exception(e)
+        else:
+            if not future.cancelled():
+                future.set_result(result)
@@ -1,15 +1,18 @@
 """Async streaming Ollama client."""
 
 import asyncio
-import json
+
 import httpx
+import orjson
 from typing import Awaitable, Callable, Optional
 
 from ..config import settings
 
 
-# Global lock to ensure only one Ollama request at a time
-_ollama_lock = asyncio.Lock()
+# Bound concurrent Ollama requests without serializing them - the backend
+# batches concurrent prompts itself (OLLAMA_NUM_PARALLEL), and a strict
+# lock made quick fold decisions queue behind long reasoning chains
+_ollama_sem = asyncio.Semaphore(settings.ollama_max_concurrency)
 
 
 SYSTEM_PROMPT = """You are an expert poker player. Analyze and decide the optimal action.
@@ -32,23 +35,53 @@ class OllamaStreamingClient:
     ):
         self.endpoint = endpoint
         self.timeout = timeout
+        # One pooled client for the lifetime of this instance; keep-alive
+        # connections are reused across turns instead of paying TCP setup
+        # per request
+        self._client = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        )
+        # Readiness and model listings barely change between hands, so
+        # remember recent successes and skip the HTTP round trip within
+        # the TTL; failures are never cached
+        self._last_ok_ts = 0.0
+        self._ok_ttl = 5.0
+        self._models_cache: list[dict] = []
+        self._models_cache_ts = 0.0
+        self._models_ttl = 30.0
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        await self._client.aclose()
 
     async def check_connection(self) -> bool:
-        """Check if Ollama is reachable."""
+        """Check if Ollama is reachable (cached for a few seconds)."""
+        now = asyncio.get_running_loop().time()
+        if now - self._last_ok_ts < self._ok_ttl:
+            return True
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(f"{self.endpoint}/api/tags")
-                return response.status_code == 200
+            response = await self._client.get(f"{self.endpoint}/api/tags", timeout=5.0)
+            if response.status_code == 200:
+                self._last_ok_ts = asyncio.get_running_loop().time()
+                return True
+            return False
         except Exception:
             return False
 
     async def list_models(self) -> list[dict]:
-        """List available Ollama models."""
+        """List available Ollama models (cached for ~30 seconds)."""
+        now = asyncio.get_running_loop().time()
+        if self._models_cache and now - self._models_cache_ts < self._models_ttl:
+            return self._models_cache
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(f"{self.endpoint}/api/tags")
-                if response.status_code == 200:
-                    return response.json().get("models", [])
+            response = await self._client.get(f"{self.endpoint}/api/tags", timeout=10.0)
+            if response.status_code == 200:
+                self._models_cache = response.json().get("models", [])
+                self._models_cache_ts = asyncio.get_running_loop().time()
+                # A model listing also proves the server is up
+                self._last_ok_ts = self._models_cache_ts
+                return self._models_cache
         except Exception:
             pass
         return []
@@ -76,8 +109,7 @@ class OllamaStreamingClient:
         Returns:
             Complete response text
         """
-        # Acquire global lock to ensure only one Ollama request at a time
-        async with _ollama_lock:
+        async with _ollama_sem:
             return await self._generate_streaming_impl(
                 model, prompt, on_token, temperature, max_tokens, system_prompt
             )
@@ -102,45 +134,72 @@ class OllamaStreamingClient:
             "options": {
                 "temperature": temperature,
                 "num_predict": max_tokens,
+                "num_ctx": settings.ollama_num_ctx,
+                "stop": settings.ollama_stop,
             },
         }
 
         full_response = ""
-
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            async with client.stream(
-                "POST",
-                f"{self.endpoint}/api/chat",
-                json=payload,
-            ) as response:
-                response.raise_for_status()
-
-                async for line in response.aiter_lines():
+        stop_strings = settings.ollama_stop
+        tail_len = max((len(s) for s in stop_strings), default=0) + 32
+
+        async with self._client.stream(
+            "POST",
+            f"{self.endpoint}/api/chat",
+            json=payload,
+        ) as response:
+            response.raise_for_status()
+
+            # Split NDJSON frames from the raw byte stream ourselves:
+            # aiter_lines pays a text decode plus Python-level line scan
+            # per chunk, while orjson.loads consumes bytes directly
+            buf = bytearray()
+            done = False
+            async for chunk in response.aiter_raw():
+                buf += chunk
+                while (nl := buf.find(b"\n")) != -1:
+                    line = bytes(buf[:nl])
+                    del buf[: nl + 1]
                     if not line:
                         continue
 
                     try:
-                        data = json.loads(line)
+                        data = orjson.loads(line)
+                        message = data.get("message")
+                        content = message.get("content", "") if message else ""
+                        thinking = message.get("thinking", "") if message else ""
 
                         # Handle regular content
-                        content = data.get("message", {}).get("content", "")
                         if content:
                             full_response += content
                             await on_token(content)
 
                         # Handle thinking content (for thinking models like qwen3)
-                        thinking = data.get("message", {}).get("thinking", "")
                         if thinking:
                             full_response += thinking
                             await on_token(thinking)
 
                         # Check if done
                         if data.get("done", False):
+                            done = True
                             break
 
-                    except json.JSONDecodeError:
+                        # Belt-and-braces early exit: the stop option should end
+                        # generation server-side, but thinking-channel tokens
+                        # bypass it. Leaving the stream cancels the request, so
+                        # every token after the action tag is never decoded.
+                        if (content or thinking) and any(
+                            s in full_response[-tail_len:] for s in stop_strings
+                        ):
+                            done = True
+                            break
+
+                    except orjson.JSONDecodeError:
                         continue
 
+                if done:
+                    break
+
         return full_response
 
     async def generate(
@@ -164,8 +223,7 @@ class OllamaStreamingClient:
         Returns:
             Complete response text
         """
-        # Acquire global lock to ensure only one Ollama request at a time
-        async with _ollama_lock:
+        async with _ollama_sem:
             payload = {
                 "model": model,
                 "messages": [
@@ -176,19 +234,20 @@ class OllamaStreamingClient:
                 "options": {
                     "temperature": temperature,
                     "num_predict": max_tokens,
+                    "num_ctx": settings.ollama_num_ctx,
+                    "stop": settings.ollama_stop,
                 },
             }
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.endpoint}/api/chat",
-                    json=payload,
-                )
-                response.raise_for_status()
-                result = response.json()
+            response = await self._client.post(
+                f"{self.endpoint}/api/chat",
+                json=payload,
+            )
+            response.raise_for_status()
+            result = response.json()
 
-                msg = result.get("message", {})
-                content = msg.get("content", "")
-                thinking = msg.get("thinking", "")
+            msg = result.get("message", {})
+            content = msg.get("content", "")
+            thinking = msg.get("thinking", "")
 
-                return content if content else thinking
+            return content if content else thinking
@@ -1,8 +1,7 @@
 """Token batching for efficient WebSocket streaming."""
 
 import asyncio
-import time
-from typing import Awaitable, Callable
+from typing import Awaitable, Callable, Optional
 
 
 class TokenBatcher:
@@ -13,41 +12,102 @@ class TokenBatcher:
         broadcast_fn: Callable[[str], Awaitable[None]],
         batch_size: int = 5,
         max_delay_ms: float = 50.0,
+        target_frame_ms: float = 20.0,
+        max_batch_size: int = 256,
     ):
         """
         Initialize token batcher.
 
         Args:
             broadcast_fn: Async function to call with batched tokens
-            batch_size: Number of characters to batch before flush
+            batch_size: Initial (and minimum) characters to batch before flush
             max_delay_ms: Maximum delay before flush in milliseconds
+            target_frame_ms: Desired interval between frames; the batch
+                size adapts to the stream's token rate to hold this.
+                Pass 0 to disable adaptation and keep batch_size fixed
+            max_batch_size: Upper bound for the adaptive batch size
         """
         self.broadcast_fn = broadcast_fn
         self.batch_size = batch_size
+        self.min_batch_size = batch_size
+        self.max_batch_size = max_batch_size
         self.max_delay_ms = max_delay_ms
-        self._buffer = ""
-        self._last_flush = time.time()
+        self._max_delay_s = max_delay_ms / 1000.0
+        self._target_frame_s = target_frame_ms / 1000.0
+        # EMA of characters/sec, updated per flush; fast streams grow the
+        # batch (fewer, larger frames), slow streams shrink it back so
+        # the max_delay_ms timer still bounds time-to-first-token
+        self._ema_chars_per_s = 0.0
+        self._last_flush_time: Optional[float] = None
+        # Accumulate parts and join at flush; repeated str += is quadratic
+        # when CPython cannot resize the buffer in place
+        self._parts: list[str] = []
+        self._length = 0
+        # Delay flushes are driven by a timer armed on the first buffered
+        # token, so add_token does no clock reads and a stalled stream
+        # still delivers its partial buffer within max_delay_ms
+        self._timer_handle: Optional[asyncio.TimerHandle] = None
+        self._timer_task: Optional[asyncio.Task] = None
 
     async def add_token(self, token: str) -> None:
         """Add a token to the buffer, flushing if needed."""
-        self._buffer += token
+        buffer_was_empty = not self._parts
+        self._parts.append(token)
+        self._length += len(token)
 
-        should_flush = (
-            len(self._buffer) >= self.batch_size
-            or (time.time() - self._last_flush) * 1000 >= self.max_delay_ms
-        )
-
-        if should_flush:
+        if self._length >= self.batch_size:
             await self.flush()
+        elif buffer_was_empty:
+            self._timer_handle = asyncio.get_running_loop().call_later(
+                self._max_delay_s, self._flush_from_timer
+            )
+
+    def _flush_from_timer(self) -> None:
+        """Timer callback: flush whatever is buffered."""
+        self._timer_handle = None
+        if self._parts:
+            # Keep a reference so the flush task is not garbage-collected
+            self._timer_task = asyncio.get_event_loop().create_task(self.flush())
+            self._timer_task.add_done_callback(
+                lambda t: None if t.cancelled() else t.exception()
+            )
 
     async def flush(self) -> None:
         """Flush the buffer, broadcasting accumulated tokens."""
-        if self._buffer:
-            await self.broadcast_fn(self._buffer)
-            self._buffer = ""
-            self._last_flush = time.time()
+        if self._timer_handle is not None:
+            self._timer_handle.cancel()
+            self._timer_handle = None
+        if self._parts:
+            message = "".join(self._parts)
+            self._parts.clear()
+            self._length = 0
+            self._adapt_batch_size(len(message))
+            await self.broadcast_fn(message)
+
+    def _adapt_batch_size(self, flushed_chars: int) -> None:
+        """Retarget batch_size from the observed character rate."""
+        if self._target_frame_s <= 0:
+            return
+        now = asyncio.get_running_loop().time()
+        if self._last_flush_time is not None:
+            elapsed = now - self._last_flush_time
+            if elapsed > 0:
+                rate = flushed_chars / elapsed
+                self._ema_chars_per_s = (
+                    rate
+                    if self._ema_chars_per_s == 0.0
+                    else 0.5 * self._ema_chars_per_s + 0.5 * rate
+                )
+                self.batch_size = min(
+                    max(
+                        int(self._ema_chars_per_s * self._target_frame_s),
+                        self.min_batch_size,
+                    ),
+                    self.max_batch_size,
+                )
+        self._last_flush_time = now
 
     @property
     def pending(self) -> str:
         """Get pending tokens in buffer."""
-        return self._buffer
+        return "".join(self._parts)
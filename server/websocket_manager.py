@@ -1,8 +1,9 @@
 """WebSocket connection manager."""
 
 import asyncio
-import json
 from typing import Any
+
+import orjson
 from fastapi import WebSocket
 from pydantic import BaseModel
 
@@ -11,62 +12,71 @@ class WebSocketManager:
     """Manages WebSocket connections for a game session."""
 
     def __init__(self):
-        self.active_connections: list[WebSocket] = []
+        self.active_connections: set[WebSocket] = set()
         self._lock = asyncio.Lock()
 
     async def connect(self, websocket: WebSocket) -> None:
         """Accept and register a new connection."""
         await websocket.accept()
         async with self._lock:
-            self.active_connections.append(websocket)
+            self.active_connections.add(websocket)
 
     async def disconnect(self, websocket: WebSocket) -> None:
         """Remove a connection."""
         async with self._lock:
-            if websocket in self.active_connections:
-                self.active_connections.remove(websocket)
+            self.active_connections.discard(websocket)
+
+    @staticmethod
+    def encode_event(event: BaseModel) -> str:
+        """Serialize an event once; the frame can be sent to any number
+        of sockets via send_raw/broadcast_raw."""
+        # OPT_NON_STR_KEYS: some events key dicts by player id (int)
+        return orjson.dumps(event.model_dump(), option=orjson.OPT_NON_STR_KEYS).decode()
 
     async def send_event(self, websocket: WebSocket, event: BaseModel) -> None:
         """Send an event to a specific connection."""
+        await self.send_raw(websocket, self.encode_event(event))
+
+    async def send_raw(self, websocket: WebSocket, message: str) -> None:
+        """Send a pre-serialized event to a specific connection."""
         try:
-            await websocket.send_text(event.model_dump_json())
+            await websocket.send_text(message)
         except Exception:
             await self.disconnect(websocket)
 
     async def broadcast(self, event: BaseModel) -> None:
-        """Broadcast an event to all connected clients."""
-        message = event.model_dump_json()
-        disconnected = []
+        """Broadcast an event to all connected clients.
 
+        The event is serialized exactly once regardless of how many
+        clients are connected.
+        """
+        await self.broadcast_raw(self.encode_event(event))
+
+    async def broadcast_raw(self, message: str) -> None:
+        """Broadcast a pre-serialized event to all connected clients.
+
+        Sends run concurrently, so the broadcast costs as much as the
+        slowest client instead of the sum of all of them.
+        """
         async with self._lock:
             connections = list(self.active_connections)
 
-        for connection in connections:
-            try:
-                await connection.send_text(message)
-            except Exception:
-                disconnected.append(connection)
+        if not connections:
+            return
+
+        results = await asyncio.gather(
+            *(conn.send_text(message) for conn in connections),
+            return_exceptions=True,
+        )
 
         # Clean up disconnected clients
-        for conn in disconnected:
-            await self.disconnect(conn)
+        for conn, result in zip(connections, results):
+            if isinstance(result, BaseException):
+                await self.disconnect(conn)
 
     async def broadcast_json(self, data: dict[str, Any]) -> None:
         """Broadcast raw JSON to all connected clients."""
-        message = json.dumps(data)
-        disconnected = []
-
-        async with self._lock:
-            connections = list(self.active_connections)
-
-        for connection in connections:
-            try:
-                await connection.send_text(message)
-            except Exception:
-                disconnected.append(connection)
-
-        for conn in disconnected:
-            await self.disconnect(conn)
+        await self.broadcast_raw(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode())
 
     @property
     def connection_count(self) -> int:
@@ -76,9 +86,9 @@ class WebSocketManager:
     async def close_all(self) -> None:
         """Close all connections."""
         async with self._lock:
-            for connection in self.active_connections:
-                try:
-                    await connection.close()
-                except Exception:
-                    pass
+            if self.active_connections:
+                await asyncio.gather(
+                    *(connection.close() for connection in self.active_connections),
+                    return_exceptions=True,
+                )
             self.active_connections.clear()
@@ -2,9 +2,34 @@
 
 import re
 from dataclasses import dataclass
+from enum import IntEnum
 from typing import Optional
 
 
+class ActionKind(IntEnum):
+    """Integer classification of poker actions, usable as an array index."""
+    FOLD = 0
+    CHECK = 1
+    CALL = 2
+    RAISE = 3
+    ALL_IN = 4
+
+
+_ACTION_KINDS = {
+    "fold": ActionKind.FOLD,
+    "check": ActionKind.CHECK,
+    "call": ActionKind.CALL,
+    "raise": ActionKind.RAISE,
+    "bet": ActionKind.RAISE,
+    "all_in": ActionKind.ALL_IN,
+}
+
+
+def classify_action(action_type: str) -> Optional[ActionKind]:
+    """Map an action_type string to its ActionKind (None for quit/error)."""
+    return _ACTION_KINDS.get(action_type)
+
+
 @dataclass
 class ParsedAction:
     """Parsed poker action."""
@@ -12,6 +37,11 @@ class ParsedAction:
     amount: Optional[int] = None
     error_message: Optional[str] = None  # For error actions
 
+    @property
+    def kind(self) -> Optional[ActionKind]:
+        """Integer classification of action_type (None for quit/error)."""
+        return _ACTION_KINDS.get(self.action_type)
+
     def __str__(self):
         if self.action_type == "error":
             return f"Error: {self.error_message or 'Unknown error'}"
@@ -35,10 +65,16 @@ class ActionParser:
     """Parse PHH-format actions from LLM responses."""
 
     RE_ACTION_TAG = re.compile(r'<action>\s*(.+?)\s*</action>', re.IGNORECASE | re.DOTALL)
-    RE_FOLD = re.compile(r'\b(f|fold)\b', re.IGNORECASE)
-    RE_CC = re.compile(r'\b(cc|call|check)\b', re.IGNORECASE)
-    RE_CBR = re.compile(r'\b(?:cbr|bet|raise)\s*(\d+)', re.IGNORECASE)
-    RE_ALL_IN = re.compile(r'\b(?:all.?in|allin|shove)\b', re.IGNORECASE)
+    # All keywords in one alternation so the response is scanned once;
+    # priority between kinds (all_in > check/call > fold > raise) is
+    # resolved after the scan, matching the old sequential searches.
+    RE_KEYWORDS = re.compile(
+        r'(?P<allin>\b(?:all.?in|allin|shove)\b)'
+        r'|(?P<cc>\b(?:cc|call|check)\b)'
+        r'|(?P<fold>\b(?:f|fold)\b)'
+        r'|\b(?:cbr|bet|raise)\s*(?P<amount>\d+)',
+        re.IGNORECASE,
+    )
 
     def parse(self, response: str, can_check: bool = False, stack: int = 0) -> ParsedAction:
         """Parse action from LLM response."""
@@ -47,22 +83,48 @@ class ActionParser:
 
     def parse_with_metadata(self, response: str, can_check: bool = False, stack: int = 0) -> ParseResult:
         """Parse action from LLM response with full metadata for observability."""
-        # Try action tag first
-        tag_match = self.RE_ACTION_TAG.search(response)
-        used_tag = tag_match is not None
-        text = tag_match.group(1).strip() if tag_match else response
-
-        # All-in
-        if self.RE_ALL_IN.search(text):
-            method = "tag" if used_tag else "regex_allin"
-            return ParseResult(
-                action=ParsedAction("all_in", stack),
-                method=method,
-                raw_match=text,
-            )
+        # Try action tag first. The tag is emitted at the end of generation,
+        # so a rightmost plain-string search avoids regex-scanning a
+        # potentially multi-KB reasoning preamble; the regex only runs as a
+        # fallback for case variants like <ACTION>.
+        text = None
+        end = response.rfind("</action>")
+        if end != -1:
+            start = response.rfind("<action>", 0, end)
+            if start != -1:
+                text = response[start + len("<action>"):end].strip()
+        if text is None:
+            # One C-level containment scan decides whether the IGNORECASE
+            # regex is worth running at all; most untagged responses skip it
+            if "<action>" in response.lower():
+                tag_match = self.RE_ACTION_TAG.search(response)
+                text = tag_match.group(1).strip() if tag_match else None
+        used_tag = text is not None
+        if text is None:
+            text = response
+
+        # Single pass over the text; remember which kinds appeared
+        cc_seen = False
+        fold_seen = False
+        raise_amount = None
+        for m in self.RE_KEYWORDS.finditer(text):
+            kind = m.lastgroup
+            if kind == "allin":
+                method = "tag" if used_tag else "regex_allin"
+                return ParseResult(
+                    action=ParsedAction("all_in", stack),
+                    method=method,
+                    raw_match=text,
+                )
+            if kind == "cc":
+                cc_seen = True
+            elif kind == "fold":
+                fold_seen = True
+            elif kind == "amount" and raise_amount is None:
+                raise_amount = int(m.group("amount"))
 
         # Check/Call
-        if self.RE_CC.search(text):
+        if cc_seen:
             action_type = "check" if can_check else "call"
             method = "tag" if used_tag else "regex_call"
             return ParseResult(
@@ -72,7 +134,7 @@ class ActionParser:
             )
 
         # Fold
-        if self.RE_FOLD.search(text):
+        if fold_seen:
             method = "tag" if used_tag else "regex_fold"
             return ParseResult(
                 action=ParsedAction("fold"),
@@ -81,11 +143,10 @@ class ActionParser:
             )
 
         # Bet/Raise
-        cbr_match = self.RE_CBR.search(text)
-        if cbr_match:
+        if raise_amount is not None:
             method = "tag" if used_tag else "regex_raise"
             return ParseResult(
-                action=ParsedAction("raise", int(cbr_match.group(1))),
+                action=ParsedAction("raise", raise_amount),
                 method=method,
                 raw_match=text,
             )
@@ -1,7 +1,13 @@
 """Card utilities for poker."""
 
+import numpy as np
+
 SUIT_SYMBOLS = {"c": "♣", "d": "♦", "h": "♥", "s": "♠"}
 RANK_ORDER = "23456789TJQKA"
+# O(1) rank lookup in either case, replacing RANK_ORDER.index + .upper()
+# in the scoring hot path
+RANK_VALUE = {c: i for i, c in enumerate(RANK_ORDER)}
+RANK_VALUE.update({c.lower(): i for i, c in enumerate(RANK_ORDER)})
 
 # ANSI colors
 RESET = "\033[0m"
@@ -14,6 +20,21 @@ CYAN = "\033[96m"
 DIM = "\033[2m"
 
 
+# The 52 colored strings never change, so build them once at import
+# (under every rank/suit casing) and make pretty_card a dict lookup
+_PRETTY = {}
+for _rank in RANK_ORDER:
+    for _suit in "cdhs":
+        _colored = (
+            f"{RED}{_rank}{SUIT_SYMBOLS[_suit]}{RESET}"
+            if _suit in ("d", "h")
+            else f"{_rank}{SUIT_SYMBOLS[_suit]}"
+        )
+        for _r in (_rank, _rank.lower()):
+            for _s in (_suit, _suit.upper()):
+                _PRETTY[f"{_r}{_s}"] = _colored
+
+
 def pretty_card(card) -> str:
     """Convert card to pretty format with suit symbol."""
     card_str = str(card)
@@ -24,6 +45,10 @@ def pretty_card(card) -> str:
         end = card_str.rfind(")")
         card_str = card_str[start:end]
 
+    cached = _PRETTY.get(card_str)
+    if cached is not None:
+        return cached
+
     if len(card_str) >= 2:
         rank = card_str[:-1].upper()
         suit = card_str[-1].lower()
@@ -38,26 +63,43 @@ def format_cards(cards) -> str:
     """Format list of cards."""
     if not cards:
         return f"{DIM}[ ]{RESET}"
-    return "[" + " ".join(pretty_card(c) for c in cards) + "]"
-
-
-def score_hole_cards(c1: str, c2: str) -> int:
-    """Simple preflop hand strength (higher = better, max ~169)."""
-    r1 = c1[0].upper() if c1 else "2"
-    r2 = c2[0].upper() if c2 else "2"
-    s1 = c1[-1].lower() if len(c1) > 1 else "x"
-    s2 = c2[-1].lower() if len(c2) > 1 else "y"
+    return "[" + " ".join([pretty_card(c) for c in cards]) + "]"
 
-    v1 = RANK_ORDER.index(r1) if r1 in RANK_ORDER else 0
-    v2 = RANK_ORDER.index(r2) if r2 in RANK_ORDER else 0
 
+def _score_ranks(v1: int, v2: int, suited: bool) -> int:
+    """Preflop strength from rank indices; used to fill _SCORE_TABLE."""
     # Pairs are strong
-    if r1 == r2:
+    if v1 == v2:
         return 130 + v1 * 3
 
-    suited = 15 if s1 == s2 else 0
+    bonus = 15 if suited else 0
     high, low = max(v1, v2), min(v1, v2)
     gap = high - low
     connected = 10 if gap == 1 else 5 if gap == 2 else 0
 
-    return high * 8 + low * 2 + suited + connected
+    return high * 8 + low * 2 + bonus + connected
+
+
+# (rank1, rank2, suited) has only 13*13*2 inputs, so the scoring logic
+# runs once at import and every call becomes a single indexed load
+_SCORE_TABLE = np.empty((13, 13, 2), dtype=np.int16)
+for _i in range(13):
+    for _j in range(13):
+        _SCORE_TABLE[_i, _j, 0] = _score_ranks(_i, _j, False)
+        _SCORE_TABLE[_i, _j, 1] = _score_ranks(_i, _j, True)
+
+
+def score_hole_cards_fast(c1: str, c2: str) -> int:
+    """Table lookup for known-normalized card strings (e.g. 'Ah', 'Kd')."""
+    return int(
+        _SCORE_TABLE[RANK_VALUE[c1[0]], RANK_VALUE[c2[0]], 1 if c1[-1] == c2[-1] else 0]
+    )
+
+
+def score_hole_cards(c1: str, c2: str) -> int:
+    """Simple preflop hand strength (higher = better, max ~169)."""
+    v1 = RANK_VALUE.get(c1[0], 0) if c1 else 0
+    v2 = RANK_VALUE.get(c2[0], 0) if c2 else 0
+    s1 = c1[-1].lower() if len(c1) > 1 else "x"
+    s2 = c2[-1].lower() if len(c2) > 1 else "y"
+    return int(_SCORE_TABLE[v1, v2, 1 if s1 == s2 else 0])
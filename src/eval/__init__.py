@@ -4,8 +4,9 @@ from .hardware import HardwareConfig, Quantization
 from .config import EvalConfig, ModelConfig
 from .transformers_player import TransformersPlayer, ActionRecord
 from .metrics import MetricsCollector, HandResult
-from .game import EvalPokerGame
+from .game import BatchedSessionDriver, EvalPokerGame, EvalRunner
 from .openai_player import OpenAIPlayer
+from .vllm_player import VLLMPlayer
 from .observability import ActionTrace, ModelObservability, ObservabilityCollector
 from .prompt_builder import PromptBuilder, pretty_card, score_hole_cards, get_position_name
 
@@ -19,7 +20,10 @@ __all__ = [
     "MetricsCollector",
     "HandResult",
     "EvalPokerGame",
+    "BatchedSessionDriver",
+    "EvalRunner",
     "OpenAIPlayer",
+    "VLLMPlayer",
     "ActionTrace",
     "ModelObservability",
     "ObservabilityCollector",
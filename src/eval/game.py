@@ -1,9 +1,12 @@
 """Evaluation poker game - fully automated, no human input."""
 
-import random
-from typing import Callable, List, Optional
+import logging
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
-from pokerkit import Automation, NoLimitTexasHoldem
+import numpy as np
+from typing import Callable, Dict, Generator, List, Optional, Tuple
+
+from pokerkit import Automation, Deck, NoLimitTexasHoldem
 
 try:
     from ..actions import ParsedAction
@@ -16,10 +19,30 @@ except ImportError:
 from .metrics import HandResult, MetricsCollector
 from .transformers_player import TransformersPlayer
 
+logger = logging.getLogger(__name__)
+
 
 class EvalPokerGame:
     """Poker game for automated LLM evaluation."""
 
+    # Identical for every hand; built once instead of per create_state call
+    AUTOMATIONS = (
+        Automation.ANTE_POSTING,
+        Automation.BET_COLLECTION,
+        Automation.BLIND_OR_STRADDLE_POSTING,
+        Automation.CARD_BURNING,
+        Automation.HOLE_DEALING,
+        Automation.BOARD_DEALING,
+        Automation.HOLE_CARDS_SHOWING_OR_MUCKING,
+        Automation.HAND_KILLING,
+        Automation.CHIPS_PUSHING,
+        Automation.CHIPS_PULLING,
+    )
+
+    # The deck holds 52 distinct cards, so their string forms are
+    # interned once and shared by every game instance
+    _CARD_STR = {c: str(c) for c in Deck.STANDARD}
+
     def __init__(
         self,
         players: List[TransformersPlayer],
@@ -36,42 +59,86 @@ class EvalPokerGame:
         self.small_blind = small_blind
         self.big_blind = big_blind
 
-        self.stacks = [starting_stack] * self.num_players
+        # Array form keeps the end-of-hand stack diff vectorized
+        self.stacks = np.full(self.num_players, starting_stack, dtype=np.int32)
         self.button = 0
         self.hand_num = 0
+        self._blinds = (small_blind, big_blind)
+
+        # Position names depend only on seat count and button, so pick
+        # the ladder once and rebuild the per-seat table on each button
+        # advance instead of branching per actor per betting round
+        if self.num_players == 2:
+            positions = ["SB", "BB"]
+        elif self.num_players == 3:
+            positions = ["BTN", "SB", "BB"]
+        elif self.num_players <= 4:
+            positions = ["BTN", "CO", "SB", "BB"]
+        else:
+            positions = ["BTN", "CO", "HJ", "LJ", "SB", "BB"][: self.num_players]
+        self._positions = positions
+        self._pos_by_idx = self._build_position_table()
 
         self.metrics = metrics_collector or MetricsCollector()
+        self.metrics.register_players([p.name for p in players])
         self.verbose = verbose
+        if verbose:
+            # Per-action lines are DEBUG; formatting is lazy, so when the
+            # level filters them out no f-string is ever built
+            logging.basicConfig(format="%(message)s")
+            logger.setLevel(logging.DEBUG)
         self.progress_callback = progress_callback
 
     def play_session(self, num_hands: int = 100) -> MetricsCollector:
         """Play automated session."""
-        if self.verbose:
-            print(f"Starting evaluation: {num_hands} hands, {self.num_players} players")
-            for i, p in enumerate(self.players):
-                print(f"  Player {i}: {p.name}")
+        logger.info("Starting evaluation: %d hands, %d players", num_hands, self.num_players)
+        for i, p in enumerate(self.players):
+            logger.info("  Player %d: %s", i, p.name)
+
+        # Drive the step generator sequentially: answer each pending
+        # decision with a single get_action call. BatchedSessionDriver
+        # runs the same generator but batches the model calls.
+        steps = self.session_steps(num_hands)
+        try:
+            actor, request = next(steps)
+            while True:
+                action = self.players[actor].get_action(*request)
+                actor, request = steps.send(action)
+        except StopIteration:
+            pass
+
+        return self.metrics
+
+    def session_steps(
+        self, num_hands: int = 100
+    ) -> Generator[Tuple[int, tuple], ParsedAction, None]:
+        """
+        Drive the session as a generator for external decision-making.
 
+        Yields (actor_index, request) whenever a player must act, where
+        request is the positional-argument tuple for get_action, and
+        resumes on .send(ParsedAction). Finalizes metrics on exhaustion.
+        """
         for hand_idx in range(num_hands):
-            self._play_hand()
+            yield from self._hand_steps()
 
             # Progress callback
             if self.progress_callback:
                 self.progress_callback(hand_idx + 1, num_hands)
 
             # Check for bust players
-            active_players = sum(1 for s in self.stacks if s > 0)
+            active_players = int((self.stacks > 0).sum())
             if active_players < 2:
-                if self.verbose:
-                    print(f"Session ended: only {active_players} player(s) remaining")
+                logger.info("Session ended: only %d player(s) remaining", active_players)
                 break
 
         self._finalize_session()
-        return self.metrics
 
-    def _play_hand(self) -> None:
-        """Play single hand - fully automated."""
+    def _hand_steps(self) -> Generator[Tuple[int, tuple], ParsedAction, None]:
+        """Play single hand, yielding for each action decision."""
         self.hand_num += 1
         self.button = (self.button + 1) % self.num_players
+        self._pos_by_idx = self._build_position_table()
 
         # Set hand context for all players
         for player in self.players:
@@ -89,41 +156,38 @@ class EvalPokerGame:
         # Create PokerKit state
         try:
             state = NoLimitTexasHoldem.create_state(
-                automations=(
-                    Automation.ANTE_POSTING,
-                    Automation.BET_COLLECTION,
-                    Automation.BLIND_OR_STRADDLE_POSTING,
-                    Automation.CARD_BURNING,
-                    Automation.HOLE_DEALING,
-                    Automation.BOARD_DEALING,
-                    Automation.HOLE_CARDS_SHOWING_OR_MUCKING,
-                    Automation.HAND_KILLING,
-                    Automation.CHIPS_PUSHING,
-                    Automation.CHIPS_PULLING,
-                ),
+                automations=self.AUTOMATIONS,
                 ante_trimming_status=True,
                 raw_antes={-1: 0},
-                raw_blinds_or_straddles=(self.small_blind, self.big_blind),
+                raw_blinds_or_straddles=self._blinds,
                 min_bet=self.big_blind,
-                raw_starting_stacks=self.stacks.copy(),
+                raw_starting_stacks=self.stacks.tolist(),
                 player_count=self.num_players,
             )
         except Exception as e:
-            if self.verbose:
-                print(f"Error creating hand state: {e}")
+            logger.warning("Error creating hand state: %s", e)
             return
 
         # Get hole cards
+        card_str = self._CARD_STR
         hole_cards = []
         for i in range(self.num_players):
             cards = state.hole_cards[i]
             if cards and len(cards) >= 2:
-                hole_cards.append((str(cards[0]), str(cards[1])))
+                hole_cards.append(
+                    (
+                        card_str.get(cards[0], str(cards[0])),
+                        card_str.get(cards[1], str(cards[1])),
+                    )
+                )
             else:
                 hole_cards.append(("??", "??"))
 
         streets = ["preflop", "flop", "turn", "river"]
 
+        # Probe the state shape once per hand, not once per actor
+        has_pot = hasattr(state, 'total_pot_amount')
+
         for street in streets:
             if state.status is False:
                 break
@@ -136,69 +200,80 @@ class EvalPokerGame:
             board = list(state.board_cards)
 
             # Betting loop
-            board_strs = [str(c) for c in board]
+            board_strs = [card_str.get(c, str(c)) for c in board]
             while state.actor_index is not None:
                 actor = state.actor_index
                 player = self.players[actor]
 
-                # Get game state for player
-                pot = state.total_pot_amount if hasattr(state, 'total_pot_amount') else 0
-                current_bet = max(state.bets) if state.bets else 0
-                player_bet = state.bets[actor] if state.bets else 0
+                # Get game state for player; read state.bets once since
+                # each access walks a PokerKit property
+                pot = state.total_pot_amount if has_pot else 0
+                bets = state.bets
+                current_bet = max(bets) if bets else 0
+                player_bet = bets[actor] if bets else 0
                 to_call = current_bet - player_bet
                 stack = state.stacks[actor]
-                position = self._get_position_name(actor)
-
-                # Get action from player
-                action = player.get_action(
-                    hole_cards[actor], board_strs, pot, to_call, stack,
-                    position, self.num_players
+                position = self._pos_by_idx[actor]
+
+                # Suspend until the driver supplies this actor's decision
+                action = yield (
+                    actor,
+                    (
+                        hole_cards[actor], board_strs, pot, to_call, stack,
+                        position, self.num_players,
+                    ),
                 )
 
-                if self.verbose:
-                    print(f"  Hand {self.hand_num} | {street} | {player.name}: {action}")
+                logger.debug(
+                    "  Hand %d | %s | %s: %s", self.hand_num, street, player.name, action
+                )
 
                 # Execute action
                 self._execute_action(state, action)
 
-        # Update stacks
+        # Update stacks and diff against the start of the hand in one
+        # vectorized pass; losses sum to the pot
         if hasattr(state, 'stacks'):
-            for i in range(self.num_players):
-                self.stacks[i] = state.stacks[i]
-
-        # Calculate chip deltas
-        chip_deltas = [self.stacks[i] - starting_stacks[i] for i in range(self.num_players)]
+            self.stacks = np.asarray(state.stacks, dtype=np.int32)
+        delta = self.stacks - starting_stacks
+        pot_size = int(-delta[delta < 0].sum())
 
         # Determine winner(s)
-        winners = [self.players[i].name for i, delta in enumerate(chip_deltas) if delta > 0]
+        winners = [self.players[i].name for i in np.nonzero(delta > 0)[0]]
 
         # Log hand result
         hand_result = HandResult(
             hand_id=self.hand_num,
             player_names=[p.name for p in self.players],
-            starting_stacks=starting_stacks,
-            ending_stacks=self.stacks.copy(),
-            chip_deltas=chip_deltas,
-            hole_cards={p.name: hole_cards[i] for i, p in enumerate(self.players)},
-            board=[str(c) for c in board],
+            starting_stacks=starting_stacks.tolist(),
+            ending_stacks=self.stacks.tolist(),
+            chip_deltas=delta.tolist(),
+            hole_cards=hole_cards,
+            board=board_strs,
             winner_names=winners,
-            pot_size=sum(abs(d) for d in chip_deltas if d < 0),
+            pot_size=pot_size,
         )
         self.metrics.log_hand(hand_result)
 
+    # One dict lookup per action instead of a ladder of string compares;
+    # run for every decision of every hand in a session
+    _DISPATCH = {
+        "fold": lambda state, action: state.fold(),
+        "check": lambda state, action: state.check_or_call(),
+        "call": lambda state, action: state.check_or_call(),
+        "raise": lambda state, action: state.complete_bet_or_raise_to(action.amount),
+        "bet": lambda state, action: state.complete_bet_or_raise_to(action.amount),
+        "all_in": lambda state, action: state.complete_bet_or_raise_to(
+            state.stacks[state.actor_index] + state.bets[state.actor_index]
+        ),
+    }
+
     def _execute_action(self, state, action: ParsedAction) -> None:
         """Execute action on state with fallback chain."""
+        fn = self._DISPATCH.get(action.action_type)
         try:
-            if action.action_type == "fold":
-                state.fold()
-            elif action.action_type in ("check", "call"):
-                state.check_or_call()
-            elif action.action_type in ("raise", "bet"):
-                state.complete_bet_or_raise_to(action.amount)
-            elif action.action_type == "all_in":
-                actor = state.actor_index
-                stack = state.stacks[actor] + state.bets[actor]
-                state.complete_bet_or_raise_to(stack)
+            if fn is not None:
+                fn(state, action)
         except Exception:
             try:
                 state.check_or_call()
@@ -214,21 +289,128 @@ class EvalPokerGame:
             player_stats={p.name: p.get_stats() for p in self.players}
         )
 
-    def _get_position_name(self, idx: int) -> str:
-        """Get position name relative to button."""
-        positions_2 = ["SB", "BB"]
-        positions_3 = ["BTN", "SB", "BB"]
-        positions_4 = ["BTN", "CO", "SB", "BB"]
-        positions_6 = ["BTN", "CO", "HJ", "LJ", "SB", "BB"]
-
-        if self.num_players == 2:
-            positions = positions_2
-        elif self.num_players == 3:
-            positions = positions_3
-        elif self.num_players <= 4:
-            positions = positions_4
-        else:
-            positions = positions_6[:self.num_players]
-
-        rel_pos = (idx - self.button) % self.num_players
-        return positions[rel_pos] if rel_pos < len(positions) else f"P{idx}"
+    def _build_position_table(self) -> List[str]:
+        """Position name per seat index for the current button."""
+        positions = self._positions
+        table = []
+        for idx in range(self.num_players):
+            rel_pos = (idx - self.button) % self.num_players
+            table.append(positions[rel_pos] if rel_pos < len(positions) else f"P{idx}")
+        return table
+
+
+class BatchedSessionDriver:
+    """
+    Drive multiple EvalPokerGame instances concurrently, batching LLM calls.
+
+    Sequential evaluation serves the GPU one prompt at a time, which is
+    memory-bandwidth-bound during decode. The driver advances every table
+    via EvalPokerGame.session_steps, and each tick gathers all seats
+    waiting on a decision, groups them by player object, and issues one
+    get_action_batch call per shared player so prompts decode together.
+    Per-table stacks and state stay isolated; only the model is shared.
+    """
+
+    def __init__(self, games: List[EvalPokerGame]):
+        self.games = games
+        self._steps: List[Generator] = []
+        # Tables waiting on a decision: table index -> (actor, request)
+        self._waiting: Dict[int, Tuple[int, tuple]] = {}
+
+    def start(self, num_hands: int = 100) -> None:
+        """Start every table's session generator and collect first requests."""
+        self._steps = [game.session_steps(num_hands) for game in self.games]
+        self._waiting = {}
+        for idx, gen in enumerate(self._steps):
+            try:
+                self._waiting[idx] = next(gen)
+            except StopIteration:
+                pass
+
+    @property
+    def pending(self) -> bool:
+        """Whether any table is waiting on a decision."""
+        return bool(self._waiting)
+
+    def infer(self) -> List[Tuple[int, ParsedAction]]:
+        """
+        Answer the pending requests with the model(s); no game state is
+        touched, so this phase may run in a worker thread while another
+        driver's dispatch advances its tables.
+        """
+        # Group pending requests by the player object that must act,
+        # so tables sharing one model form a single batch
+        by_player: dict = {}
+        for idx, (actor, request) in self._waiting.items():
+            player = self.games[idx].players[actor]
+            by_player.setdefault(id(player), (player, []))[1].append((idx, request))
+
+        results: List[Tuple[int, ParsedAction]] = []
+        for player, items in by_player.values():
+            batch_fn = getattr(player, "get_action_batch", None)
+            if batch_fn is not None:
+                actions = batch_fn([request for _, request in items])
+            else:
+                actions = [player.get_action(*request) for _, request in items]
+            results.extend((idx, action) for (idx, _), action in zip(items, actions))
+        return results
+
+    def dispatch(self, results: List[Tuple[int, ParsedAction]]) -> None:
+        """Feed decisions back into the tables and collect new requests."""
+        self._waiting = {}
+        for idx, action in results:
+            try:
+                self._waiting[idx] = self._steps[idx].send(action)
+            except StopIteration:
+                pass
+
+    def run(self, num_hands: int = 100) -> List[MetricsCollector]:
+        """Play num_hands on every table; returns each table's metrics."""
+        self.start(num_hands)
+        while self.pending:
+            self.dispatch(self.infer())
+        return [game.metrics for game in self.games]
+
+
+class EvalRunner:
+    """
+    Pipeline many evaluation tables so CPU bookkeeping overlaps GPU decode.
+
+    A process pool pinned to CUDA streams does not fit here: the players
+    hold one in-process CUDA model that cannot be shipped to workers.
+    Instead the tables are split into cohorts, each driven by its own
+    BatchedSessionDriver, and a single inference worker thread serves one
+    cohort's batched model call while the main thread advances another
+    cohort's PokerKit state with the answers it already has. Generation
+    releases the GIL inside torch, so the two phases genuinely overlap.
+    """
+
+    def __init__(self, games: List[EvalPokerGame], num_cohorts: int = 2):
+        self.games = games
+        self.num_cohorts = max(1, min(num_cohorts, len(games)))
+
+    def run(self, num_hands: int = 100) -> List[MetricsCollector]:
+        """Play num_hands on every table; returns each table's metrics."""
+        cohorts = [
+            BatchedSessionDriver(self.games[i :: self.num_cohorts])
+            for i in range(self.num_cohorts)
+        ]
+
+        # One worker on purpose: the GPU runs one batch at a time anyway,
+        # and a single thread keeps each player's history appends serial
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            futures = {}
+            for cohort in cohorts:
+                cohort.start(num_hands)
+                if cohort.pending:
+                    futures[pool.submit(cohort.infer)] = cohort
+
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    cohort = futures.pop(future)
+                    cohort.dispatch(future.result())
+                    if cohort.pending:
+                        futures[pool.submit(cohort.infer)] = cohort
+
+        return [game.metrics for game in self.games]
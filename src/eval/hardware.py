@@ -1,5 +1,6 @@
 """Hardware detection and quantization configuration."""
 
+import functools
 import subprocess
 from dataclasses import dataclass
 from enum import Enum
@@ -23,29 +24,39 @@ class HardwareConfig:
     quantization: Quantization
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def detect(cls, override_quant: Optional[Quantization] = None) -> "HardwareConfig":
         """
         Auto-detect GPU and select appropriate quantization.
 
+        Detection queries torch.cuda in-process and the result is
+        memoized, so repeated calls (one per session or worker) cost a
+        cache hit instead of a process fork.
+
         Args:
             override_quant: Override auto-detected quantization level
 
         Returns:
             HardwareConfig with detected GPU and quantization settings
         """
-        try:
-            result = subprocess.run(
-                ["nvidia-smi", "--query-gpu=name,memory.total", "--format=csv,noheader,nounits"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            gpu_name, vram_mb = result.stdout.strip().split(", ")
-            vram_gb = float(vram_mb) / 1024
-        except (subprocess.CalledProcessError, FileNotFoundError, ValueError):
-            # Fallback for environments without nvidia-smi
-            gpu_name = "Unknown GPU"
-            vram_gb = 16.0  # Assume T4-like
+        if torch.cuda.is_available():
+            gpu_name = torch.cuda.get_device_name(0)
+            vram_gb = torch.cuda.get_device_properties(0).total_memory / (1024**3)
+        else:
+            # Last resort for torch builds without CUDA: fork nvidia-smi
+            try:
+                result = subprocess.run(
+                    ["nvidia-smi", "--query-gpu=name,memory.total", "--format=csv,noheader,nounits"],
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                )
+                gpu_name, vram_mb = result.stdout.strip().split(", ")
+                vram_gb = float(vram_mb) / 1024
+            except (subprocess.CalledProcessError, FileNotFoundError, ValueError):
+                # Fallback for environments without nvidia-smi
+                gpu_name = "Unknown GPU"
+                vram_gb = 16.0  # Assume T4-like
 
         # Select quantization based on GPU (can be overridden)
         if override_quant:
@@ -73,7 +84,7 @@ class HardwareConfig:
             return BitsAndBytesConfig(
                 load_in_4bit=True,
                 bnb_4bit_quant_type="nf4",
-                bnb_4bit_compute_dtype=torch.float16,
+                bnb_4bit_compute_dtype=self.get_torch_dtype(),
                 bnb_4bit_use_double_quant=True,
             )
         elif self.quantization == Quantization.INT8:
@@ -82,8 +93,10 @@ class HardwareConfig:
             return None
 
     def get_torch_dtype(self) -> torch.dtype:
-        """Get torch dtype for model loading."""
-        return torch.float16
+        """Get torch dtype for model loading (bf16 where the GPU supports it)."""
+        if torch.cuda.is_available() and torch.cuda.is_bf16_supported():
+            return torch.bfloat16
+        return torch.float16  # T4/V100 and older lack bf16
 
     def __str__(self) -> str:
         return f"{self.gpu_name} ({self.vram_gb:.0f}GB) - {self.quantization.value}"
@@ -1,9 +1,12 @@
 """Metrics collection for poker evaluation."""
 
-import json
 import time
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import orjson
 
 
 @dataclass
@@ -14,7 +17,9 @@ class HandResult:
     starting_stacks: List[int]
     ending_stacks: List[int]
     chip_deltas: List[int]
-    hole_cards: Dict[str, Tuple[str, str]]  # player_name -> (card1, card2)
+    # Seat-ordered, parallel to player_names; a name-keyed dict per hand
+    # was pure overhead re-encoding what the parallel list already says
+    hole_cards: List[Tuple[str, str]]
     board: List[str]
     winner_names: List[str]
     pot_size: int
@@ -33,40 +38,61 @@ class SessionSummary:
 class MetricsCollector:
     """Collects and aggregates poker evaluation metrics."""
 
-    def __init__(self, session_id: Optional[str] = None):
+    def __init__(
+        self,
+        session_id: Optional[str] = None,
+        keep_history: bool = True,
+        ring_size: int = 0,
+    ):
         self.session_id = session_id or f"session_{int(time.time())}"
-        self.hand_results: List[HandResult] = []
+        # Summary stats come from the running totals below, so the full
+        # hand history only matters for trace export. keep_history=False
+        # bounds memory on long runs, retaining the last ring_size hands
+        # (or none at all) instead of every HandResult
+        self.hand_results: Union[List[HandResult], deque] = (
+            [] if keep_history else deque(maxlen=ring_size)
+        )
+        self.total_hands = 0
         self.session_start: float = time.time()
         self.session_summary: Optional[SessionSummary] = None
+        # Running per-player totals [hands_played, hands_won, chip_delta],
+        # updated as hands are logged so finalize_session aggregates in
+        # O(players) instead of rescanning every HandResult per player
+        self._player_totals: Dict[str, List[int]] = {}
+
+    def register_players(self, names: List[str]) -> None:
+        """Declare the session roster up front.
+
+        Seeds the running totals so every registered player appears in
+        the final summary even if they never saw a hand (e.g. busted
+        before their first blind).
+        """
+        for name in names:
+            self._player_totals.setdefault(name, [0, 0, 0])
 
     def log_hand(self, result: HandResult) -> None:
         """Log a completed hand."""
+        self.total_hands += 1
         self.hand_results.append(result)
 
+        seen = set()
+        for idx, name in enumerate(result.player_names):
+            if name in seen:
+                continue
+            seen.add(name)
+            totals = self._player_totals.setdefault(name, [0, 0, 0])
+            totals[0] += 1
+            totals[1] += name in result.winner_names
+            totals[2] += result.chip_deltas[idx]
+
     def finalize_session(self, player_stats: Dict[str, dict]) -> SessionSummary:
         """Calculate final session statistics."""
         duration = time.time() - self.session_start
-        total_hands = len(self.hand_results)
+        total_hands = self.total_hands
 
-        # Calculate per-player summaries
+        # Per-player summaries from the running totals
         player_summaries = {}
-        player_names = set()
-        for hr in self.hand_results:
-            player_names.update(hr.player_names)
-
-        for name in player_names:
-            hands_played = 0
-            hands_won = 0
-            total_chip_delta = 0
-
-            for hr in self.hand_results:
-                if name in hr.player_names:
-                    idx = hr.player_names.index(name)
-                    hands_played += 1
-                    total_chip_delta += hr.chip_deltas[idx]
-                    if name in hr.winner_names:
-                        hands_won += 1
-
+        for name, (hands_played, hands_won, total_chip_delta) in self._player_totals.items():
             # Merge with player action stats
             action_stats = player_stats.get(name, {})
 
@@ -89,33 +115,26 @@ class MetricsCollector:
         return self.session_summary
 
     def to_dict(self) -> dict:
-        """Export metrics as dictionary."""
+        """Export metrics as an orjson-serializable dictionary.
+
+        hand_results and the summary are passed through as dataclasses;
+        orjson serializes them natively, which avoids rebuilding a
+        per-hand dict for every HandResult in large sessions.
+        """
         return {
             "session_id": self.session_id,
-            "hand_results": [
-                {
-                    "hand_id": hr.hand_id,
-                    "player_names": hr.player_names,
-                    "chip_deltas": hr.chip_deltas,
-                    "hole_cards": hr.hole_cards,
-                    "board": hr.board,
-                    "winner_names": hr.winner_names,
-                    "pot_size": hr.pot_size,
-                    "timestamp": hr.timestamp,
-                }
-                for hr in self.hand_results
-            ],
-            "summary": {
-                "total_hands": self.session_summary.total_hands,
-                "duration_seconds": self.session_summary.duration_seconds,
-                "hands_per_hour": self.session_summary.hands_per_hour,
-                "player_summaries": self.session_summary.player_summaries,
-            } if self.session_summary else None,
+            "hand_results": (
+                self.hand_results
+                if isinstance(self.hand_results, list)
+                else list(self.hand_results)
+            ),
+            "summary": self.session_summary,
         }
 
     def to_json(self, indent: int = 2) -> str:
-        """Export metrics as JSON string."""
-        return json.dumps(self.to_dict(), indent=indent)
+        """Export metrics as JSON string (orjson supports 2-space indent)."""
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(self.to_dict(), option=option).decode()
 
     def print_summary(self, big_blind: int = 100) -> None:
         """Print human-readable summary."""
@@ -135,10 +154,16 @@ class MetricsCollector:
         print(f"\n{'Model':<25} {'Hands':>8} {'Wins':>8} {'Win%':>8} {'BB/100':>10}")
         print("-" * 70)
 
-        for name, stats in sorted(
-            self.session_summary.player_summaries.items(),
-            key=lambda x: -x[1].get("bb_per_100", 0)
-        ):
+        summaries = self.session_summary.player_summaries
+        names = list(summaries)
+        bbs = np.fromiter(
+            (summaries[n].get("bb_per_100", 0) for n in names),
+            dtype=np.float32,
+            count=len(names),
+        )
+        for i in np.argsort(-bbs):
+            name = names[i]
+            stats = summaries[name]
             bb_per_100 = stats.get("total_chip_delta", 0) / max(stats.get("hands_played", 1), 1) * 100 / big_blind
             print(
                 f"{name:<25} "
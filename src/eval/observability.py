@@ -2,10 +2,40 @@
 
 import json
 import os
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import BinaryIO, Dict, List, Optional, Tuple
+
+import numpy as np
+import orjson
+
+try:
+    from ..actions import ActionKind, classify_action
+except ImportError:
+    import sys
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    from actions import ActionKind, classify_action
+
+# Bit flags describing one recorded action; the combination indexes a
+# single histogram bump so record_action does one counter store instead
+# of one per condition
+PARSE_TAG = 1
+PARSE_REGEX = 2
+PARSE_DEFAULT = 4
+EMPTY_RESP = 8
+TIMEOUT_ERR = 16
+API_ERR = 32
+FALLBACK_EXEC = 64
+
+_PARSE_FLAG = {
+    "tag": PARSE_TAG,
+    "regex_fold": PARSE_REGEX,
+    "regex_call": PARSE_REGEX,
+    "regex_raise": PARSE_REGEX,
+    "regex_allin": PARSE_REGEX,
+    "default": PARSE_DEFAULT,
+}
 
 
 @dataclass
@@ -51,31 +81,80 @@ class ModelObservability:
     model_name: str
     total_actions: int = 0
 
-    # Parsing quality
-    valid_tag_parses: int = 0
-    regex_fallback_parses: int = 0
-    default_fallback_parses: int = 0
+    # Parse quality, response quality, and execution fallbacks all land
+    # in one histogram indexed by the bit-flag combination for the
+    # action; named access goes through the properties below
+    flag_hist: np.ndarray = field(default_factory=lambda: np.zeros(128, dtype=np.int64))
 
-    # Action execution
-    action_execution_failures: int = 0
+    # Action distribution, indexed by ActionKind
+    action_counts: np.ndarray = field(default_factory=lambda: np.zeros(5, dtype=np.int64))
 
-    # Response quality
-    empty_responses: int = 0
-    timeout_errors: int = 0
-    api_errors: int = 0
+    _FLAG_IDX = np.arange(128)
 
-    # Action distribution
-    fold_count: int = 0
-    check_count: int = 0
-    call_count: int = 0
-    raise_count: int = 0
-    all_in_count: int = 0
-
-    # Performance
-    latencies: List[float] = field(default_factory=list)
+    # Performance: latencies go into a log-bucketed histogram so both
+    # recording and percentile queries stay O(1)-ish regardless of how
+    # many actions a session accumulates
+    latency_hist: np.ndarray = field(default_factory=lambda: np.zeros(256, dtype=np.uint32))
+    latency_sum: float = 0.0
+    latency_count: int = 0
     total_tokens_input: int = 0
     total_tokens_output: int = 0
 
+    # 256 buckets log-spaced from 1ms to 60s; shared across instances
+    LATENCY_EDGES = np.geomspace(1.0, 60_000.0, 257)
+
+    def _flag_total(self, bit: int) -> int:
+        """Total actions whose flag combination includes the given bit."""
+        return int(self.flag_hist[(self._FLAG_IDX & bit) != 0].sum())
+
+    @property
+    def valid_tag_parses(self) -> int:
+        return self._flag_total(PARSE_TAG)
+
+    @property
+    def regex_fallback_parses(self) -> int:
+        return self._flag_total(PARSE_REGEX)
+
+    @property
+    def default_fallback_parses(self) -> int:
+        return self._flag_total(PARSE_DEFAULT)
+
+    @property
+    def empty_responses(self) -> int:
+        return self._flag_total(EMPTY_RESP)
+
+    @property
+    def timeout_errors(self) -> int:
+        return self._flag_total(TIMEOUT_ERR)
+
+    @property
+    def api_errors(self) -> int:
+        return self._flag_total(API_ERR)
+
+    @property
+    def action_execution_failures(self) -> int:
+        return self._flag_total(FALLBACK_EXEC)
+
+    @property
+    def fold_count(self) -> int:
+        return int(self.action_counts[ActionKind.FOLD])
+
+    @property
+    def check_count(self) -> int:
+        return int(self.action_counts[ActionKind.CHECK])
+
+    @property
+    def call_count(self) -> int:
+        return int(self.action_counts[ActionKind.CALL])
+
+    @property
+    def raise_count(self) -> int:
+        return int(self.action_counts[ActionKind.RAISE])
+
+    @property
+    def all_in_count(self) -> int:
+        return int(self.action_counts[ActionKind.ALL_IN])
+
     @property
     def parse_error_rate(self) -> float:
         """Rate of actions that required fallback parsing."""
@@ -95,28 +174,35 @@ class ModelObservability:
         """Total malformed responses."""
         return self.empty_responses + self.default_fallback_parses
 
+    def record_latency(self, latency_ms: float) -> None:
+        """Add one latency sample to the histogram."""
+        bucket = int(np.searchsorted(self.LATENCY_EDGES, latency_ms)) - 1
+        self.latency_hist[min(max(bucket, 0), 255)] += 1
+        self.latency_sum += latency_ms
+        self.latency_count += 1
+
+    def _latency_percentile(self, q: float) -> float:
+        """Percentile from the histogram, to bucket resolution."""
+        if self.latency_count == 0:
+            return 0.0
+        cumulative = np.cumsum(self.latency_hist)
+        idx = int(np.searchsorted(cumulative, q * self.latency_count))
+        return float(self.LATENCY_EDGES[min(idx + 1, 256)])
+
     @property
     def avg_latency_ms(self) -> float:
         """Average latency in milliseconds."""
-        return sum(self.latencies) / len(self.latencies) if self.latencies else 0.0
+        return self.latency_sum / self.latency_count if self.latency_count else 0.0
 
     @property
     def p50_latency_ms(self) -> float:
-        """Median latency."""
-        if not self.latencies:
-            return 0.0
-        sorted_lat = sorted(self.latencies)
-        mid = len(sorted_lat) // 2
-        return sorted_lat[mid]
+        """Median latency (bucket resolution)."""
+        return self._latency_percentile(0.50)
 
     @property
     def p99_latency_ms(self) -> float:
-        """99th percentile latency."""
-        if not self.latencies:
-            return 0.0
-        sorted_lat = sorted(self.latencies)
-        idx = int(len(sorted_lat) * 0.99)
-        return sorted_lat[min(idx, len(sorted_lat) - 1)]
+        """99th percentile latency (bucket resolution)."""
+        return self._latency_percentile(0.99)
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
@@ -159,13 +245,33 @@ class ModelObservability:
 class ObservabilityCollector:
     """Collects traces and computes metrics for model evaluation."""
 
-    def __init__(self, output_dir: str = "tournament_results"):
+    def __init__(self, output_dir: str = "tournament_results", keep_traces: bool = False):
         self.output_dir = Path(output_dir)
         self.traces_dir = self.output_dir / "observability" / "traces"
         self.traces_dir.mkdir(parents=True, exist_ok=True)
 
+        # Traces are appended to per-model JSONL files as they happen,
+        # so nothing accumulates in memory and there is no O(N) flush at
+        # the end of a matchup; pass keep_traces=True to also retain the
+        # ActionTrace objects for in-process inspection
+        self.keep_traces = keep_traces
         self.traces: Dict[str, List[ActionTrace]] = {}  # model_name -> traces
         self.metrics: Dict[str, ModelObservability] = {}  # model_name -> metrics
+        self._files: Dict[str, BinaryIO] = {}  # model_name -> open trace file
+        self._file_paths: Dict[str, Path] = {}
+
+    def _trace_file(self, model_name: str) -> BinaryIO:
+        """Get (lazily opening) the append handle for a model's traces."""
+        f = self._files.get(model_name)
+        if f is None:
+            safe_name = model_name.replace("/", "_").replace(" ", "_")
+            # Provisional name; write_traces renames it once the
+            # matchup id is known
+            path = self.traces_dir / f"{safe_name}_current.jsonl.part"
+            f = open(path, "ab", buffering=1 << 20)
+            self._files[model_name] = f
+            self._file_paths[model_name] = path
+        return f
 
     def record_action(
         self,
@@ -192,36 +298,38 @@ class ObservabilityCollector:
         tokens_output: int = 0,
     ) -> None:
         """Record a single action trace and update metrics."""
-        # Create trace
-        trace = ActionTrace(
-            timestamp=datetime.now().isoformat(),
-            hand_id=hand_id,
-            street=street,
-            model_name=model_name,
-            hole_cards=hole_cards,
-            board=board,
-            pot=pot,
-            to_call=to_call,
-            stack=stack,
-            position=position,
-            prompt=prompt,
-            raw_response=raw_response,
-            thinking=thinking,
-            parsed_action=parsed_action,
-            parsed_amount=parsed_amount,
-            parse_method=parse_method,
-            parse_error=parse_error,
-            executed_action=executed_action,
-            fallback_used=fallback_used,
-            latency_ms=latency_ms,
-            tokens_input=tokens_input,
-            tokens_output=tokens_output,
-        )
-
-        # Store trace
-        if model_name not in self.traces:
-            self.traces[model_name] = []
-        self.traces[model_name].append(trace)
+        # Serialize straight to the per-model JSONL file; orjson encodes
+        # the dict in C and the tuple of hole cards becomes a JSON array
+        trace_dict = {
+            "timestamp": datetime.now().isoformat(),
+            "hand_id": hand_id,
+            "street": street,
+            "model_name": model_name,
+            "hole_cards": hole_cards,
+            "board": board,
+            "pot": pot,
+            "to_call": to_call,
+            "stack": stack,
+            "position": position,
+            "prompt": prompt,
+            "raw_response": raw_response,
+            "thinking": thinking,
+            "parsed_action": parsed_action,
+            "parsed_amount": parsed_amount,
+            "parse_method": parse_method,
+            "parse_error": parse_error,
+            "executed_action": executed_action,
+            "fallback_used": fallback_used,
+            "latency_ms": latency_ms,
+            "tokens_input": tokens_input,
+            "tokens_output": tokens_output,
+        }
+        self._trace_file(model_name).write(orjson.dumps(trace_dict) + b"\n")
+
+        if self.keep_traces:
+            if model_name not in self.traces:
+                self.traces[model_name] = []
+            self.traces[model_name].append(ActionTrace(**trace_dict))
 
         # Update metrics
         if model_name not in self.metrics:
@@ -229,55 +337,41 @@ class ObservabilityCollector:
         metrics = self.metrics[model_name]
 
         metrics.total_actions += 1
-        metrics.latencies.append(latency_ms)
+        metrics.record_latency(latency_ms)
         metrics.total_tokens_input += tokens_input
         metrics.total_tokens_output += tokens_output
 
-        # Parsing quality
-        if parse_method == "tag":
-            metrics.valid_tag_parses += 1
-        elif parse_method.startswith("regex"):
-            metrics.regex_fallback_parses += 1
-        elif parse_method == "default":
-            metrics.default_fallback_parses += 1
-
-        # Response quality
-        if not raw_response or raw_response.strip() == "":
-            metrics.empty_responses += 1
-        if parse_error and "timeout" in parse_error.lower():
-            metrics.timeout_errors += 1
-        if parse_error and "api" in parse_error.lower():
-            metrics.api_errors += 1
-
-        # Execution
+        # Fold parse quality, response quality, and execution fallback
+        # into one flags int and bump a single histogram slot
+        flags = _PARSE_FLAG.get(parse_method, 0)
+        if flags == 0 and parse_method.startswith("regex"):
+            flags = PARSE_REGEX
+        if not raw_response or raw_response.isspace():
+            flags |= EMPTY_RESP
+        if parse_error:
+            error_lower = parse_error.lower()
+            if "timeout" in error_lower:
+                flags |= TIMEOUT_ERR
+            if "api" in error_lower:
+                flags |= API_ERR
         if fallback_used:
-            metrics.action_execution_failures += 1
-
-        # Action distribution
-        action_lower = executed_action.lower()
-        if action_lower == "fold":
-            metrics.fold_count += 1
-        elif action_lower == "check":
-            metrics.check_count += 1
-        elif action_lower == "call":
-            metrics.call_count += 1
-        elif action_lower == "raise":
-            metrics.raise_count += 1
-        elif action_lower == "all_in":
-            metrics.all_in_count += 1
+            flags |= FALLBACK_EXEC
+        metrics.flag_hist[flags] += 1
+
+        # Action distribution: classify once, bump the indexed counter
+        kind = classify_action(executed_action.lower())
+        if kind is not None:
+            metrics.action_counts[kind] += 1
 
     def write_traces(self, matchup_id: str) -> None:
-        """Write traces to JSONL files."""
-        for model_name, traces in self.traces.items():
+        """Close trace files and rename them for this matchup."""
+        for model_name, f in self._files.items():
+            f.close()
             safe_name = model_name.replace("/", "_").replace(" ", "_")
-            filepath = self.traces_dir / f"{safe_name}_{matchup_id}.jsonl"
-
-            with open(filepath, "w") as f:
-                for trace in traces:
-                    # Convert dataclass to dict, handling tuples
-                    trace_dict = asdict(trace)
-                    trace_dict["hole_cards"] = list(trace.hole_cards)
-                    f.write(json.dumps(trace_dict) + "\n")
+            final_path = self.traces_dir / f"{safe_name}_{matchup_id}.jsonl"
+            os.replace(self._file_paths[model_name], final_path)
+        self._files = {}
+        self._file_paths = {}
 
     def get_metrics(self, model_name: str) -> Optional[ModelObservability]:
         """Get metrics for a specific model."""
@@ -324,6 +418,14 @@ class ObservabilityCollector:
                   f"call={m.call_count}, raise={m.raise_count}, all_in={m.all_in_count}")
 
     def clear(self) -> None:
-        """Clear all traces and metrics."""
+        """Clear all traces and metrics, discarding unwritten trace files."""
+        for model_name, f in self._files.items():
+            f.close()
+            try:
+                os.remove(self._file_paths[model_name])
+            except OSError:
+                pass
+        self._files = {}
+        self._file_paths = {}
         self.traces = {}
         self.metrics = {}
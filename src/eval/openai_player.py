@@ -1,22 +1,37 @@
 """OpenAI API-based player for poker evaluation."""
 
+import asyncio
 import os
+import random
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import List, Optional, Tuple
 
 try:
-    from openai import OpenAI
+    from openai import (
+        APIConnectionError,
+        APITimeoutError,
+        AsyncOpenAI,
+        InternalServerError,
+        OpenAI,
+        RateLimitError,
+    )
+
+    # Transient failures worth retrying; auth/bad-request errors are not
+    RETRYABLE_ERRORS = (RateLimitError, APITimeoutError, APIConnectionError, InternalServerError)
 except ImportError:
     OpenAI = None
+    AsyncOpenAI = None
+    RETRYABLE_ERRORS = ()
 
 try:
-    from ..actions import ParsedAction, ActionParser
+    from ..actions import ActionKind, ParsedAction, ActionParser
 except ImportError:
     import sys
     from pathlib import Path
     sys.path.insert(0, str(Path(__file__).parent.parent))
-    from actions import ParsedAction, ActionParser
+    from actions import ActionKind, ParsedAction, ActionParser
 
 
 @dataclass
@@ -36,6 +51,7 @@ class ActionRecord:
     latency_ms: float
     tokens_input: int
     tokens_output: int
+    retries: int = 0
 
 
 class OpenAIPlayer:
@@ -67,6 +83,9 @@ Think step by step, then output exactly ONE action tag."""
         api_key: Optional[str] = None,
         temperature: float = 0.6,
         max_tokens: int = 512,
+        max_concurrency: int = 8,
+        max_retries: int = 3,
+        cache_size: int = 4096,
     ):
         if OpenAI is None:
             raise ImportError("openai package not installed. Run: pip install openai")
@@ -75,19 +94,47 @@ Think step by step, then output exactly ONE action tag."""
         self.model = model
         self.temperature = temperature
         self.max_tokens = max_tokens
-
-        # Initialize client with API key from param or env
-        self.client = OpenAI(api_key=api_key or os.environ.get("OPENAI_API_KEY"))
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        # Exponential backoff: base * 2**attempt, capped, plus jitter
+        self.retry_base_s = 1.0
+        self.retry_cap_s = 30.0
+        # Stream completions and stop at </action>; cleared on the first
+        # provider that rejects stream_options={"include_usage": True}
+        self._use_streaming = True
+
+        # One frozen system message reused verbatim on every call, so the
+        # request prefix stays byte-identical and server-side prompt
+        # caching (OpenAI/Azure prefix caching) can kick in
+        self._system_msg = {"role": "system", "content": self.SYSTEM_PROMPT}
+
+        # Initialize clients with API key from param or env. The sync
+        # client serves one-off calls; the async one fans out batches.
+        key = api_key or os.environ.get("OPENAI_API_KEY")
+        self.client = OpenAI(api_key=key)
+        self.aclient = AsyncOpenAI(api_key=key)
 
         self.parser = ActionParser()
         self.action_history: List[ActionRecord] = []
         self._hand_id = 0
         self._street = "preflop"
 
+        # Running stats counters updated as records are appended, so
+        # get_stats is pure O(1) arithmetic no matter how often a
+        # dashboard polls it
+        self._reset_counters()
+
         # Cost tracking
         self.total_input_tokens = 0
         self.total_output_tokens = 0
 
+        # Bounded LRU of (state key) -> (action, thinking, response).
+        # Replays hit identical states often; a hit skips the API call
+        # entirely. Only successful decisions are cached
+        self.cache_size = cache_size
+        self.cache_hits = 0
+        self._action_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+
     def set_hand_context(self, hand_id: int, street: str) -> None:
         """Set context for action logging."""
         self._hand_id = hand_id
@@ -106,25 +153,32 @@ Think step by step, then output exactly ONE action tag."""
         """Get action via OpenAI API."""
         start = time.perf_counter()
 
+        key = (hole_cards, tuple(board), pot, to_call, stack, position, num_players)
+        hit = self._cache_lookup(key)
+        if hit is not None:
+            return self._cached_record(key, hit, (time.perf_counter() - start) * 1000)
+
         user_msg = self._build_prompt(
             hole_cards, board, pot, to_call, stack, position, num_players
         )
 
         try:
-            response_text, tokens_in, tokens_out = self._call_api(user_msg)
+            response_text, tokens_in, tokens_out, retries = self._call_api(user_msg)
             can_check = to_call == 0
             action = self.parser.parse(response_text, can_check, stack)
             thinking = ""  # OpenAI doesn't have explicit thinking blocks
+            self._cache_store(key, (action, thinking, response_text))
         except Exception as e:
             response_text = f"ERROR: {e}"
             tokens_in = 0
             tokens_out = 0
+            retries = self.max_retries if isinstance(e, RETRYABLE_ERRORS) else 0
             action = ParsedAction("fold")
             thinking = ""
 
         latency = (time.perf_counter() - start) * 1000
 
-        self.action_history.append(ActionRecord(
+        self._append_record(ActionRecord(
             hand_id=self._hand_id,
             street=self._street,
             hole_cards=hole_cards,
@@ -139,10 +193,98 @@ Think step by step, then output exactly ONE action tag."""
             latency_ms=latency,
             tokens_input=tokens_in,
             tokens_output=tokens_out,
+            retries=retries,
         ))
 
         return action
 
+    async def aget_action(
+        self,
+        hole_cards: Tuple[str, str],
+        board: List[str],
+        pot: int,
+        to_call: int,
+        stack: int,
+        position: str,
+        num_players: int,
+    ) -> ParsedAction:
+        """Get action via the async OpenAI client (mirrors get_action)."""
+        start = time.perf_counter()
+
+        key = (hole_cards, tuple(board), pot, to_call, stack, position, num_players)
+        hit = self._cache_lookup(key)
+        if hit is not None:
+            return self._cached_record(key, hit, (time.perf_counter() - start) * 1000)
+
+        user_msg = self._build_prompt(
+            hole_cards, board, pot, to_call, stack, position, num_players
+        )
+
+        try:
+            response_text, tokens_in, tokens_out, retries = await self._acall_api(user_msg)
+            can_check = to_call == 0
+            action = self.parser.parse(response_text, can_check, stack)
+            thinking = ""  # OpenAI doesn't have explicit thinking blocks
+            self._cache_store(key, (action, thinking, response_text))
+        except Exception as e:
+            response_text = f"ERROR: {e}"
+            tokens_in = 0
+            tokens_out = 0
+            retries = self.max_retries if isinstance(e, RETRYABLE_ERRORS) else 0
+            action = ParsedAction("fold")
+            thinking = ""
+
+        latency = (time.perf_counter() - start) * 1000
+
+        self._append_record(ActionRecord(
+            hand_id=self._hand_id,
+            street=self._street,
+            hole_cards=hole_cards,
+            board=list(board),
+            pot=pot,
+            to_call=to_call,
+            stack=stack,
+            position=position,
+            action=action,
+            thinking=thinking,
+            response=response_text[:500],
+            latency_ms=latency,
+            tokens_input=tokens_in,
+            tokens_output=tokens_out,
+            retries=retries,
+        ))
+
+        return action
+
+    async def aget_actions(self, states: List[dict]) -> List[ParsedAction]:
+        """
+        Decide several concurrent seats' actions with overlapping API calls.
+
+        Each state dict holds get_action keyword arguments for one seat.
+        Requests fan out via asyncio.gather so wall-clock time is one
+        round-trip instead of len(states); the semaphore caps in-flight
+        requests at max_concurrency to stay under rate limits.
+        """
+        sem = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(state: dict) -> ParsedAction:
+            async with sem:
+                return await self.aget_action(**state)
+
+        return list(await asyncio.gather(*(run(s) for s in states)))
+
+    def get_action_batch(self, contexts: List[tuple]) -> List[ParsedAction]:
+        """
+        Sync batched entry point, as used by BatchedSessionDriver.
+
+        contexts is a list of get_action positional-argument tuples, one
+        per seat. Runs a one-off event loop over aget_actions so callers
+        that aren't async still get concurrent API calls.
+        """
+        keys = ("hole_cards", "board", "pot", "to_call", "stack", "position", "num_players")
+        states = [dict(zip(keys, ctx)) for ctx in contexts]
+        return asyncio.run(self.aget_actions(states))
+
     def get_action_with_prompt(
         self,
         prompt_text: str,
@@ -157,7 +299,7 @@ Think step by step, then output exactly ONE action tag."""
         start = time.perf_counter()
 
         try:
-            response_text, tokens_in, tokens_out = self._call_api(prompt_text)
+            response_text, tokens_in, tokens_out, retries = self._call_api(prompt_text)
             can_check = to_call == 0
             action = self.parser.parse(response_text, can_check, stack)
             thinking = ""  # OpenAI doesn't have explicit thinking blocks
@@ -165,12 +307,13 @@ Think step by step, then output exactly ONE action tag."""
             response_text = f"ERROR: {e}"
             tokens_in = 0
             tokens_out = 0
+            retries = self.max_retries if isinstance(e, RETRYABLE_ERRORS) else 0
             action = ParsedAction("fold")
             thinking = ""
 
         latency = (time.perf_counter() - start) * 1000
 
-        self.action_history.append(ActionRecord(
+        self._append_record(ActionRecord(
             hand_id=self._hand_id,
             street=self._street,
             hole_cards=hole_cards,
@@ -185,6 +328,7 @@ Think step by step, then output exactly ONE action tag."""
             latency_ms=latency,
             tokens_input=tokens_in,
             tokens_output=tokens_out,
+            retries=retries,
         ))
 
         return action
@@ -216,14 +360,121 @@ To Call: {to_call}
 
 What is your action?"""
 
-    def _call_api(self, user_msg: str) -> Tuple[str, int, int]:
-        """Call OpenAI API. Returns (response_text, input_tokens, output_tokens)."""
+    def _retry_sleep(self, attempt: int) -> float:
+        """Exponential backoff with jitter for retry attempt N (0-based)."""
+        return min(self.retry_cap_s, self.retry_base_s * 2**attempt) + random.uniform(
+            0, self.retry_base_s
+        )
+
+    def _reset_counters(self) -> None:
+        """Zero the running stats counters."""
+        self._sum_latency = 0.0
+        self._sum_tokens = 0
+        self._n_preflop = 0
+        self._n_vpip = 0
+        self._n_pfr = 0
+        self._n_bets_raises = 0
+        self._n_calls = 0
+        self._n_folds = 0
+
+    def _append_record(self, record: ActionRecord) -> None:
+        """Append a record and update the running stats counters."""
+        self.action_history.append(record)
+        self._sum_latency += record.latency_ms
+        self._sum_tokens += record.tokens_output
+        if record.street == "preflop":
+            self._n_preflop += 1
+
+        # ActionKind is ordered FOLD < CHECK < CALL < RAISE < ALL_IN;
+        # quit/error actions classify to None and only count toward the
+        # denominators, matching the old per-metric filters
+        kind = record.action.kind
+        if kind is None:
+            return
+        if record.street == "preflop":
+            if kind >= ActionKind.CALL:
+                self._n_vpip += 1
+            if kind >= ActionKind.RAISE:
+                self._n_pfr += 1
+        if kind >= ActionKind.RAISE:
+            self._n_bets_raises += 1
+        elif kind == ActionKind.CALL:
+            self._n_calls += 1
+        elif kind == ActionKind.FOLD:
+            self._n_folds += 1
+
+    def _cache_lookup(self, key: tuple) -> Optional[tuple]:
+        """Look up a decision, refreshing its LRU position on a hit."""
+        hit = self._action_cache.get(key)
+        if hit is not None:
+            self._action_cache.move_to_end(key)
+            self.cache_hits += 1
+        return hit
+
+    def _cache_store(self, key: tuple, value: tuple) -> None:
+        """Store a decision, evicting the least recently used past cache_size."""
+        self._action_cache[key] = value
+        self._action_cache.move_to_end(key)
+        if len(self._action_cache) > self.cache_size:
+            self._action_cache.popitem(last=False)
+
+    def _cached_record(self, key: tuple, hit: tuple, latency: float) -> ParsedAction:
+        """Append an ActionRecord for a cache hit so stats stay correct."""
+        action, thinking, response_text = hit
+        hole_cards, board, pot, to_call, stack, position, _ = key
+        self._append_record(ActionRecord(
+            hand_id=self._hand_id,
+            street=self._street,
+            hole_cards=hole_cards,
+            board=list(board),
+            pot=pot,
+            to_call=to_call,
+            stack=stack,
+            position=position,
+            action=action,
+            thinking=thinking,
+            response=response_text[:500],
+            latency_ms=latency,
+            tokens_input=0,
+            tokens_output=0,
+        ))
+        return action
+
+    def _messages(self, user_msg: str) -> List[dict]:
+        """Chat messages for one decision."""
+        return [
+            self._system_msg,
+            {"role": "user", "content": user_msg},
+        ]
+
+    def _approx_usage(
+        self, user_msg: str, content: str, tokens_in: int, tokens_out: int
+    ) -> Tuple[int, int]:
+        """
+        Fill in usage when the stream was closed before the usage chunk.
+
+        Early stop cancels generation before the final include_usage
+        chunk arrives, so approximate at ~4 chars/token to keep the
+        cumulative cost tracking meaningful.
+        """
+        if tokens_in == 0:
+            tokens_in = (len(self.SYSTEM_PROMPT) + len(user_msg)) // 4
+        if tokens_out == 0 and content:
+            tokens_out = max(1, len(content) // 4)
+        return tokens_in, tokens_out
+
+    def _complete(self, user_msg: str) -> Tuple[str, int, int]:
+        """One completion attempt. Returns (response_text, input_tokens, output_tokens)."""
+        if self._use_streaming:
+            try:
+                return self._complete_streaming(user_msg)
+            except TypeError:
+                # SDK/provider without stream_options support
+                self._use_streaming = False
+
         response = self.client.chat.completions.create(
             model=self.model,
-            messages=[
-                {"role": "system", "content": self.SYSTEM_PROMPT},
-                {"role": "user", "content": user_msg},
-            ],
+            messages=self._messages(user_msg),
             temperature=self.temperature,
             max_tokens=self.max_tokens,
         )
@@ -231,40 +482,169 @@ What is your action?"""
         content = response.choices[0].message.content or ""
         tokens_in = response.usage.prompt_tokens if response.usage else 0
         tokens_out = response.usage.completion_tokens if response.usage else 0
+        return content, tokens_in, tokens_out
+
+    def _complete_streaming(self, user_msg: str) -> Tuple[str, int, int]:
+        """
+        Stream one completion, stopping as soon as </action> arrives.
+
+        Only the action tag matters to the parser, so closing the stream
+        at the closing tag cancels the rest of the "think step by step"
+        output — saving both latency and billed output tokens.
+        """
+        stream = self.client.chat.completions.create(
+            model=self.model,
+            messages=self._messages(user_msg),
+            temperature=self.temperature,
+            max_tokens=self.max_tokens,
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+
+        parts: List[str] = []
+        tail = ""
+        tokens_in = 0
+        tokens_out = 0
+        try:
+            for chunk in stream:
+                if chunk.usage:
+                    tokens_in = chunk.usage.prompt_tokens
+                    tokens_out = chunk.usage.completion_tokens
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                parts.append(delta)
+                # The tag can straddle chunk boundaries, so scan a short
+                # rolling tail instead of the whole accumulated text
+                tail = (tail + delta)[-24:]
+                if "</action>" in tail:
+                    break
+        finally:
+            stream.close()
+
+        content = "".join(parts)
+        tokens_in, tokens_out = self._approx_usage(user_msg, content, tokens_in, tokens_out)
+        return content, tokens_in, tokens_out
+
+    def _call_api(self, user_msg: str) -> Tuple[str, int, int, int]:
+        """
+        Call OpenAI API. Returns (response_text, input_tokens, output_tokens, retries).
+
+        Transient failures (rate limit, timeout, connection, 5xx) are
+        retried up to max_retries with exponential backoff and jitter;
+        non-retryable errors (auth, bad request) propagate immediately.
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                content, tokens_in, tokens_out = self._complete(user_msg)
+                break
+            except RETRYABLE_ERRORS:
+                if attempt >= self.max_retries:
+                    raise
+                time.sleep(self._retry_sleep(attempt))
 
         # Track cumulative usage
         self.total_input_tokens += tokens_in
         self.total_output_tokens += tokens_out
 
+        return content, tokens_in, tokens_out, attempt
+
+    async def _acomplete(self, user_msg: str) -> Tuple[str, int, int]:
+        """Async mirror of _complete."""
+        if self._use_streaming:
+            try:
+                return await self._acomplete_streaming(user_msg)
+            except TypeError:
+                # SDK/provider without stream_options support
+                self._use_streaming = False
+
+        response = await self.aclient.chat.completions.create(
+            model=self.model,
+            messages=self._messages(user_msg),
+            temperature=self.temperature,
+            max_tokens=self.max_tokens,
+        )
+
+        content = response.choices[0].message.content or ""
+        tokens_in = response.usage.prompt_tokens if response.usage else 0
+        tokens_out = response.usage.completion_tokens if response.usage else 0
+        return content, tokens_in, tokens_out
+
+    async def _acomplete_streaming(self, user_msg: str) -> Tuple[str, int, int]:
+        """Async mirror of _complete_streaming."""
+        stream = await self.aclient.chat.completions.create(
+            model=self.model,
+            messages=self._messages(user_msg),
+            temperature=self.temperature,
+            max_tokens=self.max_tokens,
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+
+        parts: List[str] = []
+        tail = ""
+        tokens_in = 0
+        tokens_out = 0
+        try:
+            async for chunk in stream:
+                if chunk.usage:
+                    tokens_in = chunk.usage.prompt_tokens
+                    tokens_out = chunk.usage.completion_tokens
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                parts.append(delta)
+                tail = (tail + delta)[-24:]
+                if "</action>" in tail:
+                    break
+        finally:
+            await stream.close()
+
+        content = "".join(parts)
+        tokens_in, tokens_out = self._approx_usage(user_msg, content, tokens_in, tokens_out)
         return content, tokens_in, tokens_out
 
+    async def _acall_api(self, user_msg: str) -> Tuple[str, int, int, int]:
+        """Async mirror of _call_api, including its retry policy."""
+        for attempt in range(self.max_retries + 1):
+            try:
+                content, tokens_in, tokens_out = await self._acomplete(user_msg)
+                break
+            except RETRYABLE_ERRORS:
+                if attempt >= self.max_retries:
+                    raise
+                await asyncio.sleep(self._retry_sleep(attempt))
+
+        # Track cumulative usage
+        self.total_input_tokens += tokens_in
+        self.total_output_tokens += tokens_out
+
+        return content, tokens_in, tokens_out, attempt
+
     def get_stats(self) -> dict:
-        """Calculate player statistics."""
+        """Calculate player statistics (pure divisions over running counters)."""
         if not self.action_history:
             return {}
 
         total = len(self.action_history)
-        preflop = [a for a in self.action_history if a.street == "preflop"]
-
-        vpip_actions = [a for a in preflop if a.action.action_type in ("call", "raise", "all_in")]
-        pfr_actions = [a for a in preflop if a.action.action_type in ("raise", "all_in")]
-
-        bets_raises = sum(1 for a in self.action_history if a.action.action_type in ("raise", "all_in"))
-        calls = sum(1 for a in self.action_history if a.action.action_type == "call")
-
-        latencies = [a.latency_ms for a in self.action_history]
-        tokens_out = [a.tokens_output for a in self.action_history]
 
         return {
             "total_actions": total,
-            "vpip": len(vpip_actions) / len(preflop) if preflop else 0,
-            "pfr": len(pfr_actions) / len(preflop) if preflop else 0,
-            "aggression_factor": bets_raises / calls if calls > 0 else float('inf'),
-            "avg_latency_ms": sum(latencies) / len(latencies),
-            "avg_tokens": sum(tokens_out) / len(tokens_out) if tokens_out else 0,
-            "fold_pct": sum(1 for a in self.action_history if a.action.action_type == "fold") / total,
+            "vpip": self._n_vpip / self._n_preflop if self._n_preflop else 0,
+            "pfr": self._n_pfr / self._n_preflop if self._n_preflop else 0,
+            "aggression_factor": (
+                self._n_bets_raises / self._n_calls if self._n_calls > 0 else float('inf')
+            ),
+            "avg_latency_ms": self._sum_latency / total,
+            "avg_tokens": self._sum_tokens / total,
+            "fold_pct": self._n_folds / total,
             "total_input_tokens": self.total_input_tokens,
             "total_output_tokens": self.total_output_tokens,
+            "cache_hits": self.cache_hits,
         }
 
     def get_estimated_cost(self) -> float:
@@ -280,7 +660,9 @@ What is your action?"""
         return input_cost + output_cost
 
     def reset_history(self) -> None:
-        """Clear action history for new session."""
+        """Clear action history for new session (cached decisions are kept)."""
         self.action_history = []
+        self._reset_counters()
         self.total_input_tokens = 0
         self.total_output_tokens = 0
+        self.cache_hits = 0
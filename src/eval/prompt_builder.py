@@ -1,5 +1,6 @@
 """Prompt builder matching pokergpt format for LLM evaluation."""
 
+import functools
 from typing import List, Tuple, Optional
 
 # Card display constants
@@ -27,36 +28,17 @@ def pretty_card(card: str) -> str:
     return f"{rank}{suit}"
 
 
-def score_hole_cards(c1: str, c2: str) -> int:
-    """
-    Score preflop hole cards on a scale where higher is better.
-
-    Args:
-        c1: First card string like 'As'
-        c2: Second card string like 'Kd'
-
-    Returns:
-        Integer score where 128 is pair Aces (best possible)
-    """
-    r1 = c1[0].upper() if c1 else "2"
-    r2 = c2[0].upper() if c2 else "2"
-
-    v1 = RANK_VALUE.get(r1, 2)
-    v2 = RANK_VALUE.get(r2, 2)
-    high, low = max(v1, v2), min(v1, v2)
-
-    is_pair = v1 == v2
-    is_suited = len(c1) > 1 and len(c2) > 1 and c1[-1].lower() == c2[-1].lower()
-
+def _score_hand(high: int, low: int, suited: bool) -> int:
+    """Score one starting-hand class (used once to build the tables below)."""
     # Pairs get bonus scoring
-    if is_pair:
+    if high == low:
         return 100 + high * 2
 
     # Base score from card values
     score = high * 4 + low
 
     # Suited bonus
-    if is_suited:
+    if suited:
         score += 12
 
     # Gap penalty/bonus
@@ -77,6 +59,87 @@ def score_hole_cards(c1: str, c2: str) -> int:
     return score
 
 
+# There are only 169 strategically distinct starting hands, so run the
+# formulas once at import: scores by (high, low, suited) class, plus a
+# direct table keyed by the exact canonical card-string pair ('As', 'Kd')
+# so the common case is a single dict hit
+_SCORE_TABLE = {
+    (high, low, suited): _score_hand(high, low, suited)
+    for high in range(2, 15)
+    for low in range(2, high + 1)
+    for suited in (False, True)
+}
+_CARD_STRS = [rank + suit for rank in RANK_ORDER for suit in "shdc"]
+_PAIR_SCORES = {
+    (a, b): _SCORE_TABLE[
+        (
+            max(RANK_VALUE[a[0]], RANK_VALUE[b[0]]),
+            min(RANK_VALUE[a[0]], RANK_VALUE[b[0]]),
+            a[1] == b[1],
+        )
+    ]
+    for a in _CARD_STRS
+    for b in _CARD_STRS
+    if a != b
+}
+
+
+def score_hole_cards(c1: str, c2: str) -> int:
+    """
+    Score preflop hole cards on a scale where higher is better.
+
+    Args:
+        c1: First card string like 'As'
+        c2: Second card string like 'Kd'
+
+    Returns:
+        Integer score where 128 is pair Aces (best possible)
+    """
+    score = _PAIR_SCORES.get((c1, c2))
+    if score is not None:
+        return score
+
+    # Non-canonical input (odd casing, '10h', empty strings)
+    v1 = RANK_VALUE.get(c1[0].upper(), 2) if c1 else 2
+    v2 = RANK_VALUE.get(c2[0].upper(), 2) if c2 else 2
+    if v1 < v2:
+        v1, v2 = v2, v1
+    suited = len(c1) > 1 and len(c2) > 1 and c1[-1].lower() == c2[-1].lower()
+    return _SCORE_TABLE[(v1, v2, suited)]
+
+
+# Position names indexed by offset from the button (0 = BTN, 1 = SB, ...)
+# for the common table sizes; larger tables are generated on demand
+_POSITIONS = {
+    2: ("BTN/SB", "BB"),
+    3: ("BTN", "SB", "BB"),
+    4: ("BTN", "SB", "BB", "CO"),
+    5: ("BTN", "SB", "BB", "MP", "CO"),
+    6: ("BTN", "SB", "BB", "UTG", "MP", "CO"),
+    7: ("BTN", "SB", "BB", "UTG", "UTG+1", "MP", "CO"),
+    8: ("BTN", "SB", "BB", "UTG", "UTG+1", "MP", "MP+1", "CO"),
+    9: ("BTN", "SB", "BB", "UTG", "UTG+1", "UTG+2", "MP", "MP+1", "CO"),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _position_ladder(num_players: int) -> Tuple[str, ...]:
+    """Generate the position ladder for 10+ players (UTG seats grow)."""
+    names = ["BTN", "SB", "BB"]
+    for offset in range(3, num_players):
+        if offset == num_players - 1:
+            names.append("CO")
+        elif offset == num_players - 2:
+            names.append("MP+1")
+        elif offset == num_players - 3:
+            names.append("MP")
+        elif offset == 3:
+            names.append("UTG")
+        else:
+            names.append(f"UTG+{offset - 3}")
+    return tuple(names)
+
+
 def get_position_name(player_idx: int, num_players: int, button_idx: int) -> str:
     """
     Get position name for a player.
@@ -87,97 +150,27 @@ def get_position_name(player_idx: int, num_players: int, button_idx: int) -> str
         button_idx: Button position (0-indexed)
 
     Returns:
-        Position name (UTG, UTG+1, MP, MP+1, HJ, CO, BTN, SB, BB)
+        Position name (UTG, UTG+1, MP, MP+1, CO, BTN, SB, BB)
     """
     if num_players < 2:
         return "Unknown"
 
-    # Calculate position relative to button (0 = BTN, 1 = SB, 2 = BB, etc.)
-    offset = (player_idx - button_idx) % num_players
-
-    # Heads-up (2 players)
-    if num_players == 2:
-        return "BTN/SB" if offset == 0 else "BB"
-
-    # 3+ players
-    if offset == 0:
-        return "BTN"
-    elif offset == 1:
-        return "SB"
-    elif offset == 2:
-        return "BB"
-
-    # For 3 players, only BTN, SB, BB exist
-    if num_players == 3:
-        return f"P{player_idx + 1}"
-
-    # Position mappings for 4-9+ players
-    if num_players == 4:
-        if offset == 3:
-            return "CO"
-    elif num_players == 5:
-        if offset == 3:
-            return "MP"
-        elif offset == 4:
-            return "CO"
-    elif num_players == 6:
-        if offset == 3:
-            return "UTG"
-        elif offset == 4:
-            return "MP"
-        elif offset == 5:
-            return "CO"
-    elif num_players == 7:
-        if offset == 3:
-            return "UTG"
-        elif offset == 4:
-            return "UTG+1"
-        elif offset == 5:
-            return "MP"
-        elif offset == 6:
-            return "CO"
-    elif num_players == 8:
-        if offset == 3:
-            return "UTG"
-        elif offset == 4:
-            return "UTG+1"
-        elif offset == 5:
-            return "MP"
-        elif offset == 6:
-            return "MP+1"
-        elif offset == 7:
-            return "CO"
-    elif num_players == 9:
-        if offset == 3:
-            return "UTG"
-        elif offset == 4:
-            return "UTG+1"
-        elif offset == 5:
-            return "UTG+2"
-        elif offset == 6:
-            return "MP"
-        elif offset == 7:
-            return "MP+1"
-        elif offset == 8:
-            return "CO"
-    else:
-        # 10+ players
-        if offset >= 3:
-            co_offset = num_players - 1
-            if offset == co_offset:
-                return "CO"
-            elif offset == co_offset - 1:
-                return "MP+1"
-            elif offset == co_offset - 2:
-                return "MP"
-            else:
-                utg_offset = offset - 3
-                if utg_offset == 0:
-                    return "UTG"
-                else:
-                    return f"UTG+{utg_offset}"
-
-    return f"P{player_idx + 1}"
+    ladder = _POSITIONS.get(num_players) or _position_ladder(num_players)
+    return ladder[(player_idx - button_idx) % num_players]
+
+
+# Prompt fragments rendered with %-formatting in the hot path
+_HEADER = (
+    "You are an expert poker player and you are playing NT poker.\n"
+    "There are %d players at the table.\n"
+    "You are in the %s position.\n"
+    "\n"
+    "Stacks:"
+)
+_STACK_LINE = "- %s: %.1f BB"
+_BET_LINE = "- %s: %.1f BB"
+_HOLE_CARDS = "Your hole cards are: %s %s"
+_STRENGTH = "Preflop hand strength score out of 128 (128 is pair Aces): %d"
 
 
 class PromptBuilder:
@@ -192,6 +185,11 @@ class PromptBuilder:
         """
         self.big_blind = big_blind
         self.action_history: List[str] = []
+        # Per-decision invariants: the position ring repeats every orbit
+        # and the stacks block only changes between hands, so both are
+        # memoized instead of being reformatted for every prompt
+        self._positions_cache: dict = {}
+        self._stacks_cache: dict = {}
 
     def record_deal(self, player_label: str, is_hero: bool = False, blind_note: str = ""):
         """Record a hole card deal."""
@@ -274,21 +272,31 @@ class PromptBuilder:
             Formatted prompt string
         """
         bb = self.big_blind
-        positions = [get_position_name(i, num_players, button_idx) for i in range(num_players)]
-        hero_pos = positions[hero_idx]
 
-        lines = [
-            "You are an expert poker player and you are playing NT poker.",
-            f"There are {num_players} players at the table.",
-            f"You are in the {hero_pos} position.",
-            "",
-            "Stacks:",
-        ]
+        pos_key = (num_players, button_idx)
+        positions = self._positions_cache.get(pos_key)
+        if positions is None:
+            positions = tuple(
+                get_position_name(i, num_players, button_idx) for i in range(num_players)
+            )
+            self._positions_cache[pos_key] = positions
+        hero_pos = positions[hero_idx]
 
-        # Stacks for all players
-        for i, stack in enumerate(stacks):
-            label = self.get_player_label(i, hero_idx, positions)
-            lines.append(f"- {label}: {stack / bb:.1f} BB")
+        lines = [_HEADER % (num_players, hero_pos)]
+
+        # Stacks for all players - invariant within a hand, so the whole
+        # block is memoized as one pre-joined string
+        stacks_key = (tuple(stacks), hero_idx, button_idx, num_players)
+        stacks_block = self._stacks_cache.get(stacks_key)
+        if stacks_block is None:
+            stacks_block = "\n".join(
+                _STACK_LINE % (self.get_player_label(i, hero_idx, positions), stack / bb)
+                for i, stack in enumerate(stacks)
+            )
+            if len(self._stacks_cache) >= 1024:
+                self._stacks_cache.clear()
+            self._stacks_cache[stacks_key] = stacks_block
+        lines.append(stacks_block)
 
         # Action history
         if self.action_history:
@@ -300,13 +308,12 @@ class PromptBuilder:
         c1, c2 = hero_cards
         lines.extend([
             "",
-            f"Your hole cards are: {pretty_card(c1)} {pretty_card(c2)}",
+            _HOLE_CARDS % (pretty_card(c1), pretty_card(c2)),
         ])
 
         # Hand strength or board
         if street == "preflop":
-            strength = score_hole_cards(c1, c2)
-            lines.append(f"Preflop hand strength score out of 128 (128 is pair Aces): {strength}")
+            lines.append(_STRENGTH % score_hole_cards(c1, c2))
         elif board:
             pretty_board = " ".join(pretty_card(c) for c in board)
             lines.append(f"The current board is: {pretty_board}")
@@ -317,7 +324,7 @@ class PromptBuilder:
             for i, bet in enumerate(bets):
                 if bet > 0:
                     label = self.get_player_label(i, hero_idx, positions)
-                    lines.append(f"- {label}: {bet / bb:.1f} BB")
+                    lines.append(_BET_LINE % (label, bet / bb))
 
         # Pot and turn
         lines.extend([
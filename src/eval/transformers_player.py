@@ -1,19 +1,53 @@
 """Transformers-based player using direct model.generate()."""
 
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, List, Tuple
+from typing import Any, List, Optional, Tuple
 
 import torch
 
+try:
+    from transformers import StoppingCriteria, StoppingCriteriaList
+except ImportError:
+    StoppingCriteria = object
+    StoppingCriteriaList = list
+
+# Better matmul throughput on TF32-capable GPUs (Ampere+); no-ops elsewhere
+if torch.cuda.is_available():
+    torch.backends.cuda.matmul.allow_tf32 = True
+    torch.set_float32_matmul_precision("high")
+
 # Import from parent package
 try:
-    from ..actions import ParsedAction, ActionParser
+    from ..actions import ActionKind, ParsedAction, ActionParser
 except ImportError:
     import sys
     from pathlib import Path
     sys.path.insert(0, str(Path(__file__).parent.parent))
-    from actions import ParsedAction, ActionParser
+    from actions import ActionKind, ParsedAction, ActionParser
+
+
+class StopOnSubsequence(StoppingCriteria):
+    """Halt generation once every sequence has emitted a token subsequence.
+
+    Tracks rows that already produced the subsequence so a batch stops
+    when the last straggler emits it, not only when all rows happen to
+    end with it on the same step.
+    """
+
+    def __init__(self, stop_ids: List[int]):
+        self.stop_ids = stop_ids
+        self._done: Optional[List[bool]] = None
+
+    def __call__(self, input_ids, scores, **kwargs) -> bool:
+        if self._done is None:
+            self._done = [False] * input_ids.shape[0]
+        n = len(self.stop_ids)
+        for i, row in enumerate(input_ids):
+            if not self._done[i] and row[-n:].tolist() == self.stop_ids:
+                self._done[i] = True
+        return all(self._done)
 
 
 @dataclass
@@ -35,7 +69,20 @@ class ActionRecord:
 
 
 class TransformersPlayer:
-    """Player using HuggingFace transformers with bitsandbytes."""
+    """Player using HuggingFace transformers with bitsandbytes.
+
+    Autoregressive decode is memory-bandwidth-bound (every generated
+    token reads all weights), so load the model 4-bit quantized — the
+    recommended kwargs come from HardwareConfig:
+
+        hw = HardwareConfig.detect()
+        model = AutoModelForCausalLM.from_pretrained(
+            model_id,
+            quantization_config=hw.get_bnb_config(),
+            torch_dtype=hw.get_torch_dtype(),
+            device_map="auto",
+        )
+    """
 
     SYSTEM_PROMPT = """You are an expert poker player. Analyze the game state and decide your action.
 
@@ -66,6 +113,7 @@ Think step by step, then output exactly ONE action tag."""
         tokenizer: Any,  # PreTrainedTokenizer
         temperature: float = 0.6,
         max_new_tokens: int = 512,
+        cache_size: int = 4096,
     ):
         self.name = name
         self.model = model
@@ -78,15 +126,140 @@ Think step by step, then output exactly ONE action tag."""
         self._hand_id = 0
         self._street = "preflop"
 
+        # Running stats counters updated as records are appended, so
+        # get_stats is pure O(1) arithmetic no matter how often a
+        # dashboard polls it
+        self._reset_counters()
+
+        # Bounded LRU of (state key) -> (action, thinking, response).
+        # Replays hit identical states often; a hit skips the whole
+        # autoregressive decode
+        self.cache_size = cache_size
+        self.cache_hits = 0
+        self._action_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+
         # Ensure pad token
         if self.tokenizer.pad_token is None:
             self.tokenizer.pad_token = self.tokenizer.eos_token
 
+        # The system prompt and generation header are identical on every
+        # call, so render the chat template once around a sentinel user
+        # turn and split it into a static prefix/suffix. Single-prompt
+        # generation reuses the pre-tokenized prefix ids instead of
+        # re-tokenizing the same ~200 tokens per decision (which also
+        # keeps the prefix byte-identical for KV-prefix reuse upstream).
+        sentinel = "\x00USER_MSG\x00"
+        rendered = self.tokenizer.apply_chat_template(
+            [
+                {"role": "system", "content": self.SYSTEM_PROMPT},
+                {"role": "user", "content": sentinel},
+            ],
+            tokenize=False,
+            add_generation_prompt=True,
+        )
+        self._prompt_prefix, self._prompt_suffix = rendered.split(sentinel, 1)
+        self._prefix_ids = self.tokenizer(
+            self._prompt_prefix, return_tensors="pt"
+        ).input_ids
+
+        # Everything after </action> is discarded by the parser, so stop
+        # decoding as soon as the closing tag appears. When the tag is a
+        # single token the cheaper per-row eos shortcut applies;
+        # otherwise a StoppingCriteria scans for the id subsequence
+        self._stop_ids = self.tokenizer.encode("</action>", add_special_tokens=False)
+        self._stop_eos = (
+            [self.tokenizer.eos_token_id, self._stop_ids[0]]
+            if len(self._stop_ids) == 1
+            else None
+        )
+
     def set_hand_context(self, hand_id: int, street: str) -> None:
         """Set context for action logging."""
         self._hand_id = hand_id
         self._street = street
 
+    def _reset_counters(self) -> None:
+        """Zero the running stats counters."""
+        self._sum_latency = 0.0
+        self._sum_tokens = 0
+        self._n_preflop = 0
+        self._n_vpip = 0
+        self._n_pfr = 0
+        self._n_bets_raises = 0
+        self._n_calls = 0
+        self._n_folds = 0
+
+    def _append_record(self, record: ActionRecord) -> None:
+        """Append a record and update the running stats counters."""
+        self.action_history.append(record)
+        self._sum_latency += record.latency_ms
+        self._sum_tokens += record.tokens_generated
+        if record.street == "preflop":
+            self._n_preflop += 1
+
+        # ActionKind is ordered FOLD < CHECK < CALL < RAISE < ALL_IN;
+        # quit/error actions classify to None and only count toward the
+        # denominators, matching the old per-metric filters
+        kind = record.action.kind
+        if kind is None:
+            return
+        if record.street == "preflop":
+            if kind >= ActionKind.CALL:
+                self._n_vpip += 1
+            if kind >= ActionKind.RAISE:
+                self._n_pfr += 1
+        if kind >= ActionKind.RAISE:
+            self._n_bets_raises += 1
+        elif kind == ActionKind.CALL:
+            self._n_calls += 1
+        elif kind == ActionKind.FOLD:
+            self._n_folds += 1
+
+    def _cache_lookup(self, key: tuple) -> Optional[tuple]:
+        """Look up a decision, refreshing its LRU position on a hit."""
+        hit = self._action_cache.get(key)
+        if hit is not None:
+            self._action_cache.move_to_end(key)
+            self.cache_hits += 1
+        return hit
+
+    def _cache_store(self, key: tuple, value: tuple) -> None:
+        """Store a decision, evicting the least recently used past cache_size."""
+        self._action_cache[key] = value
+        self._action_cache.move_to_end(key)
+        if len(self._action_cache) > self.cache_size:
+            self._action_cache.popitem(last=False)
+
+    def _cached_record(
+        self,
+        hit: tuple,
+        hole_cards: Tuple[str, str],
+        board: List[str],
+        pot: int,
+        to_call: int,
+        stack: int,
+        position: str,
+        latency: float,
+    ) -> ParsedAction:
+        """Append an ActionRecord for a cache hit so stats stay correct."""
+        action, thinking, response = hit
+        self._append_record(ActionRecord(
+            hand_id=self._hand_id,
+            street=self._street,
+            hole_cards=hole_cards,
+            board=list(board),
+            pot=pot,
+            to_call=to_call,
+            stack=stack,
+            position=position,
+            action=action,
+            thinking=thinking[:1000],
+            response=response[:500],
+            latency_ms=latency,
+            tokens_generated=0,
+        ))
+        return action
+
     def get_action(
         self,
         hole_cards: Tuple[str, str],
@@ -100,15 +273,24 @@ Think step by step, then output exactly ONE action tag."""
         """Get action via model.generate() using simple prompt format."""
         start = time.perf_counter()
 
-        prompt = self._build_prompt(
+        key = (hole_cards, tuple(board), pot, to_call, stack, position, num_players)
+        hit = self._cache_lookup(key)
+        if hit is not None:
+            return self._cached_record(
+                hit, hole_cards, board, pot, to_call, stack, position,
+                (time.perf_counter() - start) * 1000,
+            )
+
+        user_msg = self._build_user_msg(
             hole_cards, board, pot, to_call, stack, position, num_players
         )
 
         try:
-            thinking, response, tokens_gen = self._generate(prompt)
+            thinking, response, tokens_gen = self._generate(user_msg)
             can_check = to_call == 0
             # Parse action from response (after </think>)
             action = self.parser.parse(response, can_check, stack)
+            self._cache_store(key, (action, thinking, response))
         except Exception as e:
             thinking = ""
             response = f"ERROR: {e}"
@@ -117,7 +299,7 @@ Think step by step, then output exactly ONE action tag."""
 
         latency = (time.perf_counter() - start) * 1000
 
-        self.action_history.append(ActionRecord(
+        self._append_record(ActionRecord(
             hand_id=self._hand_id,
             street=self._street,
             hole_cards=hole_cards,
@@ -135,6 +317,99 @@ Think step by step, then output exactly ONE action tag."""
 
         return action
 
+    def get_action_batch(self, contexts: List[tuple]) -> List[ParsedAction]:
+        """
+        Decide actions for several concurrent seats in one generate() call.
+
+        contexts is a list of get_action positional-argument tuples, one
+        per seat (as yielded by EvalPokerGame.session_steps). Prompts are
+        tokenized with left padding so each sequence generates from its
+        own prompt end, then decoded in a single batched forward pass.
+        """
+        if not contexts:
+            return []
+
+        # Serve cached seats first so only the misses pay for generation
+        actions: List[Optional[ParsedAction]] = [None] * len(contexts)
+        for i, ctx in enumerate(contexts):
+            hole_cards, board, pot, to_call, stack, position, num_players = ctx
+            key = (hole_cards, tuple(board), pot, to_call, stack, position, num_players)
+            hit = self._cache_lookup(key)
+            if hit is not None:
+                actions[i] = self._cached_record(
+                    hit, hole_cards, board, pot, to_call, stack, position, 0.0
+                )
+
+        misses = [i for i, action in enumerate(actions) if action is None]
+        if not misses:
+            return actions
+        if len(misses) == 1:
+            actions[misses[0]] = self.get_action(*contexts[misses[0]])
+            return actions
+
+        start = time.perf_counter()
+        prompts = [self._build_prompt(*contexts[i]) for i in misses]
+
+        pad_id = self.tokenizer.pad_token_id
+        prev_side = self.tokenizer.padding_side
+        self.tokenizer.padding_side = "left"
+        try:
+            encoded = self.tokenizer(prompts, return_tensors="pt", padding=True)
+        finally:
+            self.tokenizer.padding_side = prev_side
+        inputs = {name: self._to_device(tensor) for name, tensor in encoded.items()}
+        input_len = inputs["input_ids"].shape[1]
+
+        with torch.inference_mode():
+            outputs = self.model.generate(
+                **inputs,
+                max_new_tokens=self.max_new_tokens,
+                temperature=self.temperature,
+                top_p=0.95,
+                top_k=20,
+                do_sample=True,
+                use_cache=True,
+                pad_token_id=pad_id,
+                **self._stopping_kwargs(),
+            )
+
+        # One shared forward pass; attribute the wall-clock cost to each
+        # seat since they all waited on it
+        latency = (time.perf_counter() - start) * 1000
+
+        for row, i in zip(outputs, misses):
+            hole_cards, board, pot, to_call, stack, position, num_players = contexts[i]
+            new_tokens = row[input_len:]
+            # Shorter completions are right-padded to the batch max;
+            # drop the padding before counting and decoding
+            if pad_id is not None:
+                new_tokens = new_tokens[new_tokens != pad_id]
+            thinking, response, tokens_gen = self._split_thinking(new_tokens)
+            action = self.parser.parse(response, to_call == 0, stack)
+            self._cache_store(
+                (hole_cards, tuple(board), pot, to_call, stack, position, num_players),
+                (action, thinking, response),
+            )
+
+            self._append_record(ActionRecord(
+                hand_id=self._hand_id,
+                street=self._street,
+                hole_cards=hole_cards,
+                board=list(board),
+                pot=pot,
+                to_call=to_call,
+                stack=stack,
+                position=position,
+                action=action,
+                thinking=thinking[:1000],
+                response=response[:500],
+                latency_ms=latency,
+                tokens_generated=tokens_gen,
+            ))
+            actions[i] = action
+
+        return actions
+
     def get_action_with_prompt(
         self,
         prompt_text: str,
@@ -148,19 +423,20 @@ Think step by step, then output exactly ONE action tag."""
         """Get action using a pre-built prompt (pokergpt format)."""
         start = time.perf_counter()
 
-        # Format as chat with system prompt
-        messages = [
-            {"role": "system", "content": self.SYSTEM_PROMPT},
-            {"role": "user", "content": prompt_text},
-        ]
-        full_prompt = self.tokenizer.apply_chat_template(
-            messages, tokenize=False, add_generation_prompt=True
-        )
+        # Keyed on the prompt text itself plus what parsing depends on
+        key = (prompt_text, to_call, stack)
+        hit = self._cache_lookup(key)
+        if hit is not None:
+            return self._cached_record(
+                hit, hole_cards, board, pot, to_call, stack, position,
+                (time.perf_counter() - start) * 1000,
+            )
 
         try:
-            thinking, response, tokens_gen = self._generate(full_prompt)
+            thinking, response, tokens_gen = self._generate(prompt_text)
             can_check = to_call == 0
             action = self.parser.parse(response, can_check, stack)
+            self._cache_store(key, (action, thinking, response))
         except Exception as e:
             thinking = ""
             response = f"ERROR: {e}"
@@ -169,7 +445,7 @@ Think step by step, then output exactly ONE action tag."""
 
         latency = (time.perf_counter() - start) * 1000
 
-        self.action_history.append(ActionRecord(
+        self._append_record(ActionRecord(
             hand_id=self._hand_id,
             street=self._street,
             hole_cards=hole_cards,
@@ -191,7 +467,7 @@ Think step by step, then output exactly ONE action tag."""
         """Get the last action record."""
         return self.action_history[-1] if self.action_history else None
 
-    def _build_prompt(
+    def _build_user_msg(
         self,
         hole_cards: Tuple[str, str],
         board: List[str],
@@ -201,10 +477,10 @@ Think step by step, then output exactly ONE action tag."""
         position: str,
         num_players: int,
     ) -> str:
-        """Build game state prompt."""
+        """Build the game state user message."""
         board_str = " ".join(board) if board else "None"
 
-        user_msg = f"""Game: {num_players}-handed No-Limit Hold'em
+        return f"""Game: {num_players}-handed No-Limit Hold'em
 Position: {position}
 Stack: {stack}
 Hole Cards: {hole_cards[0]} {hole_cards[1]}
@@ -214,77 +490,108 @@ To Call: {to_call}
 
 What is your action?"""
 
-        # Format as chat
-        messages = [
-            {"role": "system", "content": self.SYSTEM_PROMPT},
-            {"role": "user", "content": user_msg},
-        ]
+    def _build_prompt(self, *context) -> str:
+        """Build the full chat-formatted prompt for one decision."""
+        return self._prompt_prefix + self._build_user_msg(*context) + self._prompt_suffix
+
+    def _to_device(self, tensor):
+        """Host-to-device copy via pinned memory when the model is on CUDA.
+
+        Pinning lets the copy run non-blocking, so the CPU can move on
+        to the next prompt instead of stalling on the transfer.
+        """
+        device = self.model.device
+        if device.type == "cuda":
+            return tensor.pin_memory().to(device, non_blocking=True)
+        return tensor.to(device)
+
+    def _stopping_kwargs(self) -> dict:
+        """generate() kwargs that cut decoding short at </action>."""
+        if self._stop_eos is not None:
+            return {"eos_token_id": self._stop_eos}
+        return {
+            "stopping_criteria": StoppingCriteriaList([StopOnSubsequence(self._stop_ids)])
+        }
 
-        return self.tokenizer.apply_chat_template(
-            messages, tokenize=False, add_generation_prompt=True
-        )
+    def _generate(self, user_msg: str) -> Tuple[str, str, int]:
+        """Generate response from model. Returns (thinking, response, token_count).
 
-    def _generate(self, prompt: str) -> Tuple[str, str, int]:
-        """Generate response from model. Returns (thinking, response, token_count)."""
-        inputs = self.tokenizer(prompt, return_tensors="pt").to(self.model.device)
-        input_len = inputs.input_ids.shape[1]
+        Only the user turn is tokenized here; the system prefix was
+        tokenized once in __init__ and is concatenated in front.
+        """
+        tail_ids = self.tokenizer(
+            user_msg + self._prompt_suffix, return_tensors="pt", add_special_tokens=False
+        ).input_ids
+        input_ids = self._to_device(torch.cat([self._prefix_ids, tail_ids], dim=1))
+        input_len = input_ids.shape[1]
 
-        with torch.no_grad():
+        with torch.inference_mode():
             outputs = self.model.generate(
-                **inputs,
+                input_ids=input_ids,
+                attention_mask=torch.ones_like(input_ids),
                 max_new_tokens=self.max_new_tokens,
                 temperature=self.temperature,
                 top_p=0.95,
                 top_k=20,
                 do_sample=True,
+                use_cache=True,
                 pad_token_id=self.tokenizer.pad_token_id,
+                **self._stopping_kwargs(),
             )
 
         new_tokens = outputs[0][input_len:]
-        num_tokens = len(new_tokens)
+        return self._split_thinking(new_tokens)
+
+    def _split_thinking(self, new_tokens) -> Tuple[str, str, int]:
+        """Split generated tokens at </think>. Returns (thinking, response, token_count).
+
+        One tolist() moves the sequence to the CPU in a single sync;
+        the reverse list search then replaces the boolean-mask/nonzero
+        tensor round-trip per call. Accepts tensors or plain id lists.
+        """
+        cpu_tokens = new_tokens.tolist() if hasattr(new_tokens, "tolist") else list(new_tokens)
+        num_tokens = len(cpu_tokens)
 
-        # Split thinking from response at </think> token
+        # Split thinking from response at the last </think> token
         try:
-            think_end_idx = (new_tokens == self.THINK_END_TOKEN_ID).nonzero(as_tuple=True)[0][-1].item()
-            thinking_tokens = new_tokens[:think_end_idx]
-            response_tokens = new_tokens[think_end_idx + 1:]
-        except (IndexError, RuntimeError):
+            think_end_idx = num_tokens - 1 - cpu_tokens[::-1].index(self.THINK_END_TOKEN_ID)
+        except ValueError:
             # No </think> token found - treat all as response
-            thinking_tokens = torch.tensor([], dtype=new_tokens.dtype)
-            response_tokens = new_tokens
-
-        thinking = self.tokenizer.decode(thinking_tokens, skip_special_tokens=True).strip()
-        response = self.tokenizer.decode(response_tokens, skip_special_tokens=True).strip()
+            thinking = ""
+            response = self.tokenizer.decode(cpu_tokens, skip_special_tokens=True).strip()
+            return thinking, response, num_tokens
+
+        # One batch_decode call so the fast tokenizer processes both
+        # halves in a single pass
+        thinking, response = self.tokenizer.batch_decode(
+            [cpu_tokens[:think_end_idx], cpu_tokens[think_end_idx + 1:]],
+            skip_special_tokens=True,
+        )
 
-        return thinking, response, num_tokens
+        return thinking.strip(), response.strip(), num_tokens
 
     def get_stats(self) -> dict:
-        """Calculate player statistics."""
+        """Calculate player statistics (pure divisions over running counters)."""
         if not self.action_history:
             return {}
 
         total = len(self.action_history)
-        preflop = [a for a in self.action_history if a.street == "preflop"]
-
-        vpip_actions = [a for a in preflop if a.action.action_type in ("call", "raise", "all_in")]
-        pfr_actions = [a for a in preflop if a.action.action_type in ("raise", "all_in")]
-
-        bets_raises = sum(1 for a in self.action_history if a.action.action_type in ("raise", "all_in"))
-        calls = sum(1 for a in self.action_history if a.action.action_type == "call")
-
-        latencies = [a.latency_ms for a in self.action_history]
-        tokens = [a.tokens_generated for a in self.action_history]
 
         return {
             "total_actions": total,
-            "vpip": len(vpip_actions) / len(preflop) if preflop else 0,
-            "pfr": len(pfr_actions) / len(preflop) if preflop else 0,
-            "aggression_factor": bets_raises / calls if calls > 0 else float('inf'),
-            "avg_latency_ms": sum(latencies) / len(latencies),
-            "avg_tokens": sum(tokens) / len(tokens),
-            "fold_pct": sum(1 for a in self.action_history if a.action.action_type == "fold") / total,
+            "vpip": self._n_vpip / self._n_preflop if self._n_preflop else 0,
+            "pfr": self._n_pfr / self._n_preflop if self._n_preflop else 0,
+            "aggression_factor": (
+                self._n_bets_raises / self._n_calls if self._n_calls > 0 else float('inf')
+            ),
+            "avg_latency_ms": self._sum_latency / total,
+            "avg_tokens": self._sum_tokens / total,
+            "fold_pct": self._n_folds / total,
+            "cache_hits": self.cache_hits,
         }
 
     def reset_history(self) -> None:
-        """Clear action history for new session."""
+        """Clear action history for new session (cached decisions are kept)."""
         self.action_history = []
+        self._reset_counters()
+        self.cache_hits = 0
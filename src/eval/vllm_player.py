@@ -0,0 +1,143 @@
+"""vLLM-served player with continuous batching and prefix caching."""
+
+import time
+from typing import List, Optional, Tuple
+
+try:
+    from vllm import LLM, SamplingParams
+except ImportError:
+    LLM = None
+    SamplingParams = None
+
+try:
+    from ..actions import ParsedAction
+except ImportError:
+    import sys
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    from actions import ParsedAction
+
+try:
+    from .transformers_player import ActionRecord, TransformersPlayer
+except ImportError:
+    from transformers_player import ActionRecord, TransformersPlayer
+
+
+class VLLMPlayer(TransformersPlayer):
+    """
+    Drop-in replacement for TransformersPlayer backed by an in-process
+    vLLM engine.
+
+    HF model.generate() re-runs prefill and allocates a fresh KV cache
+    per call; vLLM's continuous batching and PagedAttention let every
+    concurrent hand share one decode step, and enable_prefix_caching
+    reuses the KV blocks of the static system prompt across requests.
+    Generation also stops at </action> instead of running out the token
+    budget, since nothing after the tag is parsed.
+
+    Same interface, ActionRecords, stats and decision cache as the base
+    class — only the generation backend differs.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        model_id: str,
+        temperature: float = 0.6,
+        max_new_tokens: int = 512,
+        cache_size: int = 4096,
+        **engine_kwargs,
+    ):
+        if LLM is None:
+            raise ImportError("vllm package not installed. Run: pip install vllm")
+
+        engine = LLM(model=model_id, enable_prefix_caching=True, **engine_kwargs)
+        super().__init__(
+            name,
+            model=None,
+            tokenizer=engine.get_tokenizer(),
+            temperature=temperature,
+            max_new_tokens=max_new_tokens,
+            cache_size=cache_size,
+        )
+        self.engine = engine
+
+    def _sampling_params(self) -> "SamplingParams":
+        """Sampling parameters matching the HF generate() call."""
+        return SamplingParams(
+            temperature=self.temperature,
+            top_p=0.95,
+            top_k=20,
+            max_tokens=self.max_new_tokens,
+            # The parser only needs the action tag; stopping there saves
+            # the rest of the decode. Keep the tag in the output
+            stop=["</action>"],
+            include_stop_str_in_output=True,
+        )
+
+    def _generate(self, user_msg: str) -> Tuple[str, str, int]:
+        """Generate one response via the engine. Returns (thinking, response, token_count)."""
+        prompt = self._prompt_prefix + user_msg + self._prompt_suffix
+        outputs = self.engine.generate([prompt], self._sampling_params(), use_tqdm=False)
+        return self._split_thinking(outputs[0].outputs[0].token_ids)
+
+    def get_action_batch(self, contexts: List[tuple]) -> List[ParsedAction]:
+        """
+        Decide actions for several concurrent seats in one engine call.
+
+        vLLM schedules the whole prompt list itself (continuous
+        batching), so unlike the base class there is no padding step —
+        misses are handed over as-is and cached seats are served first.
+        """
+        if not contexts:
+            return []
+
+        actions: List[Optional[ParsedAction]] = [None] * len(contexts)
+        for i, ctx in enumerate(contexts):
+            hole_cards, board, pot, to_call, stack, position, num_players = ctx
+            key = (hole_cards, tuple(board), pot, to_call, stack, position, num_players)
+            hit = self._cache_lookup(key)
+            if hit is not None:
+                actions[i] = self._cached_record(
+                    hit, hole_cards, board, pot, to_call, stack, position, 0.0
+                )
+
+        misses = [i for i, action in enumerate(actions) if action is None]
+        if not misses:
+            return actions
+
+        start = time.perf_counter()
+        prompts = [self._build_prompt(*contexts[i]) for i in misses]
+        outputs = self.engine.generate(prompts, self._sampling_params(), use_tqdm=False)
+
+        # One shared engine pass; attribute the wall-clock cost to each
+        # seat since they all waited on it
+        latency = (time.perf_counter() - start) * 1000
+
+        for out, i in zip(outputs, misses):
+            hole_cards, board, pot, to_call, stack, position, num_players = contexts[i]
+            thinking, response, tokens_gen = self._split_thinking(out.outputs[0].token_ids)
+            action = self.parser.parse(response, to_call == 0, stack)
+            self._cache_store(
+                (hole_cards, tuple(board), pot, to_call, stack, position, num_players),
+                (action, thinking, response),
+            )
+
+            self._append_record(ActionRecord(
+                hand_id=self._hand_id,
+                street=self._street,
+                hole_cards=hole_cards,
+                board=list(board),
+                pot=pot,
+                to_call=to_call,
+                stack=stack,
+                position=position,
+                action=action,
+                thinking=thinking[:1000],
+                response=response[:500],
+                latency_ms=latency,
+                tokens_generated=tokens_gen,
+            ))
+            actions[i] = action
+
+        return actions
@@ -277,8 +277,8 @@ class TestPokerEngineStateQueries:
         cards = engine.get_hole_cards(99)
         assert cards == ("??", "??")
 
-    def test_get_board_copy(self, engine):
-        """Test get_board returns a copy."""
+    def test_get_board_read_only(self, engine):
+        """Test get_board returns an immutable view."""
         # Complete preflop betting first
         while engine.get_actor() is not None and not engine.is_hand_complete():
             action = ParsedAction(action_type=ActionType.CALL)
@@ -287,7 +287,7 @@ class TestPokerEngineStateQueries:
         board1 = engine.get_board()
         board2 = engine.get_board()
         assert board1 == board2
-        assert board1 is not board2  # Different objects
+        assert isinstance(board1, tuple)  # Callers cannot mutate engine state
 
     def test_needs_cards_initially_false(self, engine):
         """Test needs_cards is initially False (action needed)."""
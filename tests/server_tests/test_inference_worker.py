@@ -0,0 +1,96 @@
+"""Tests for the shared inference worker."""
+
+# Add project root to path for imports BEFORE other imports
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import asyncio
+
+import pytest
+
+from server.streaming.inference_worker import InferenceWorker
+
+
+class FakeClient:
+    """Minimal stand-in for OllamaStreamingClient."""
+
+    def __init__(self, delay: float = 0.0, error: Exception = None):
+        self.delay = delay
+        self.error = error
+        self.calls = []
+
+    async def generate_streaming(self, model, prompt, on_token, **kwargs):
+        self.calls.append((model, prompt))
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        await on_token(f"response to {prompt}")
+        return f"response to {prompt}"
+
+
+async def collect_nothing(token: str) -> None:
+    """No-op token callback."""
+
+
+class TestInferenceWorker:
+    """Tests for InferenceWorker."""
+
+    @pytest.mark.asyncio
+    async def test_submit_returns_result(self):
+        """Test a single submission resolves with the client's result."""
+        client = FakeClient()
+        worker = InferenceWorker(client)
+
+        result = await worker.submit("llama2", "hello", collect_nothing)
+
+        assert result == "response to hello"
+        assert client.calls == [("llama2", "hello")]
+        await worker.stop()
+
+    @pytest.mark.asyncio
+    async def test_submit_propagates_errors(self):
+        """Test client errors surface to the submitter."""
+        client = FakeClient(error=RuntimeError("backend down"))
+        worker = InferenceWorker(client)
+
+        with pytest.raises(RuntimeError, match="backend down"):
+            await worker.submit("llama2", "hello", collect_nothing)
+
+        await worker.stop()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_submissions_coalesce(self):
+        """Test near-simultaneous submissions all complete."""
+        client = FakeClient(delay=0.01)
+        worker = InferenceWorker(client, max_batch=4, max_delay_ms=20.0)
+
+        results = await asyncio.gather(
+            worker.submit("llama2", "p1", collect_nothing),
+            worker.submit("llama2", "p2", collect_nothing),
+            worker.submit("mistral", "p3", collect_nothing),
+        )
+
+        assert sorted(results) == [
+            "response to p1",
+            "response to p2",
+            "response to p3",
+        ]
+        assert len(client.calls) == 3
+        await worker.stop()
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_drain_task(self):
+        """Test stop shuts down the background task."""
+        client = FakeClient()
+        worker = InferenceWorker(client)
+
+        await worker.submit("llama2", "hello", collect_nothing)
+        assert worker._drain_task is not None
+
+        await worker.stop()
+        assert worker._drain_task is None
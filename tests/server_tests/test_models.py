@@ -11,7 +11,7 @@ if str(PROJECT_ROOT) not in sys.path:
 import time
 
 import pytest
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from server.models.game import (
     Card,
@@ -111,13 +111,13 @@ class TestCard:
             Card.from_string(invalid_string)
 
     def test_card_serialization(self):
-        """Test card JSON serialization."""
+        """Test card wire-format serialization via pydantic."""
+        adapter = TypeAdapter(Card)
         card = Card(rank="A", suit="s")
-        data = card.model_dump()
-        assert data == {"rank": "A", "suit": "s"}
+        assert adapter.dump_python(card) == {"rank": "A", "suit": "s"}
 
         # Test deserialization
-        restored = Card.model_validate(data)
+        restored = adapter.validate_python({"rank": "A", "suit": "s"})
         assert restored.rank == "A"
         assert restored.suit == "s"
 
@@ -200,11 +200,12 @@ class TestParsedAction:
         assert str(action) == "Raise"
 
     def test_parsed_action_serialization(self, raise_action):
-        """Test ParsedAction JSON serialization."""
-        data = raise_action.model_dump()
+        """Test ParsedAction JSON serialization via pydantic."""
+        adapter = TypeAdapter(ParsedAction)
+        data = adapter.dump_python(raise_action, mode="json")
         assert data == {"action_type": "raise", "amount": 400}
 
-        restored = ParsedAction.model_validate(data)
+        restored = adapter.validate_python(data)
         assert restored.action_type == ActionType.RAISE
         assert restored.amount == 400
 
@@ -9,7 +9,7 @@ if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
 import json
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -59,6 +59,12 @@ class MockStreamResponse:
     def aiter_lines(self):
         return MockAsyncIterator(self.lines)
 
+    def aiter_raw(self):
+        # The client splits NDJSON frames from raw bytes itself
+        return MockAsyncIterator(
+            [(line + "\n").encode() for line in self.lines]
+        )
+
 
 class MockHTTPClient:
     """Mock httpx.AsyncClient."""
@@ -110,7 +116,7 @@ class TestOllamaStreamingClient:
 
     @pytest.fixture
     def client(self):
-        """Create a client instance."""
+        """Create a client instance (tests swap in a mock pooled client)."""
         return OllamaStreamingClient(
             endpoint="http://localhost:11434",
             timeout=30.0,
@@ -122,24 +128,22 @@ class TestOllamaStreamingClient:
         mock_response = MagicMock()
         mock_response.status_code = 200
 
-        mock_http = MockHTTPClient(
+        client._client = MockHTTPClient(
             responses={"http://localhost:11434/api/tags": mock_response}
         )
 
-        with patch("httpx.AsyncClient", return_value=mock_http):
-            result = await client.check_connection()
-            assert result is True
+        result = await client.check_connection()
+        assert result is True
 
     @pytest.mark.asyncio
     async def test_check_connection_failure(self, client):
         """Test failed connection check."""
-        with patch("httpx.AsyncClient") as mock_client_cls:
-            mock_client = AsyncMock()
-            mock_client.get = AsyncMock(side_effect=Exception("Connection refused"))
-            mock_client_cls.return_value.__aenter__.return_value = mock_client
+        mock_client = AsyncMock()
+        mock_client.get = AsyncMock(side_effect=Exception("Connection refused"))
+        client._client = mock_client
 
-            result = await client.check_connection()
-            assert result is False
+        result = await client.check_connection()
+        assert result is False
 
     @pytest.mark.asyncio
     async def test_list_models_success(self, client):
@@ -153,14 +157,13 @@ class TestOllamaStreamingClient:
         mock_response.status_code = 200
         mock_response.json = lambda: {"models": models_data}
 
-        mock_http = MockHTTPClient(
+        client._client = MockHTTPClient(
             responses={"http://localhost:11434/api/tags": mock_response}
         )
 
-        with patch("httpx.AsyncClient", return_value=mock_http):
-            result = await client.list_models()
-            assert len(result) == 2
-            assert result[0]["name"] == "llama2"
+        result = await client.list_models()
+        assert len(result) == 2
+        assert result[0]["name"] == "llama2"
 
     @pytest.mark.asyncio
     async def test_list_models_empty(self, client):
@@ -169,13 +172,12 @@ class TestOllamaStreamingClient:
         mock_response.status_code = 200
         mock_response.json = lambda: {"models": []}
 
-        mock_http = MockHTTPClient(
+        client._client = MockHTTPClient(
             responses={"http://localhost:11434/api/tags": mock_response}
         )
 
-        with patch("httpx.AsyncClient", return_value=mock_http):
-            result = await client.list_models()
-            assert result == []
+        result = await client.list_models()
+        assert result == []
 
     @pytest.mark.asyncio
     async def test_list_models_error(self, client):
@@ -186,12 +188,10 @@ class TestOllamaStreamingClient:
 
         mock_http = AsyncMock()
         mock_http.get = mock_get
-        mock_http.__aenter__ = AsyncMock(return_value=mock_http)
-        mock_http.__aexit__ = AsyncMock()
+        client._client = mock_http
 
-        with patch("httpx.AsyncClient", return_value=mock_http):
-            result = await client.list_models()
-            assert result == []
+        result = await client.list_models()
+        assert result == []
 
     @pytest.mark.asyncio
     async def test_generate_streaming_basic(self, client):
@@ -203,7 +203,7 @@ class TestOllamaStreamingClient:
         lines.append(json.dumps({"message": {"content": ""}, "done": True}))
 
         mock_stream = MockStreamResponse(lines)
-        mock_http = MockHTTPClient(
+        client._client = MockHTTPClient(
             responses={"http://localhost:11434/api/chat": mock_stream}
         )
 
@@ -212,12 +212,11 @@ class TestOllamaStreamingClient:
         async def on_token(token: str):
             received_tokens.append(token)
 
-        with patch("httpx.AsyncClient", return_value=mock_http):
-            result = await client.generate_streaming(
-                model="llama2",
-                prompt="Say hello",
-                on_token=on_token,
-            )
+        result = await client.generate_streaming(
+            model="llama2",
+            prompt="Say hello",
+            on_token=on_token,
+        )
 
         assert result == "Hello World!"
         assert received_tokens == tokens
@@ -232,7 +231,7 @@ class TestOllamaStreamingClient:
         ]
 
         mock_stream = MockStreamResponse(lines)
-        mock_http = MockHTTPClient(
+        client._client = MockHTTPClient(
             responses={"http://localhost:11434/api/chat": mock_stream}
         )
 
@@ -241,12 +240,11 @@ class TestOllamaStreamingClient:
         async def on_token(token: str):
             received_tokens.append(token)
 
-        with patch("httpx.AsyncClient", return_value=mock_http):
-            result = await client.generate_streaming(
-                model="qwen3",
-                prompt="Think about this",
-                on_token=on_token,
-            )
+        result = await client.generate_streaming(
+            model="qwen3",
+            prompt="Think about this",
+            on_token=on_token,
+        )
 
         assert "Let me think..." in result
         assert "The answer" in result
@@ -264,7 +262,7 @@ class TestOllamaStreamingClient:
         ]
 
         mock_stream = MockStreamResponse(lines)
-        mock_http = MockHTTPClient(
+        client._client = MockHTTPClient(
             responses={"http://localhost:11434/api/chat": mock_stream}
         )
 
@@ -273,12 +271,11 @@ class TestOllamaStreamingClient:
         async def on_token(token: str):
             received_tokens.append(token)
 
-        with patch("httpx.AsyncClient", return_value=mock_http):
-            result = await client.generate_streaming(
-                model="llama2",
-                prompt="test",
-                on_token=on_token,
-            )
+        result = await client.generate_streaming(
+            model="llama2",
+            prompt="test",
+            on_token=on_token,
+        )
 
         assert result == "AB"
         assert received_tokens == ["A", "B"]
@@ -294,7 +291,7 @@ class TestOllamaStreamingClient:
         ]
 
         mock_stream = MockStreamResponse(lines)
-        mock_http = MockHTTPClient(
+        client._client = MockHTTPClient(
             responses={"http://localhost:11434/api/chat": mock_stream}
         )
 
@@ -303,17 +300,42 @@ class TestOllamaStreamingClient:
         async def on_token(token: str):
             received_tokens.append(token)
 
-        with patch("httpx.AsyncClient", return_value=mock_http):
-            result = await client.generate_streaming(
-                model="llama2",
-                prompt="test",
-                on_token=on_token,
-            )
+        result = await client.generate_streaming(
+            model="llama2",
+            prompt="test",
+            on_token=on_token,
+        )
 
         # Should skip malformed lines
         assert result == "AB"
         assert received_tokens == ["A", "B"]
 
+    @pytest.mark.asyncio
+    async def test_generate_streaming_stops_after_action_tag(self, client):
+        """Test the stream is abandoned once the action tag is complete."""
+        lines = [
+            json.dumps({"message": {"content": "<action>f"}, "done": False}),
+            json.dumps({"message": {"content": "</action>"}, "done": False}),
+            json.dumps({"message": {"content": " extra rambling"}, "done": False}),
+            json.dumps({"message": {"content": ""}, "done": True}),
+        ]
+
+        mock_stream = MockStreamResponse(lines)
+        mock_http = client._client = MockHTTPClient(
+            responses={"http://localhost:11434/api/chat": mock_stream}
+        )
+
+        async def on_token(token: str):
+            pass
+
+        result = await client.generate_streaming(
+            model="llama2",
+            prompt="test",
+            on_token=on_token,
+        )
+
+        assert result == "<action>f</action>"
+
     @pytest.mark.asyncio
     async def test_generate_streaming_custom_system_prompt(self, client):
         """Test streaming with custom system prompt."""
@@ -323,20 +345,19 @@ class TestOllamaStreamingClient:
         ]
 
         mock_stream = MockStreamResponse(lines)
-        mock_http = MockHTTPClient(
+        mock_http = client._client = MockHTTPClient(
             responses={"http://localhost:11434/api/chat": mock_stream}
         )
 
         async def on_token(token: str):
             pass
 
-        with patch("httpx.AsyncClient", return_value=mock_http):
-            await client.generate_streaming(
-                model="llama2",
-                prompt="test",
-                on_token=on_token,
-                system_prompt="You are a helpful assistant.",
-            )
+        await client.generate_streaming(
+            model="llama2",
+            prompt="test",
+            on_token=on_token,
+            system_prompt="You are a helpful assistant.",
+        )
 
         # Verify the request included custom system prompt
         assert len(mock_http.requests) == 1
@@ -354,19 +375,18 @@ class TestOllamaStreamingClient:
         ]
 
         mock_stream = MockStreamResponse(lines)
-        mock_http = MockHTTPClient(
+        mock_http = client._client = MockHTTPClient(
             responses={"http://localhost:11434/api/chat": mock_stream}
         )
 
         async def on_token(token: str):
             pass
 
-        with patch("httpx.AsyncClient", return_value=mock_http):
-            await client.generate_streaming(
-                model="llama2",
-                prompt="test",
-                on_token=on_token,
-            )
+        await client.generate_streaming(
+            model="llama2",
+            prompt="test",
+            on_token=on_token,
+        )
 
         # Verify the request included default system prompt
         assert len(mock_http.requests) == 1
@@ -384,21 +404,20 @@ class TestOllamaStreamingClient:
         ]
 
         mock_stream = MockStreamResponse(lines)
-        mock_http = MockHTTPClient(
+        mock_http = client._client = MockHTTPClient(
             responses={"http://localhost:11434/api/chat": mock_stream}
         )
 
         async def on_token(token: str):
             pass
 
-        with patch("httpx.AsyncClient", return_value=mock_http):
-            await client.generate_streaming(
-                model="llama2",
-                prompt="test",
-                on_token=on_token,
-                temperature=0.8,
-                max_tokens=1024,
-            )
+        await client.generate_streaming(
+            model="llama2",
+            prompt="test",
+            on_token=on_token,
+            temperature=0.8,
+            max_tokens=1024,
+        )
 
         # Verify the request included temperature and max_tokens
         _, url, kwargs = mock_http.requests[0]
@@ -418,14 +437,12 @@ class TestOllamaStreamingClient:
 
         mock_http = AsyncMock()
         mock_http.post = AsyncMock(return_value=mock_response)
-        mock_http.__aenter__ = AsyncMock(return_value=mock_http)
-        mock_http.__aexit__ = AsyncMock()
+        client._client = mock_http
 
-        with patch("httpx.AsyncClient", return_value=mock_http):
-            result = await client.generate(
-                model="llama2",
-                prompt="test",
-            )
+        result = await client.generate(
+            model="llama2",
+            prompt="test",
+        )
 
         assert result == "This is the response"
 
@@ -440,14 +457,12 @@ class TestOllamaStreamingClient:
 
         mock_http = AsyncMock()
         mock_http.post = AsyncMock(return_value=mock_response)
-        mock_http.__aenter__ = AsyncMock(return_value=mock_http)
-        mock_http.__aexit__ = AsyncMock()
+        client._client = mock_http
 
-        with patch("httpx.AsyncClient", return_value=mock_http):
-            result = await client.generate(
-                model="qwen3",
-                prompt="test",
-            )
+        result = await client.generate(
+            model="qwen3",
+            prompt="test",
+        )
 
         assert result == "My thinking process"
 
@@ -460,15 +475,13 @@ class TestOllamaStreamingClient:
 
         mock_http = AsyncMock()
         mock_http.post = AsyncMock(return_value=mock_response)
-        mock_http.__aenter__ = AsyncMock(return_value=mock_http)
-        mock_http.__aexit__ = AsyncMock()
-
-        with patch("httpx.AsyncClient", return_value=mock_http):
-            await client.generate(
-                model="llama2",
-                prompt="test",
-                system_prompt="Custom system prompt",
-            )
+        client._client = mock_http
+
+        await client.generate(
+            model="llama2",
+            prompt="test",
+            system_prompt="Custom system prompt",
+        )
 
         # Verify custom system prompt was used
         call_args = mock_http.post.call_args
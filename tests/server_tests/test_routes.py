@@ -14,7 +14,7 @@ import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
-from server.api.routes import router, init_dependencies
+from server.api.routes import router
 from server.game.session import GameSession, GameSessionManager
 from server.streaming.ollama_client import OllamaStreamingClient
 from server.models.game import GameConfig
@@ -58,7 +58,8 @@ def mock_ollama_client():
 @pytest.fixture
 def initialized_app(app, mock_session_manager, mock_ollama_client):
     """Create an app with initialized dependencies."""
-    init_dependencies(mock_session_manager, mock_ollama_client)
+    app.state.session_manager = mock_session_manager
+    app.state.ollama_client = mock_ollama_client
     return app
 
 
@@ -76,18 +77,12 @@ def initialized_client(initialized_app):
 class TestHealthCheck:
     """Tests for health check endpoint."""
 
-    def test_health_check_not_initialized(self, client):
-        """Test health check when not initialized."""
-        # Reset global state
-        init_dependencies(None, None)
+    @pytest.fixture(autouse=True)
+    def reset_ollama_check_cache(self):
+        """Expire the TTL cache so each test hits its own mock."""
+        import server.api.routes as routes_module
 
-        response = client.get("/health")
-        assert response.status_code == 200
-
-        data = response.json()
-        assert data["status"] == "healthy"
-        assert data["ollama_connected"] is False
-        assert data["active_sessions"] == 0
+        routes_module._last_ollama_check = (0.0, False)
 
     def test_health_check_ollama_connected(
         self, initialized_client, mock_session_manager, mock_ollama_client
@@ -125,14 +120,6 @@ class TestHealthCheck:
 class TestModelsEndpoint:
     """Tests for models listing endpoint."""
 
-    def test_list_models_not_initialized(self, client):
-        """Test listing models when not initialized."""
-        init_dependencies(None, None)
-
-        response = client.get("/models")
-        assert response.status_code == 500
-        assert "not initialized" in response.json()["detail"]
-
     def test_list_models_success(
         self, initialized_client, mock_ollama_client
     ):
@@ -173,19 +160,6 @@ class TestModelsEndpoint:
 class TestSessionCreation:
     """Tests for session creation endpoint."""
 
-    def test_create_session_not_initialized(self, client):
-        """Test creating session when not initialized."""
-        init_dependencies(None, None)
-
-        response = client.post(
-            "/sessions",
-            json={
-                "opponents": [{"name": "Bot", "model": "llama2"}],
-            },
-        )
-        assert response.status_code == 500
-        assert "not initialized" in response.json()["detail"]
-
     def test_create_session_success(
         self, initialized_client, mock_session_manager
     ):
@@ -300,13 +274,6 @@ class TestSessionCreation:
 class TestSessionStatus:
     """Tests for session status endpoint."""
 
-    def test_get_session_not_initialized(self, client):
-        """Test getting session when not initialized."""
-        init_dependencies(None, None)
-
-        response = client.get("/sessions/abc123")
-        assert response.status_code == 500
-
     def test_get_session_success(
         self, initialized_client, mock_session_manager
     ):
@@ -349,13 +316,6 @@ class TestSessionStatus:
 class TestSessionDeletion:
     """Tests for session deletion endpoint."""
 
-    def test_delete_session_not_initialized(self, client):
-        """Test deleting session when not initialized."""
-        init_dependencies(None, None)
-
-        response = client.delete("/sessions/abc123")
-        assert response.status_code == 500
-
     def test_delete_session_success(
         self, initialized_client, mock_session_manager
     ):
@@ -450,7 +410,8 @@ class TestRouteIntegration:
 
     def test_full_session_lifecycle(self, app, real_manager, real_ollama):
         """Test creating and deleting a session."""
-        init_dependencies(real_manager, real_ollama)
+        app.state.session_manager = real_manager
+        app.state.ollama_client = real_ollama
         client = TestClient(app)
 
         # Create session
@@ -213,30 +213,36 @@ class TestGameSession:
     @pytest.mark.asyncio
     async def test_receive_human_action(self, session):
         """Test receiving human action."""
-        # Simulate waiting for action
-        session._action_event.clear()
-
         await session.receive_human_action("fold")
 
-        assert session._pending_action is not None
-        assert session._pending_action.action_type == ActionType.FOLD
-        assert session._action_event.is_set()
+        action = session._action_queue.get_nowait()
+        assert action.action_type == ActionType.FOLD
 
     @pytest.mark.asyncio
     async def test_receive_human_action_with_amount(self, session):
         """Test receiving human action with amount."""
         await session.receive_human_action("raise", amount=400)
 
-        assert session._pending_action is not None
-        assert session._pending_action.action_type == ActionType.RAISE
-        assert session._pending_action.amount == 400
+        action = session._action_queue.get_nowait()
+        assert action.action_type == ActionType.RAISE
+        assert action.amount == 400
 
     @pytest.mark.asyncio
     async def test_receive_human_action_invalid_type(self, session):
         """Test receiving invalid action type."""
         await session.receive_human_action("invalid_action")
 
-        assert session._pending_action is None
+        assert session._action_queue.empty()
+
+    @pytest.mark.asyncio
+    async def test_receive_human_action_duplicate_ignored(self, session):
+        """Test that a second action for the same turn is dropped."""
+        await session.receive_human_action("call")
+        await session.receive_human_action("fold")
+
+        action = session._action_queue.get_nowait()
+        assert action.action_type == ActionType.CALL
+        assert session._action_queue.empty()
 
     @pytest.mark.asyncio
     async def test_broadcast(self, session, mock_websocket):
@@ -36,16 +36,12 @@ class TestTurnTimer:
         class Tracker:
             def __init__(self):
                 self.timeout_called = False
-                self.tick_values: list[int] = []
                 self.timeout_time: float = None
 
             async def on_timeout(self):
                 self.timeout_called = True
                 self.timeout_time = time.time()
 
-            async def on_tick(self, remaining: int):
-                self.tick_values.append(remaining)
-
         return Tracker()
 
     @pytest.mark.asyncio
@@ -94,28 +90,6 @@ class TestTurnTimer:
         assert elapsed >= 0.2
         assert elapsed < 0.4  # Some buffer for timing
 
-    @pytest.mark.asyncio
-    async def test_timer_tick_callback(self, callback_tracker):
-        """Test tick callbacks."""
-        timer = TurnTimer(timeout_seconds=3)
-
-        await timer.start(
-            on_timeout=callback_tracker.on_timeout,
-            on_tick=callback_tracker.on_tick,
-        )
-
-        # Wait for a couple of ticks
-        await asyncio.sleep(2.5)
-        await timer.cancel()
-
-        # Should have received some tick values
-        assert len(callback_tracker.tick_values) >= 2
-        # First tick should show roughly 3 seconds
-        assert callback_tracker.tick_values[0] in [2, 3]
-        # Values should be decreasing
-        for i in range(1, len(callback_tracker.tick_values)):
-            assert callback_tracker.tick_values[i] <= callback_tracker.tick_values[i - 1]
-
     @pytest.mark.asyncio
     async def test_timer_get_remaining(self, timer, callback_tracker):
         """Test get_remaining during timer run."""
@@ -172,17 +146,6 @@ class TestTurnTimer:
 
         assert callback_tracker.timeout_called is True
 
-    @pytest.mark.asyncio
-    async def test_timer_no_tick_callback(self, timer, callback_tracker):
-        """Test timer works without tick callback."""
-        # Start without on_tick
-        await timer.start(on_timeout=callback_tracker.on_timeout)
-        await asyncio.sleep(0.1)
-        await timer.cancel()
-
-        # Should work without errors
-        assert timer.is_running is False
-
     @pytest.mark.asyncio
     async def test_timer_is_running_property(self, timer, callback_tracker):
         """Test is_running property."""
@@ -246,54 +209,6 @@ class TestTurnTimerEdgeCases:
         await timer.cancel()
         assert tracker["called"] is False
 
-    @pytest.mark.asyncio
-    async def test_timer_tick_stops_on_cancel(self):
-        """Test that tick loop stops when timer is cancelled."""
-        tick_values = []
-
-        async def on_tick(remaining: int):
-            tick_values.append(remaining)
-
-        async def on_timeout():
-            pass
-
-        timer = TurnTimer(timeout_seconds=10)
-        await timer.start(on_timeout=on_timeout, on_tick=on_tick)
-
-        # Get a couple ticks
-        await asyncio.sleep(2.5)
-        tick_count_at_cancel = len(tick_values)
-
-        await timer.cancel()
-
-        # Wait more and verify no more ticks
-        await asyncio.sleep(1)
-        assert len(tick_values) == tick_count_at_cancel
-
-    @pytest.mark.asyncio
-    async def test_timer_tick_stops_at_zero(self):
-        """Test that tick loop stops when remaining reaches zero."""
-        tick_values = []
-
-        async def on_tick(remaining: int):
-            tick_values.append(remaining)
-
-        called = {"value": False}
-
-        async def on_timeout():
-            called["value"] = True
-
-        timer = TurnTimer(timeout_seconds=2)
-        await timer.start(on_timeout=on_timeout, on_tick=on_tick)
-
-        # Wait for completion
-        await asyncio.sleep(3)
-
-        # Should have stopped ticking at 0
-        assert 0 in tick_values
-        # Timeout should have been called
-        assert called["value"] is True
-
     @pytest.mark.asyncio
     async def test_concurrent_timer_instances(self):
         """Test multiple timer instances running concurrently."""
@@ -323,30 +238,21 @@ class TestTurnTimerTaskManagement:
     """Tests for timer task management."""
 
     @pytest.mark.asyncio
-    async def test_timer_tasks_are_cancelled(self):
-        """Test that internal tasks are properly cancelled."""
+    async def test_timer_task_is_cancelled(self):
+        """Test that the internal timeout task is properly cancelled."""
 
         async def on_timeout():
             pass
 
-        async def on_tick(remaining: int):
-            pass
-
         timer = TurnTimer(timeout_seconds=10)
-        await timer.start(on_timeout=on_timeout, on_tick=on_tick)
-
-        # Get references to tasks
-        timeout_task = timer._timeout_task
-        tick_task = timer._tick_task
+        await timer.start(on_timeout=on_timeout)
 
-        assert timeout_task is not None
-        assert tick_task is not None
+        assert timer._timeout_task is not None
 
         await timer.cancel()
 
-        # Tasks should be None after cancel
+        # Task should be None after cancel
         assert timer._timeout_task is None
-        assert timer._tick_task is None
 
     @pytest.mark.asyncio
     async def test_timer_handles_cancelled_error(self):
@@ -100,12 +100,12 @@ class TestTokenBatcher:
         await batcher.add_token("A")
         assert len(broadcast_tracker.calls) == 0
 
-        # Wait for delay to trigger
+        # The timer flushes the partial buffer on its own, without
+        # waiting for another token to arrive
         await asyncio.sleep(0.06)  # 60ms
 
-        await batcher.add_token("B")
         assert len(broadcast_tracker.calls) == 1
-        assert broadcast_tracker.calls[0] == "AB"
+        assert broadcast_tracker.calls[0] == "A"
 
     @pytest.mark.asyncio
     async def test_multiple_flushes(self, broadcast_tracker):
@@ -312,6 +312,7 @@ class TestTokenBatcherEdgeCases:
             broadcast_fn=broadcast_tracker.broadcast,
             batch_size=1,
             max_delay_ms=1000.0,
+            target_frame_ms=0.0,  # Keep the batch size fixed at 1
         )
 
         await batcher.add_token("A")
@@ -331,7 +332,8 @@ class TestTokenBatcherEdgeCases:
         )
 
         await batcher.add_token("A")
-        # Should flush immediately due to zero delay
+        # The zero-delay timer fires on the next event loop pass
+        await asyncio.sleep(0.01)
         assert len(broadcast_tracker.calls) == 1
 
     @pytest.mark.asyncio
@@ -367,6 +369,87 @@ class TestTokenBatcherEdgeCases:
         assert broadcast_tracker.calls[0] == "<action>fold</action>"
 
 
+class TestTokenBatcherAdaptiveBatching:
+    """Tests for rate-adaptive batch sizing."""
+
+    @pytest.fixture
+    def broadcast_tracker(self):
+        """Track broadcast calls."""
+
+        class Tracker:
+            def __init__(self):
+                self.calls: list[str] = []
+
+            async def broadcast(self, tokens: str) -> None:
+                self.calls.append(tokens)
+
+        return Tracker()
+
+    @pytest.mark.asyncio
+    async def test_fast_stream_grows_batch_size(self, broadcast_tracker):
+        """Test that back-to-back flushes grow the batch size."""
+        batcher = TokenBatcher(
+            broadcast_fn=broadcast_tracker.broadcast,
+            batch_size=2,
+            max_delay_ms=1000.0,
+            target_frame_ms=20.0,
+        )
+
+        # Flushes microseconds apart imply a very high char rate
+        for _ in range(5):
+            await batcher.add_token("ab")
+
+        assert batcher.batch_size > 2
+
+    @pytest.mark.asyncio
+    async def test_batch_size_clamped_to_max(self, broadcast_tracker):
+        """Test that the adaptive batch size never exceeds the cap."""
+        batcher = TokenBatcher(
+            broadcast_fn=broadcast_tracker.broadcast,
+            batch_size=2,
+            max_delay_ms=1000.0,
+            target_frame_ms=20.0,
+            max_batch_size=16,
+        )
+
+        for _ in range(20):
+            await batcher.add_token("abcdefgh")
+
+        assert batcher.batch_size <= 16
+
+    @pytest.mark.asyncio
+    async def test_batch_size_never_below_initial(self, broadcast_tracker):
+        """Test that a slow stream cannot shrink below the initial size."""
+        batcher = TokenBatcher(
+            broadcast_fn=broadcast_tracker.broadcast,
+            batch_size=4,
+            max_delay_ms=1000.0,
+            target_frame_ms=20.0,
+        )
+
+        await batcher.add_token("abcd")
+        await asyncio.sleep(0.05)  # Low observed rate
+        await batcher.add_token("abcd")
+
+        assert batcher.batch_size >= 4
+
+    @pytest.mark.asyncio
+    async def test_zero_target_disables_adaptation(self, broadcast_tracker):
+        """Test that target_frame_ms=0 keeps the batch size fixed."""
+        batcher = TokenBatcher(
+            broadcast_fn=broadcast_tracker.broadcast,
+            batch_size=2,
+            max_delay_ms=1000.0,
+            target_frame_ms=0.0,
+        )
+
+        for _ in range(10):
+            await batcher.add_token("ab")
+
+        assert batcher.batch_size == 2
+        assert len(broadcast_tracker.calls) == 10
+
+
 class TestTokenBatcherBroadcastFailure:
     """Tests for broadcast failure handling."""
 
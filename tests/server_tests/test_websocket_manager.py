@@ -221,7 +221,7 @@ class TestWebSocketManager:
 
         await manager.connect(ws1)
         # Manually add the failing one
-        manager.active_connections.append(ws2)
+        manager.active_connections.add(ws2)
 
         # Should not raise
         await manager.close_all()
@@ -91,6 +91,9 @@ interface GameStore {
   reset: () => void;
 }
 
+// Handle for the local turn-timer countdown (driven by TimerStartEvent)
+let countdownInterval: ReturnType<typeof setInterval> | null = null;
+
 const initialState = {
   sessionId: null,
   isConnected: false,
@@ -268,7 +271,19 @@ export const useGameStore = create<GameStore>((set) => ({
 
   clearReasoningHistory: () => set({ reasoningHistory: {} }),
 
-  startTimer: (playerId, totalSeconds) =>
+  startTimer: (playerId, totalSeconds) => {
+    // The server only sends a single start event; count down locally.
+    if (countdownInterval) clearInterval(countdownInterval);
+    const deadline = Date.now() + totalSeconds * 1000;
+    countdownInterval = setInterval(() => {
+      const remaining = Math.max(0, Math.ceil((deadline - Date.now()) / 1000));
+      useGameStore.getState().updateTimer(remaining);
+      if (remaining <= 0 && countdownInterval) {
+        clearInterval(countdownInterval);
+        countdownInterval = null;
+      }
+    }, 1000);
+
     set({
       timer: {
         playerId,
@@ -276,7 +291,8 @@ export const useGameStore = create<GameStore>((set) => ({
         remainingSeconds: totalSeconds,
         isExpired: false,
       },
-    }),
+    });
+  },
 
   updateTimer: (remainingSeconds) =>
     set((state) => {
@@ -291,6 +307,10 @@ export const useGameStore = create<GameStore>((set) => ({
 
   expireTimer: () =>
     set((state) => {
+      if (countdownInterval) {
+        clearInterval(countdownInterval);
+        countdownInterval = null;
+      }
       if (!state.timer) return state;
       return {
         timer: {
@@ -302,7 +322,13 @@ export const useGameStore = create<GameStore>((set) => ({
       };
     }),
 
-  clearTimer: () => set({ timer: null }),
+  clearTimer: () => {
+    if (countdownInterval) {
+      clearInterval(countdownInterval);
+      countdownInterval = null;
+    }
+    set({ timer: null });
+  },
 
   setHandComplete: (winners, amounts, revealedCards) =>
     set({
@@ -322,5 +348,11 @@ export const useGameStore = create<GameStore>((set) => ({
       handComplete: null,
     }),
 
-  reset: () => set(initialState),
+  reset: () => {
+    if (countdownInterval) {
+      clearInterval(countdownInterval);
+      countdownInterval = null;
+    }
+    set(initialState);
+  },
 }));